@@ -0,0 +1,34 @@
+import os
+import tempfile
+
+
+def write_atomic(path, text):
+    """
+    Dosyayı güvenli şekilde (geçici dosya + rename) yaz
+
+    Geçici dosya hedefle aynı klasörde benzersiz adla oluşturulur; aynı
+    dosyaya farklı thread'lerden yapılan yazmalar birbirinin geçici
+    dosyasını ezmez. Okuyan taraf her zaman tam bir dosya görür.
+
+    Args:
+        path (str): Hedef dosya
+        text (str): Yazılacak metin (UTF-8)
+    """
+    folder = os.path.dirname(path) or '.'
+    os.makedirs(folder, exist_ok=True)
+
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=folder, delete=False,
+                                     prefix=os.path.basename(path) + '.', suffix='.tmp') as f:
+        tmp_path = f.name
+        try:
+            f.write(text)
+        except BaseException:
+            f.close()
+            os.remove(tmp_path)
+            raise
+
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -0,0 +1,156 @@
+import hashlib
+import os
+import shutil
+import threading
+
+
+class AudioStore:
+    def __init__(self, root):
+        """
+        İçerik adresli ortak ses deposu
+
+        Her ses dosyası depoda bir kez tutulur (anahtar: YouTube video ID'si,
+        yoksa dosya özeti). Playlist klasörlerine hardlink, desteklenmiyorsa
+        symlink konur; böylece aynı ses birden fazla playlist'te yer kaplamaz.
+
+        Args:
+            root (str): Depo klasörü (hardlink için indirme klasörüyle aynı diskte olmalı)
+        """
+        self.root = root
+        # add/link ile collect_garbage sırayla çalışır: taşıma ile bağlantı
+        # arasında bağlantısız kalan blob silinmez
+        self.lock = threading.RLock()
+        os.makedirs(root, exist_ok=True)
+
+    def key_for(self, file_path=None, video_id=None):
+        """Blob anahtarı: video ID'si varsa o, yoksa SHA-256 özeti"""
+        if video_id:
+            return 'yt-' + ''.join(ch for ch in video_id if ch.isalnum() or ch in '-_')
+
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return 'sha256-' + digest.hexdigest()
+
+    def blob_path(self, key, ext):
+        """Anahtarın depodaki yolu (iki seviyeli alt klasör)"""
+        name = key.split('-', 1)[-1]
+        return os.path.join(self.root, name[:2].lower(), key + ext)
+
+    def find(self, video_id):
+        """
+        Video daha önce depoya eklendiyse blob yolunu döndür
+
+        Uzantıdan bağımsızdır: son çare indirmeden gelen .webm/.m4a
+        blob'ları da bulunur.
+        """
+        if not video_id:
+            return None
+        key = self.key_for(video_id=video_id)
+        folder = os.path.dirname(self.blob_path(key, ''))
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return None
+        for name in sorted(names):
+            if os.path.splitext(name)[0] == key and not name.endswith('.tmp'):
+                return os.path.join(folder, name)
+        return None
+
+    def add(self, file_path, video_id=None):
+        """
+        Dosyayı depoya taşı ve yerine bağlantı koy
+
+        Aynı anahtarla blob zaten varsa yeni dosya silinir ve mevcut blob
+        kullanılır.
+
+        Returns:
+            str: Blob yolu
+        """
+        ext = os.path.splitext(file_path)[1]
+        blob = self.blob_path(self.key_for(file_path, video_id), ext)
+
+        with self.lock:
+            if os.path.realpath(file_path) == os.path.realpath(blob):
+                return blob
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            if os.path.exists(blob):
+                os.remove(file_path)
+            else:
+                # Aynı diskte taşıma atomiktir; farklı diskte kopyalanır
+                shutil.move(file_path, blob)
+            self.link(blob, file_path)
+        return blob
+
+    def link(self, blob, target_path):
+        """
+        Blob'u hedef yola bağla: önce hardlink, olmazsa symlink, en son kopya
+
+        Returns:
+            str: 'hardlink', 'symlink' veya 'copy'
+        """
+        os.makedirs(os.path.dirname(target_path) or '.', exist_ok=True)
+        with self.lock:
+            if os.path.lexists(target_path):
+                os.remove(target_path)
+
+            try:
+                os.link(blob, target_path)
+                return 'hardlink'
+            except OSError:
+                pass
+            try:
+                os.symlink(os.path.abspath(blob), target_path)
+                return 'symlink'
+            except OSError:
+                shutil.copy2(blob, target_path)
+                return 'copy'
+
+    def blobs(self):
+        """Depodaki tüm blob yolları"""
+        for folder, _, files in os.walk(self.root):
+            for name in files:
+                if not name.endswith('.tmp'):
+                    yield os.path.join(folder, name)
+
+    def collect_garbage(self, library_root, dry_run=False):
+        """
+        Hiçbir playlist klasöründen bağlanmayan blob'ları sil
+
+        Hardlink'ler bağlantı sayısından (st_nlink), symlink'ler ise
+        library_root altındaki bağlantıların hedeflerinden bulunur.
+
+        Args:
+            library_root (str): Playlist klasörlerinin bulunduğu klasör
+            dry_run (bool): True ise sadece raporla
+
+        Returns:
+            dict: {'blobs', 'removed', 'freed_bytes'}
+        """
+        with self.lock:
+            store_root = os.path.realpath(self.root)
+            symlink_targets = set()
+            for folder, dirs, files in os.walk(library_root):
+                if os.path.realpath(folder).startswith(store_root):
+                    dirs[:] = []
+                    continue
+                for name in files:
+                    path = os.path.join(folder, name)
+                    if os.path.islink(path):
+                        symlink_targets.add(os.path.realpath(path))
+
+            total = 0
+            removed = 0
+            freed = 0
+            for blob in list(self.blobs()):
+                total += 1
+                stat = os.stat(blob)
+                if stat.st_nlink > 1 or os.path.realpath(blob) in symlink_targets:
+                    continue
+                removed += 1
+                freed += stat.st_size
+                if not dry_run:
+                    os.remove(blob)
+
+        return {'blobs': total, 'removed': removed, 'freed_bytes': freed}
@@ -0,0 +1,99 @@
+"""
+Eşleştirme doğruluğu ve puanlama hızı benchmark'ı
+
+benchmarks/data/match_corpus.json içindeki etiketli örnekler üzerinde
+eski "ilk kelime eşleşmesi" yöntemi ile track_matcher'ı karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_matcher.py
+    python benchmarks/bench_matcher.py --verbose --json sonuc.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import track_matcher
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'match_corpus.json')
+
+
+def legacy_best_match(query, entries):
+    """Eski _find_best_match davranışı (karşılaştırma için)"""
+    query_lower = query.lower()
+    for entry in entries:
+        title = entry.get('title', '').lower()
+        if all(word in title for word in query_lower.split()):
+            return entry
+        if any(word in title for word in query_lower.split()):
+            return entry
+    return entries[0] if entries else None
+
+
+def query_for(case):
+    track = case['track']
+    return f"{track['name']} {' '.join(track['artists'])}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Eşleştirme benchmark'ı")
+    parser.add_argument('--corpus', default=CORPUS)
+    parser.add_argument('--rounds', type=int, default=2000, help="Hız ölçümü için tekrar sayısı")
+    parser.add_argument('--verbose', action='store_true', help="Yanlış eşleşmeleri puanlarıyla göster")
+    parser.add_argument('--json', help="Sonuçları JSON olarak yaz")
+    args = parser.parse_args()
+
+    with open(args.corpus, 'r', encoding='utf-8') as f:
+        corpus = json.load(f)
+
+    legacy_correct = 0
+    new_correct = 0
+    for case in corpus:
+        query = query_for(case)
+        entries = case['candidates']
+
+        if legacy_best_match(query, entries)['id'] == case['expected']:
+            legacy_correct += 1
+
+        scores = track_matcher.score_candidates(query, entries, case['track']['duration_ms'])
+        if scores[0]['entry']['id'] == case['expected'] and scores[0]['score'] >= track_matcher.MIN_SCORE:
+            new_correct += 1
+        elif args.verbose:
+            print(f"❌ {query} (beklenen: {case['expected']})")
+            for item in scores:
+                print(f"   {item['score']:+.3f} {item['entry']['id']:>6} | {item['entry']['title']}")
+
+    # Puanlama hızı
+    candidate_count = sum(len(case['candidates']) for case in corpus)
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for case in corpus:
+            track_matcher.score_candidates(query_for(case), case['candidates'], case['track']['duration_ms'])
+    elapsed = time.perf_counter() - start
+
+    results = {
+        'cases': len(corpus),
+        'legacy_accuracy': legacy_correct / len(corpus),
+        'accuracy': new_correct / len(corpus),
+        'candidates_per_second': candidate_count * args.rounds / elapsed,
+        'us_per_track': elapsed / (len(corpus) * args.rounds) * 1e6
+    }
+
+    print(f"🎯 Örnek sayısı       : {results['cases']}")
+    print(f"🐢 Eski yöntem doğruluk: {results['legacy_accuracy']:.1%}")
+    print(f"⚡ Yeni doğruluk       : {results['accuracy']:.1%}")
+    print(f"📊 Puanlama hızı       : {results['candidates_per_second']:,.0f} aday/sn "
+          f"({results['us_per_track']:.1f} µs/şarkı)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+get_playlist_tracks sayfa çekme benchmark'ı
+
+Yerel sahte Spotify sunucusuna karşı sıralı (page_workers=1) ve paralel
+sayfa çekmeyi karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_playlist_paging.py --tracks 5000 --latency 0.08
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_spotify import FakeSpotifyServer
+
+
+def measure(server, page_workers, repeat, rate_limit=False):
+    """Verilen worker sayısı ile ortalama süreyi ölç"""
+    from spotifylisteindir import SpotifyPlaylistDownloader
+    from rate_limit import RateLimiter
+
+    downloader = SpotifyPlaylistDownloader()
+    downloader.sp = server.client()
+    # Varsayılan Spotify sınırı (10 istek/sn) sayfa çekmeyi değil sınırlayıcıyı ölçtürür
+    if not rate_limit:
+        downloader.rate_limiter = RateLimiter({})
+    downloader.page_workers = page_workers
+    # Playlist önbelleği açık kalırsa ilk çalıştırmadan sonra sayfa çekilmez
+    downloader.playlist_cache = None
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tracks = downloader.get_playlist_tracks(server.playlist_url)
+        timings.append(time.perf_counter() - start)
+        assert len(tracks) == server.track_count, len(tracks)
+        assert tracks[-1].id == f"track{server.track_count - 1:06d}"
+
+    return min(timings), sum(timings) / len(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Playlist sayfa çekme benchmark'ı")
+    parser.add_argument('--tracks', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.05, help="İstek başına gecikme (saniye)")
+    parser.add_argument('--workers', type=int, default=8, help="Paralel sayfa worker sayısı")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--rate-limit', action='store_true',
+                        help="config.json'daki hız sınırlarını uygula (varsayılan: kapalı)")
+    args = parser.parse_args()
+
+    # Config ve indirme klasörü geçici dizinde oluşsun
+    os.chdir(tempfile.mkdtemp(prefix="bench_paging_"))
+
+    server = FakeSpotifyServer(track_count=args.tracks, latency=args.latency).start()
+    try:
+        print(f"🎵 {args.tracks} şarkı, istek gecikmesi {args.latency * 1000:.0f} ms")
+        serial_best, serial_avg = measure(server, 1, args.repeat, args.rate_limit)
+        print(f"➡️ Sıralı      : en iyi {serial_best:.3f}s, ortalama {serial_avg:.3f}s")
+        parallel_best, parallel_avg = measure(server, args.workers, args.repeat, args.rate_limit)
+        print(f"⚡ Paralel ({args.workers}) : en iyi {parallel_best:.3f}s, ortalama {parallel_avg:.3f}s")
+        print(f"📊 Hızlanma: {serial_avg / parallel_avg:.1f}x")
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Açılış süresi benchmark'ı
+
+Her ölçüm yeni bir Python süreciyle yapılır (soğuk import): boş yorumlayıcı,
+`spotifylisteindir.py --help`, modül importu ve GUI'de ilk pencerenin
+çizilmesine kadar geçen süre. Pencere ölçümü ekran (DISPLAY) yoksa atlanır.
+
+Kullanım:
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# İlk pencere çizildiğinde yüklü olan ağır modülleri raporlar ve çıkar
+FIRST_WINDOW = """
+import sys
+sys.path.insert(0, {root!r})
+from run_gui import load_config
+config = load_config()
+from spotify_modern_gui import ModernSpotifyGUI
+app = ModernSpotifyGUI(config)
+app.root.update()
+loaded = [name for name in ('spotipy', 'yt_dlp', 'PIL', 'asyncio') if name in sys.modules]
+print('LOADED=' + ','.join(loaded))
+app.root.destroy()
+"""
+
+
+def measure(command, runs):
+    """Komutu runs kez çalıştır, duvar saati sürelerini ve son çıktıyı döndür"""
+    times = []
+    output = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(command, capture_output=True, text=True, encoding='utf-8', errors='replace')
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            return None, (result.stderr or result.stdout).strip().splitlines()[-1:]
+        times.append(elapsed)
+        output = result.stdout
+    return times, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Açılış süresi benchmark'ı")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--config', help="Kullanılacak config.json (varsayılan: boş API bilgileri)")
+    parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    config_path = os.path.abspath(args.config) if args.config else None
+    output_path = os.path.abspath(args.output) if args.output else None
+
+    # config.json ve önbellekler geçici klasörde oluşur
+    os.chdir(tempfile.mkdtemp(prefix="bench_startup_"))
+    if config_path:
+        shutil.copy(config_path, 'config.json')
+
+    env_python = sys.executable
+    cases = [
+        ("Boş yorumlayıcı", [env_python, '-c', 'pass']),
+        ("spotifylisteindir.py --help", [env_python, os.path.join(ROOT, 'spotifylisteindir.py'), '--help']),
+        ("import spotifylisteindir", [env_python, '-c', f"import sys; sys.path.insert(0, {ROOT!r}); "
+                                                         "import spotifylisteindir"]),
+        ("GUI ilk pencere", [env_python, '-c', FIRST_WINDOW.format(root=ROOT)])
+    ]
+
+    results = {}
+    print(f"🚀 Açılış süreleri ({args.runs} çalıştırma, medyan / en iyi)")
+    for name, command in cases:
+        times, output = measure(command, args.runs)
+        if times is None:
+            print(f"   {name:<30} atlandı: {' '.join(output)}")
+            continue
+        median = statistics.median(times)
+        results[name] = {'median': round(median, 4), 'min': round(min(times), 4), 'runs': times}
+        line = f"   {name:<30} {median * 1000:8.1f} ms / {min(times) * 1000:8.1f} ms"
+        loaded = [part for part in output.splitlines() if part.startswith('LOADED=')]
+        if loaded:
+            modules = loaded[-1].split('=', 1)[1] or 'yok'
+            results[name]['heavy_modules'] = modules
+            line += f"  (pencerede yüklü ağır modüller: {modules})"
+        print(line)
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
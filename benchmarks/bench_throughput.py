@@ -0,0 +1,194 @@
+"""
+Uçtan uca çevrimdışı verim (throughput) benchmark'ı
+
+SpotifyPlaylistDownloader.download_playlist'i yerel sahte Spotify API'si ve
+sahte yt-dlp ile çalıştırır. Her playlist boyutu ayrı bir süreçte ölçülür,
+böylece en yüksek bellek (RSS) değerleri birbirini etkilemez.
+
+Kullanım:
+    python benchmarks/bench_throughput.py
+    python benchmarks/bench_throughput.py --sizes 100 1000 --failure-rate 0.05 --output sonuc.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+
+def percentile(values, percent):
+    """Sıralı listede yüzdelik değer"""
+    if not values:
+        return None
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, int(round(percent / 100 * len(values))) - 1))
+    return values[index]
+
+
+def peak_rss_mb():
+    """Sürecin en yüksek RSS değeri (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS bayt döndürür
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def run_one(args):
+    """Tek bir playlist boyutunu bu süreçte ölç"""
+    import fake_ytdlp
+    fake_ytdlp.install(
+        search_latency=args.search_latency,
+        probe_latency=args.probe_latency,
+        download_latency=args.download_latency,
+        failure_rate=args.failure_rate,
+        payload_size=args.payload_kb * 1024,
+        bandwidth=args.bandwidth_mb * 1024 * 1024
+    )
+
+    from fake_spotify import FakeSpotifyServer
+
+    os.chdir(tempfile.mkdtemp(prefix="bench_throughput_"))
+    server = FakeSpotifyServer(
+        track_count=args.run_one,
+        latency=args.spotify_latency,
+        failure_rate=args.spotify_failure_rate,
+        track_padding=args.spotify_padding
+    ).start()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        from spotifylisteindir import SpotifyPlaylistDownloader
+        from rate_limit import RateLimiter
+        downloader = SpotifyPlaylistDownloader()
+    downloader.sp = server.client()
+    downloader.search_workers = args.search_workers
+    # Varsayılan sınırlar (YouTube arama 5 istek/sn) verimi ~300 şarkı/dk'da keser
+    if not args.rate_limit:
+        downloader.rate_limiter = RateLimiter({})
+
+    # Şarkı başına süre: aramaya girişten sonuca kadar
+    started = {}
+    latencies = []
+    latency_lock = threading.Lock()
+    original_resolve = downloader.resolve_track
+    original_fetch = downloader.fetch_track
+
+    def finish(track):
+        with latency_lock:
+            start = started.pop(track.id, None)
+            if start is not None:
+                latencies.append(time.perf_counter() - start)
+
+    def resolve_track(track):
+        with latency_lock:
+            started[track.id] = time.perf_counter()
+        result = original_resolve(track)
+        if not result:
+            finish(track)
+        return result
+
+    def fetch_track(track, *rest, **kwargs):
+        try:
+            return original_fetch(track, *rest, **kwargs)
+        finally:
+            finish(track)
+
+    downloader.resolve_track = resolve_track
+    downloader.fetch_track = fetch_track
+
+    # Thread sayısını örnekle
+    peak_threads = [threading.active_count()]
+    sampling = threading.Event()
+
+    def sample_threads():
+        while not sampling.wait(0.05):
+            peak_threads[0] = max(peak_threads[0], threading.active_count())
+
+    sampler = threading.Thread(target=sample_threads, daemon=True)
+    sampler.start()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        downloader.download_playlist(server.playlist_url, max_workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    sampling.set()
+    sampler.join()
+    server.stop()
+
+    return {
+        'tracks': args.run_one,
+        'completed': len(latencies),
+        'elapsed_s': round(elapsed, 3),
+        'tracks_per_min': round(len(latencies) / elapsed * 60, 1) if elapsed else None,
+        'latency_p50_s': round(percentile(latencies, 50) or 0, 4),
+        'latency_p95_s': round(percentile(latencies, 95) or 0, 4),
+        'latency_p99_s': round(percentile(latencies, 99) or 0, 4),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'peak_threads': peak_threads[0],
+        'spotify_requests': server.request_count
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uçtan uca verim benchmark'ı")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+                        help="Ölçülecek playlist boyutları")
+    parser.add_argument('--workers', type=int, default=4, help="İndirme worker sayısı")
+    parser.add_argument('--search-workers', type=int, default=4, help="Arama worker sayısı")
+    parser.add_argument('--spotify-latency', type=float, default=0.02)
+    parser.add_argument('--spotify-failure-rate', type=float, default=0.0)
+    parser.add_argument('--spotify-padding', type=int, default=0, help="Şarkı başına fazladan bayt")
+    parser.add_argument('--search-latency', type=float, default=0.005)
+    parser.add_argument('--probe-latency', type=float, default=0.002)
+    parser.add_argument('--download-latency', type=float, default=0.002)
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="yt-dlp hata olasılığı")
+    parser.add_argument('--payload-kb', type=int, default=128, help="Şarkı başına dosya boyutu (KB)")
+    parser.add_argument('--bandwidth-mb', type=float, default=100.0, help="İndirme başına bant genişliği (MB/s)")
+    parser.add_argument('--output', default='bench_throughput.json', help="JSON sonuç dosyası")
+    parser.add_argument('--rate-limit', action='store_true',
+                        help="config.json'daki hız sınırlarını uygula (varsayılan: kapalı)")
+    parser.add_argument('--run-one', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(args)))
+        return
+
+    # Her boyut ayrı süreçte (RSS ölçümü için)
+    passthrough = sys.argv[1:]
+    results = []
+    for size in args.sizes:
+        print(f"⏱️ {size} şarkı ölçülüyor...")
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), *passthrough, '--run-one', str(size)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        results.append(result)
+        print(f"   {result['tracks_per_min']:>10} şarkı/dk | p50 {result['latency_p50_s']:.3f}s "
+              f"p95 {result['latency_p95_s']:.3f}s p99 {result['latency_p99_s']:.3f}s | "
+              f"RSS {result['peak_rss_mb']} MB | {result['peak_threads']} thread")
+
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {key: value for key, value in vars(args).items() if key not in ('run_one', 'output', 'sizes')},
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"📁 Sonuçlar yazıldı: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Şarkı kaydı bellek benchmark'ı
+
+Aynı Spotify sayfalarını eski dict biçimine ve Track (__slots__, intern
+edilmiş sanatçı/albüm adları) nesnelerine dönüştürüp en yüksek RSS
+değerini karşılaştırır. Her biçim ayrı bir süreçte ölçülür.
+
+Kullanım:
+    python benchmarks/bench_track_memory.py --tracks 50000
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+
+def peak_rss_mb():
+    """Sürecin en yüksek RSS değeri (MB)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS bayt döndürür
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def parse_dict(items):
+    """Eski biçim: şarkı başına dict"""
+    tracks = []
+    for item in items:
+        track = item['track']
+        if track:
+            tracks.append({
+                'name': track['name'],
+                'artists': [artist['name'] for artist in track['artists']],
+                'album': track['album']['name'],
+                'duration_ms': track['duration_ms'],
+                'external_urls': track['external_urls'],
+                'id': track['id']
+            })
+    return tracks
+
+
+def run_one(mode, track_count):
+    """Tek biçimi bu süreçte ölç"""
+    from fake_spotify import FakeSpotifyServer
+    from track import Track
+
+    server = FakeSpotifyServer(track_count=track_count)
+    if mode == 'track':
+        parse = lambda items: [Track.from_spotify(item['track']) for item in items if item['track']]
+    else:
+        parse = parse_dict
+
+    gc.collect()
+    baseline = peak_rss_mb()
+
+    # Sayfa sayfa dönüştür; ham Spotify yanıtı her sayfadan sonra bırakılır
+    # (sayfa JSON'dan çözülür, böylece her şarkının dizgileri ayrı nesnedir)
+    tracks = []
+    for offset in range(0, track_count, 100):
+        page = json.loads(json.dumps({
+            'items': [server.make_track(i) for i in range(offset, min(offset + 100, track_count))]
+        }))
+        tracks.extend(parse(page['items']))
+        del page
+
+    gc.collect()
+    peak = peak_rss_mb()
+    return {
+        'mode': mode,
+        'tracks': len(tracks),
+        'baseline_rss_mb': round(baseline, 1),
+        'peak_rss_mb': round(peak, 1),
+        'tracks_rss_mb': round(peak - baseline, 1),
+        'bytes_per_track': round((peak - baseline) * 1024 * 1024 / len(tracks)) if tracks else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Şarkı kaydı bellek benchmark'ı")
+    parser.add_argument('--tracks', type=int, default=50000)
+    parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--run-one', choices=['dict', 'track'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(args.run_one, args.tracks)))
+        return
+
+    results = []
+    print(f"🧠 {args.tracks} şarkı")
+    for mode in ('dict', 'track'):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--tracks', str(args.tracks), '--run-one', mode],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        results.append(result)
+        label = "dict (eski)" if mode == 'dict' else "Track (__slots__)"
+        print(f"   {label:<18} tepe RSS {result['peak_rss_mb']:7.1f} MB | şarkılar {result['tracks_rss_mb']:6.1f} MB "
+              f"| {result['bytes_per_track']} bayt/şarkı")
+
+    old, new = results
+    if new['tracks_rss_mb']:
+        print(f"📊 Şarkı listesi belleği {old['tracks_rss_mb'] / new['tracks_rss_mb']:.1f}x azaldı")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
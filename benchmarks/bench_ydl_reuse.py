@@ -0,0 +1,115 @@
+"""
+YoutubeDL nesnesi tekrar kullanım benchmark'ı
+
+Her şarkı için yeni YoutubeDL oluşturmak ile thread başına havuzdan
+kullanmak arasındaki şarkı başı ek maliyeti ölçer. Ağ yerine yerel bir
+HTTP sunucusundaki küçük ses dosyaları kullanılır.
+
+Kullanım:
+    python benchmarks/bench_ydl_reuse.py --tracks 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+AUDIO_PAYLOAD = b'\xff\xfb\x90\x00' * 4096
+
+YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'ignoreerrors': True,
+    'retries': 3,
+    'extractor_retries': 3
+}
+
+
+class AudioHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _headers(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'audio/mpeg')
+        self.send_header('Content-Length', str(len(AUDIO_PAYLOAD)))
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._headers()
+
+    def do_GET(self):
+        self._headers()
+        self.wfile.write(AUDIO_PAYLOAD)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # yt-dlp bağlantıyı erken kapatabilir, bu normal
+        pass
+
+
+def run_fresh(urls):
+    """Eski yöntem: her şarkı için yeni YoutubeDL"""
+    import yt_dlp
+
+    for url in urls:
+        with yt_dlp.YoutubeDL(YDL_OPTS) as ydl:
+            ydl.extract_info(url, download=False)
+
+
+def run_pooled(downloader, urls):
+    """Yeni yöntem: thread'e ait havuzdan YoutubeDL"""
+    for url in urls:
+        ydl = downloader._get_ydl('bench', YDL_OPTS)
+        ydl.extract_info(url, download=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YoutubeDL tekrar kullanım benchmark'ı")
+    parser.add_argument('--tracks', type=int, default=200)
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp(prefix="bench_ydl_"))
+
+    from spotifylisteindir import SpotifyPlaylistDownloader
+
+    httpd = QuietHTTPServer(('127.0.0.1', 0), AudioHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    host, port = httpd.server_address
+    urls = [f"http://{host}:{port}/track{i}.mp3" for i in range(args.tracks)]
+
+    try:
+        # Isınma (import ve extractor yüklemesi ölçüme girmesin)
+        run_fresh(urls[:2])
+
+        start = time.perf_counter()
+        run_fresh(urls)
+        fresh = (time.perf_counter() - start) / len(urls)
+
+        downloader = SpotifyPlaylistDownloader()
+        start = time.perf_counter()
+        run_pooled(downloader, urls)
+        pooled = (time.perf_counter() - start) / len(urls)
+        downloader.close_ydl_pool()
+
+        print(f"🎵 {len(urls)} şarkı")
+        print(f"🐢 Her şarkıda yeni YoutubeDL : {fresh * 1000:.2f} ms/şarkı")
+        print(f"⚡ Havuzdan YoutubeDL         : {pooled * 1000:.2f} ms/şarkı")
+        print(f"📊 Şarkı başı kazanç: {(fresh - pooled) * 1000:.2f} ms ({fresh / pooled:.1f}x)")
+    finally:
+        httpd.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Benchmark'lar için yerel sahte Spotify Web API sunucusu
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class FakeSpotifyServer:
+    def __init__(self, track_count=1000, latency=0.05, failure_rate=0.0, playlist_id="fakeplaylist",
+                 track_padding=0, rate_limit=None, retry_after=1):
+        """
+        Sahte Spotify API sunucusu
+
+        Args:
+            track_count (int): Playlist'teki şarkı sayısı
+            latency (float): Her isteğe eklenen gecikme (saniye)
+            failure_rate (float): 500 hatası döndürme olasılığı (0-1)
+            playlist_id (str): Sunulan playlist'in ID'si
+            track_padding (int): Şarkı başına eklenen fazladan bayt (yanıt boyutu için)
+            rate_limit (float): Saniyede kabul edilen istek; aşılırsa 429 döner
+            retry_after (int): 429 yanıtındaki Retry-After değeri (saniye)
+        """
+        self.track_count = track_count
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.playlist_id = playlist_id
+        self.track_padding = track_padding
+        self.snapshot_id = "snapshot-1"
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.request_count = 0
+        self.throttled_count = 0
+        self._window = (0, 0)
+        self.lock = threading.Lock()
+        self.httpd = None
+        self.thread = None
+
+    @property
+    def prefix(self):
+        """spotipy.Spotify.prefix için kullanılacak adres"""
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}/v1/"
+
+    @property
+    def playlist_url(self):
+        return f"https://open.spotify.com/playlist/{self.playlist_id}"
+
+    def make_track(self, index):
+        """Sıradaki şarkı için Spotify formatında kayıt üret"""
+        track = {
+            'track': {
+                'id': f"track{index:06d}",
+                'name': f"Song {index}",
+                'artists': [{'name': f"Artist {index % 97}"}],
+                'album': {'name': f"Album {index % 211}"},
+                'duration_ms': 180000 + (index % 120) * 1000,
+                'external_urls': {'spotify': f"https://open.spotify.com/track/track{index:06d}"}
+            }
+        }
+        if self.track_padding:
+            track['track']['padding'] = 'x' * self.track_padding
+        return track
+
+    def handle(self, path, query):
+        """İsteği işle, (status, body) döndür"""
+        with self.lock:
+            self.request_count += 1
+
+            # Saniyelik pencere ile basit hız sınırı
+            if self.rate_limit:
+                second = int(time.time())
+                window_second, count = self._window
+                count = count + 1 if window_second == second else 1
+                self._window = (second, count)
+                if count > self.rate_limit:
+                    self.throttled_count += 1
+                    return 429, {'error': {'status': 429, 'message': 'API rate limit exceeded'}}
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.failure_rate and random.random() < self.failure_rate:
+            return 500, {'error': {'status': 500, 'message': 'fake failure'}}
+
+        match = re.match(r'^/v1/playlists/([^/]+)/tracks$', path)
+        if match:
+            offset = int(query.get('offset', ['0'])[0])
+            limit = int(query.get('limit', ['100'])[0])
+            end = min(offset + limit, self.track_count)
+            return 200, {
+                'items': [self.make_track(i) for i in range(offset, end)],
+                'total': self.track_count,
+                'offset': offset,
+                'limit': limit,
+                'next': None if end >= self.track_count else 'next'
+            }
+
+        match = re.match(r'^/v1/playlists/([^/]+)$', path)
+        if match:
+            return 200, {
+                'id': match.group(1),
+                'name': 'Fake Playlist',
+                'description': 'Benchmark playlist',
+                'snapshot_id': self.snapshot_id,
+                'owner': {'display_name': 'benchmark'},
+                'tracks': {'total': self.track_count}
+            }
+
+        return 404, {'error': {'status': 404, 'message': 'not found'}}
+
+    def start(self):
+        """Sunucuyu arka planda başlat"""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                status, body = server.handle(parsed.path, parse_qs(parsed.query))
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                if status == 429:
+                    self.send_header('Retry-After', str(server.retry_after))
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Sunucuyu durdur"""
+        if self.httpd:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+
+    def client(self):
+        """Bu sunucuya bağlanan bir spotipy istemcisi döndür"""
+        import spotipy
+
+        from rate_limit import mount_central_retry
+
+        sp = spotipy.Spotify(auth="fake-token", retries=0, status_retries=0)
+        mount_central_retry(sp._session, retries=0)
+        sp.prefix = self.prefix
+        return sp
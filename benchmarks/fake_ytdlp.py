@@ -0,0 +1,184 @@
+"""
+Benchmark'lar için sahte yt-dlp modülü
+
+Arama ve indirme gecikmesi, hata oranı ve dosya boyutu ayarlanabilir.
+install() çağrıldığında sys.modules['yt_dlp'] yerine geçer; bu yüzden
+spotifylisteindir import edilmeden önce çağrılmalıdır.
+"""
+
+import hashlib
+import os
+import random
+import sys
+import threading
+import time
+import types
+
+
+class FakeSettings:
+    def __init__(self, search_latency=0.02, probe_latency=0.01, download_latency=0.01,
+                 failure_rate=0.0, payload_size=256 * 1024, bandwidth=50 * 1024 * 1024,
+                 init_cost=0.0):
+        """
+        Args:
+            search_latency (float): ytsearch başına gecikme (saniye)
+            probe_latency (float): Video bilgisi çekme gecikmesi (saniye)
+            download_latency (float): İndirme başlangıç gecikmesi (saniye)
+            failure_rate (float): Arama/indirme hata olasılığı (0-1)
+            payload_size (int): İndirilen dosya boyutu (bayt)
+            bandwidth (int): İndirme başına bant genişliği (bayt/sn)
+            init_cost (float): YoutubeDL oluşturma maliyeti (saniye)
+        """
+        self.search_latency = search_latency
+        self.probe_latency = probe_latency
+        self.download_latency = download_latency
+        self.failure_rate = failure_rate
+        self.payload_size = payload_size
+        self.bandwidth = bandwidth
+        self.init_cost = init_cost
+        self.instances = 0
+        self.resumed_bytes = 0
+        self.lock = threading.Lock()
+
+
+settings = FakeSettings()
+
+
+class DownloadError(Exception):
+    pass
+
+
+class DownloadCancelled(Exception):
+    pass
+
+
+def _maybe_fail(message):
+    if settings.failure_rate and random.random() < settings.failure_rate:
+        raise DownloadError(message)
+
+
+def _video_id(text):
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:11]
+
+
+class YoutubeDL:
+    def __init__(self, params=None):
+        self.params = dict(params or {})
+        outtmpl = self.params.get('outtmpl', '%(title)s.%(ext)s')
+        if not isinstance(outtmpl, dict):
+            outtmpl = {'default': outtmpl}
+        self.params['outtmpl'] = outtmpl
+        self.format_selector = self.params.get('format')
+        self._progress_hooks = list(self.params.get('progress_hooks') or [])
+
+        if settings.init_cost:
+            time.sleep(settings.init_cost)
+        with settings.lock:
+            settings.instances += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        pass
+
+    def add_progress_hook(self, hook):
+        self._progress_hooks.append(hook)
+
+    def build_format_selector(self, format_spec):
+        return format_spec
+
+    def extract_info(self, url, download=True, process=True):
+        if url.startswith('ytsearch'):
+            time.sleep(settings.search_latency)
+            _maybe_fail('fake search failure')
+            count_text, query = url[len('ytsearch'):].split(':', 1)
+            count = int(count_text or 1)
+            return {
+                '_type': 'playlist',
+                'entries': [
+                    {'id': _video_id(f"{query}{i}"), 'title': query if i == 0 else f"{query} (Live)",
+                     'duration': None, 'channel': 'fake'}
+                    for i in range(count)
+                ]
+            }
+
+        time.sleep(settings.probe_latency)
+        _maybe_fail('fake extraction failure')
+        info = {
+            'id': url.rsplit('=', 1)[-1],
+            'title': url,
+            'webpage_url': url,
+            'formats': [
+                {'format_id': '251', 'ext': 'webm', 'vcodec': 'none', 'acodec': 'opus', 'abr': 130, 'url': url},
+                {'format_id': '140', 'ext': 'm4a', 'vcodec': 'none', 'acodec': 'mp4a', 'abr': 128, 'url': url},
+                {'format_id': '18', 'ext': 'mp4', 'vcodec': 'avc1', 'acodec': 'mp4a', 'height': 360, 'url': url},
+            ]
+        }
+        if download:
+            self.process_ie_result(info, download=True)
+        return info
+
+    def process_ie_result(self, info, download=True, extra_info=None):
+        if download:
+            self._fake_download(self.params['outtmpl']['default'].replace('%(ext)s', 'm4a'))
+        return info
+
+    def download(self, url_list):
+        for url in url_list:
+            self.extract_info(url, download=True)
+        return 0
+
+    def _fake_download(self, filename):
+        """Gecikme + bant genişliği kadar bekleyerek dosya yaz"""
+        time.sleep(settings.download_latency)
+        _maybe_fail('unable to download video data: HTTP Error 403: Forbidden')
+
+        folder = os.path.dirname(filename)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        total = settings.payload_size
+        chunk_size = 64 * 1024
+        written = 0
+        started = time.time()
+
+        # continuedl: yarım kalan .part dosyasına eklemeye devam et
+        part_path = filename + '.part'
+        if self.params.get('continuedl', True) and os.path.exists(part_path):
+            written = min(os.path.getsize(part_path), total)
+            settings.resumed_bytes += written
+        with open(part_path, 'ab' if written else 'wb') as f:
+            while written < total:
+                chunk = min(chunk_size, total - written)
+                f.write(b'\0' * chunk)
+                written += chunk
+                if settings.bandwidth:
+                    time.sleep(chunk / settings.bandwidth)
+                for hook in self._progress_hooks:
+                    hook({'status': 'downloading', 'downloaded_bytes': written, 'total_bytes': total,
+                          'filename': filename, 'elapsed': time.time() - started})
+        os.replace(part_path, filename)
+        for hook in self._progress_hooks:
+            hook({'status': 'finished', 'downloaded_bytes': total, 'total_bytes': total,
+                  'filename': filename, 'elapsed': time.time() - started})
+
+
+def install(**kwargs):
+    """Sahte modülü sys.modules'a yerleştir ve ayarları uygula"""
+    for key, value in kwargs.items():
+        setattr(settings, key, value)
+
+    module = types.ModuleType('yt_dlp')
+    module.YoutubeDL = YoutubeDL
+    module.settings = settings
+    utils = types.ModuleType('yt_dlp.utils')
+    utils.DownloadError = DownloadError
+    utils.DownloadCancelled = DownloadCancelled
+    module.utils = utils
+    sys.modules['yt_dlp'] = module
+    sys.modules['yt_dlp.utils'] = utils
+    return module
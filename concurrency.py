@@ -0,0 +1,169 @@
+import threading
+import time
+
+# Bu ifadeleri içeren hatalar YouTube'un yavaşlatma (throttling) işaretidir
+# Sadece 429 yavaşlatmadır: 403 genelde süresi dolmuş akış adresidir ve
+# download_audio bunu video bilgisini yenileyerek çözer
+THROTTLE_MARKERS = ('http error 429', 'too many requests')
+
+
+class AdaptiveConcurrency:
+    def __init__(self, floor=1, ceiling=10, initial=None, interval=5.0, error_threshold=0.2,
+                 stop_event=None, log=print):
+        """
+        AIMD (toplamsal artış / çarpımsal azalış) paralellik denetleyicisi
+
+        İndirme worker'ları her şarkıdan önce acquire() ile yer alır. Her
+        değerlendirme aralığında gözlenen bayt/sn, hata oranı ve 429
+        yanıtlarına göre aynı anda çalışabilecek worker sayısı değiştirilir.
+
+        Args:
+            floor (int): En az worker sayısı
+            ceiling (int): En fazla worker sayısı
+            initial (int): Başlangıç değeri (varsayılan: floor)
+            interval (float): Değerlendirme aralığı (saniye)
+            error_threshold (float): Bu oranın üstündeki hatalar azaltma sebebidir
+            stop_event (threading.Event): Kurulduğunda bekleyen worker'lar serbest kalır
+            log (callable): Kararların yazılacağı fonksiyon
+        """
+        self.floor = max(1, int(floor))
+        self.ceiling = max(self.floor, int(ceiling))
+        self.limit = min(self.ceiling, max(self.floor, int(initial or self.floor)))
+        self.interval = interval
+        self.error_threshold = error_threshold
+        self.stop_event = stop_event
+        self.log = log
+
+        self.condition = threading.Condition()
+        self.active = 0
+        self.decisions = []
+
+        # Aralık içi sayaçlar
+        self._window_start = time.monotonic()
+        self._bytes = 0
+        self._successes = 0
+        self._errors = 0
+        self._throttled = 0
+        self._saturated = False
+        self._file_bytes = {}
+
+        # Son artışın etkisini ölçmek için
+        self._last_rate = None
+        self._last_action = None
+
+    def acquire(self):
+        """Worker için yer ayır (limit doluysa bekle)"""
+        with self.condition:
+            while self.active >= self.limit:
+                self._saturated = True
+                if self.stop_event is not None and self.stop_event.is_set():
+                    break
+                self.condition.wait(0.5)
+            self.active += 1
+            if self.active >= self.limit:
+                self._saturated = True
+
+    def release(self):
+        """Worker işini bitirdi"""
+        with self.condition:
+            self.active -= 1
+            self.condition.notify()
+        self.maybe_adjust()
+
+    def record_progress(self, d):
+        """yt-dlp ilerleme kancasından gelen bayt sayısını ekle"""
+        filename = d.get('filename')
+        downloaded = d.get('downloaded_bytes') or 0
+        with self.condition:
+            previous = self._file_bytes.get(filename, 0)
+            if downloaded > previous:
+                self._bytes += downloaded - previous
+            if d.get('status') == 'downloading':
+                self._file_bytes[filename] = downloaded
+            else:
+                self._file_bytes.pop(filename, None)
+
+    def record_result(self, success):
+        """Şarkı sonucunu kaydet"""
+        with self.condition:
+            if success:
+                self._successes += 1
+            else:
+                self._errors += 1
+
+    def record_error(self, error):
+        """Hata mesajında yavaşlatma işareti varsa kaydet"""
+        message = str(error).lower()
+        if any(marker in message for marker in THROTTLE_MARKERS):
+            with self.condition:
+                self._throttled += 1
+
+    def maybe_adjust(self):
+        """Değerlendirme aralığı dolduysa limiti güncelle"""
+        now = time.monotonic()
+        with self.condition:
+            elapsed = now - self._window_start
+            if elapsed < self.interval:
+                return
+
+            rate = self._bytes / elapsed
+            finished = self._successes + self._errors
+            error_rate = self._errors / finished if finished else 0.0
+            throttled = self._throttled
+            saturated = self._saturated
+            old_limit = self.limit
+
+            if throttled:
+                # Çarpımsal azalış: YouTube yavaşlatıyor
+                self.limit = max(self.floor, self.limit // 2)
+                reason = f"{throttled} adet 429 yanıtı"
+            elif finished and error_rate > self.error_threshold:
+                self.limit = max(self.floor, self.limit // 2)
+                reason = f"hata oranı %{error_rate * 100:.0f}"
+            elif (self._last_action == 'increase' and self._last_rate
+                  and rate < self._last_rate * 0.95):
+                # Son artış verimi düşürdü: geri al
+                self.limit = max(self.floor, self.limit - 1)
+                reason = f"son artış verimi düşürdü ({self._last_rate / 1024:.0f} -> {rate / 1024:.0f} KB/s)"
+            elif saturated and self.limit < self.ceiling:
+                # Toplamsal artış: tüm yerler dolu ve sorun yok
+                self.limit += 1
+                reason = f"{rate / 1024:.0f} KB/s, hata yok"
+            else:
+                reason = None
+
+            if self.limit > old_limit:
+                action = 'increase'
+            elif self.limit < old_limit:
+                action = 'decrease'
+            else:
+                action = 'hold'
+
+            self._last_action = action
+            self._last_rate = rate
+            self._window_start = now
+            self._bytes = 0
+            self._successes = 0
+            self._errors = 0
+            self._throttled = 0
+            self._saturated = self.active >= self.limit
+            self.condition.notify_all()
+
+            if action != 'hold':
+                self.decisions.append({
+                    'time': time.time(),
+                    'from': old_limit,
+                    'to': self.limit,
+                    'reason': reason,
+                    'bytes_per_second': round(rate),
+                    'error_rate': round(error_rate, 3)
+                })
+
+        if action != 'hold' and self.log:
+            arrow = '📈' if action == 'increase' else '📉'
+            self.log(f"{arrow} Paralel indirme: {old_limit} -> {self.limit} ({reason})")
+
+    def wake(self):
+        """Bekleyen tüm worker'ları uyandır (durdurma için)"""
+        with self.condition:
+            self.condition.notify_all()
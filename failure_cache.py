@@ -0,0 +1,176 @@
+import os
+import sqlite3
+import threading
+import time
+
+# Kayıt nedenleri
+NOT_FOUND = 'not_found'              # YouTube'da eşleşen sonuç yok
+DOWNLOAD_FAILED = 'download_failed'  # Tüm formatlar başarısız (bölge kısıtı vb.)
+
+REASON_LABELS = {
+    NOT_FOUND: "Bulunamadı",
+    DOWNLOAD_FAILED: "İndirilemedi"
+}
+
+
+class FailureCache:
+    def __init__(self, db_path, base_seconds=24 * 3600, max_seconds=90 * 24 * 3600):
+        """
+        Bulunamayan / indirilemeyen şarkılar için kalıcı (SQLite) önbellek
+
+        Kayıttaki şarkı, yeniden deneme zamanı gelene kadar atlanır. Her
+        başarısız denemede bekleme süresi iki katına çıkar (üstel geri
+        çekilme); şarkı sonunda indirilirse kayıt silinir.
+
+        Args:
+            db_path (str): SQLite dosyasının yolu
+            base_seconds (int): İlk başarısızlıktan sonraki bekleme süresi
+            max_seconds (int): Bekleme süresinin üst sınırı
+        """
+        self.db_path = db_path
+        self.base_seconds = base_seconds
+        self.max_seconds = max_seconds
+        self.skips = 0
+        self.lock = threading.Lock()
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        # Aynı bağlantı tüm worker thread'lerinden kilit ile kullanılır
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS failures (
+                track_id TEXT PRIMARY KEY,
+                name TEXT,
+                reason TEXT NOT NULL,
+                detail TEXT,
+                attempts INTEGER NOT NULL,
+                first_failed REAL NOT NULL,
+                last_failed REAL NOT NULL,
+                next_check REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def backoff(self, attempts):
+        """attempts. başarısızlıktan sonraki bekleme süresi (saniye)"""
+        return min(self.base_seconds * 2 ** max(0, attempts - 1), self.max_seconds)
+
+    def should_skip(self, track_id, now=None):
+        """
+        Şarkının yeniden deneme zamanı gelmediyse kaydını döndür
+
+        Returns:
+            dict: Kayıt (atlanmalı) veya None (denenmeli)
+        """
+        if not track_id:
+            return None
+        now = time.time() if now is None else now
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT track_id, name, reason, detail, attempts, first_failed, last_failed, next_check "
+                "FROM failures WHERE track_id = ?",
+                (track_id,)
+            ).fetchone()
+            if row is None or row[7] <= now:
+                return None
+            self.skips += 1
+        return self._entry(row)
+
+    def record(self, track_id, reason, name=None, detail=None):
+        """
+        Başarısız denemeyi kaydet ve sonraki deneme zamanını ertele
+
+        Returns:
+            dict: Güncel kayıt
+        """
+        if not track_id:
+            return None
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT attempts, first_failed FROM failures WHERE track_id = ?", (track_id,)
+            ).fetchone()
+            attempts, first_failed = (row[0] + 1, row[1]) if row else (1, now)
+            next_check = now + self.backoff(attempts)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO failures "
+                "(track_id, name, reason, detail, attempts, first_failed, last_failed, next_check) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (track_id, name, reason, detail, attempts, first_failed, now, next_check)
+            )
+            self.conn.commit()
+
+        return self._entry((track_id, name, reason, detail, attempts, first_failed, now, next_check))
+
+    def remove(self, track_id):
+        """Şarkı indirildiyse kaydını sil"""
+        if not track_id:
+            return
+        with self.lock:
+            # Çoğu şarkının kaydı yoktur: boş silmede commit yapılmaz
+            if self.conn.execute("DELETE FROM failures WHERE track_id = ?", (track_id,)).rowcount:
+                self.conn.commit()
+
+    def clear(self, track_ids=None, reason=None):
+        """
+        Kayıtları sil (sonraki çalıştırmada yeniden denenirler)
+
+        Args:
+            track_ids (list): Sadece bu şarkılar (varsayılan: hepsi)
+            reason (str): Sadece bu nedenle kaydedilenler
+
+        Returns:
+            int: Silinen kayıt sayısı
+        """
+        query = "DELETE FROM failures WHERE 1 = 1"
+        params = []
+        if track_ids:
+            query += f" AND track_id IN ({', '.join('?' * len(track_ids))})"
+            params += list(track_ids)
+        if reason:
+            query += " AND reason = ?"
+            params.append(reason)
+
+        with self.lock:
+            removed = self.conn.execute(query, params).rowcount
+            self.conn.commit()
+        return removed
+
+    def entries(self, limit=None):
+        """Kayıtları sonraki deneme zamanına göre sıralı döndür"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT track_id, name, reason, detail, attempts, first_failed, last_failed, next_check "
+                "FROM failures ORDER BY next_check LIMIT ?",
+                (-1 if limit is None else limit,)
+            ).fetchall()
+        return [self._entry(row) for row in rows]
+
+    def _entry(self, row):
+        track_id, name, reason, detail, attempts, first_failed, last_failed, next_check = row
+        return {
+            'track_id': track_id,
+            'name': name,
+            'reason': reason,
+            'detail': detail,
+            'attempts': attempts,
+            'first_failed': first_failed,
+            'last_failed': last_failed,
+            'next_check': next_check
+        }
+
+    def stats(self):
+        """Atlanan şarkı ve toplam kayıt sayısı"""
+        with self.lock:
+            total = self.conn.execute("SELECT COUNT(*) FROM failures").fetchone()[0]
+            return {'skips': self.skips, 'entries': total}
+
+    def close(self):
+        """Bağlantıyı kapat"""
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from atomic_file import write_atomic
+
+# Histogram üst sınırları (saniye)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# Özet tablosundaki aşama açıklamaları
+STAGE_LABELS = {
+    'spotify': "Spotify API",
+    'search': "Arama",
+    'probe': "Video bilgisi",
+    'download': "İndirme (format denemesi)",
+    'fetch': "İndirme aşaması (şarkı)",
+    'disk': "Disk (taşıma/bağlantı/manifest)"
+}
+
+
+def _histogram_quantile(histogram, q):
+    """Histogram kopyasından yaklaşık yüzdelik (kova üst sınırı)"""
+    if not histogram or not histogram['count']:
+        return None
+    target = q * histogram['count']
+    seen = 0
+    for bound, count in zip(BUCKETS, histogram['buckets']):
+        seen += count
+        if seen >= target:
+            return min(bound, histogram['max'])
+    return histogram['max']
+
+
+class Metrics:
+    def __init__(self, keep_tracks=True):
+        """
+        Aşama süreleri (histogram) ve sayaçlar
+
+        Args:
+            keep_tracks (bool): Şarkı başına aşama sürelerini de sakla
+        """
+        self.keep_tracks = keep_tracks
+        self.lock = threading.Lock()
+        self.server = None
+        self.reset()
+
+    def reset(self):
+        """Tüm ölçümleri sıfırla (yeni çalıştırma)"""
+        with self.lock:
+            self.started = time.time()
+            self.histograms = {}
+            self.counters = {}
+            self.tracks = {}
+
+    def observe(self, stage, seconds, track_id=None):
+        """Bir aşama süresini kaydet"""
+        with self.lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = {'count': 0, 'sum': 0.0, 'max': 0.0, 'buckets': [0] * len(BUCKETS)}
+                self.histograms[stage] = histogram
+            histogram['count'] += 1
+            histogram['sum'] += seconds
+            histogram['max'] = max(histogram['max'], seconds)
+            for i, bound in enumerate(BUCKETS):
+                if seconds <= bound:
+                    histogram['buckets'][i] += 1
+                    break
+
+            if self.keep_tracks and track_id:
+                stages = self.tracks.setdefault(track_id, {})
+                stages[stage] = round(stages.get(stage, 0.0) + seconds, 4)
+
+    @contextmanager
+    def timer(self, stage, track_id=None):
+        """with bloğunun süresini aşamaya ekle"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, track_id)
+
+    def inc(self, name, value=1):
+        """Sayacı artır"""
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def quantile(self, stage, q):
+        """Histogramdan yaklaşık yüzdelik (kova üst sınırı)"""
+        with self.lock:
+            return _histogram_quantile(self.histograms.get(stage), q)
+
+    def snapshot(self):
+        """JSON'a yazılabilir rapor"""
+        # Tek kilitte tutarlı kopya: eşzamanlı reset() yarıda kalan rapor bırakmaz
+        with self.lock:
+            started = self.started
+            histograms = {stage: dict(h, buckets=list(h['buckets'])) for stage, h in self.histograms.items()}
+            counters = dict(self.counters)
+            tracks = {track_id: dict(values) for track_id, values in self.tracks.items()}
+
+        stages = {}
+        for stage, histogram in histograms.items():
+            stages[stage] = {
+                'count': histogram['count'],
+                'sum': round(histogram['sum'], 4),
+                'avg': round(histogram['sum'] / histogram['count'], 4) if histogram['count'] else None,
+                'p50': _histogram_quantile(histogram, 0.5),
+                'p95': _histogram_quantile(histogram, 0.95),
+                'max': round(histogram['max'], 4),
+                'buckets': dict(zip([str(bound) for bound in BUCKETS], histogram['buckets']))
+            }
+
+        return {
+            'started_at': started,
+            'elapsed': round(time.time() - started, 3),
+            'stages': stages,
+            'counters': counters,
+            'tracks': tracks
+        }
+
+    def to_prometheus(self):
+        """Prometheus metin formatı"""
+        with self.lock:
+            histograms = {stage: dict(h, buckets=list(h['buckets'])) for stage, h in self.histograms.items()}
+            counters = dict(self.counters)
+
+        lines = [
+            '# HELP spotify_downloader_stage_seconds Aşama süreleri',
+            '# TYPE spotify_downloader_stage_seconds histogram'
+        ]
+        for stage, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(BUCKETS, histogram['buckets']):
+                cumulative += count
+                lines.append(f'spotify_downloader_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'spotify_downloader_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram["count"]}')
+            lines.append(f'spotify_downloader_stage_seconds_sum{{stage="{stage}"}} {histogram["sum"]:.6f}')
+            lines.append(f'spotify_downloader_stage_seconds_count{{stage="{stage}"}} {histogram["count"]}')
+
+        for name, value in sorted(counters.items()):
+            metric = f'spotify_downloader_{name}_total'
+            lines.append(f'# TYPE {metric} counter')
+            lines.append(f'{metric} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write_json(self, path):
+        """JSON raporunu dosyaya yaz"""
+        write_atomic(path, json.dumps(self.snapshot(), indent=2, ensure_ascii=False))
+
+    def write_prometheus(self, path):
+        """Prometheus metnini dosyaya yaz (node_exporter textfile için)"""
+        write_atomic(path, self.to_prometheus())
+
+    def serve(self, port, host='127.0.0.1'):
+        """/metrics (Prometheus) ve /metrics.json adreslerini yerelde sun"""
+        if self.server:
+            return self.server
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body = metrics.to_prometheus().encode('utf-8')
+                    content_type = 'text/plain; version=0.0.4'
+                elif self.path == '/metrics.json':
+                    body = json.dumps(metrics.snapshot()).encode('utf-8')
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name="metrics-server", daemon=True).start()
+        return self.server
+
+    def print_breakdown(self):
+        """Aşama bazında süre dağılımını yazdır"""
+        report = self.snapshot()
+        if not report['stages']:
+            return
+
+        print("⏱️ Aşama dağılımı:")
+        print(f"   {'Aşama':<32} {'Adet':>6} {'Toplam':>9} {'Ort.':>8} {'p50':>7} {'p95':>7} {'Max':>8}")
+        for stage, data in sorted(report['stages'].items(), key=lambda item: -item[1]['sum']):
+            label = STAGE_LABELS.get(stage, stage)
+            print(f"   {label:<32} {data['count']:>6} {data['sum']:>8.1f}s {data['avg']:>7.3f}s "
+                  f"{data['p50']:>6.2f}s {data['p95']:>6.2f}s {data['max']:>7.2f}s")
+
+        counters = report['counters']
+        if counters:
+            parts = []
+            for name, value in sorted(counters.items()):
+                if name.endswith('bytes'):
+                    parts.append(f"{name}={value / 1024 / 1024:.1f} MB")
+                else:
+                    parts.append(f"{name}={value}")
+            print(f"   Sayaçlar: {', '.join(parts)}")
@@ -0,0 +1,135 @@
+import os
+import json
+import time
+import tempfile
+import threading
+
+from atomic_file import write_atomic
+
+
+class PlaylistCache:
+    def __init__(self, folder):
+        """
+        Playlist meta verisi için snapshot_id tabanlı önbellek
+
+        Args:
+            folder (str): Önbellek dosyalarının tutulacağı klasör
+        """
+        self.folder = folder
+        self.lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+
+    def _path(self, playlist_id):
+        return os.path.join(self.folder, f"{playlist_id}.json")
+
+    def get(self, playlist_id, snapshot_id=None):
+        """
+        Önbellekteki kaydı döndür
+
+        snapshot_id verilirse sadece aynı snapshot'a ait kayıt döner,
+        verilmezse (çevrimdışı mod) son kayıt döner.
+        """
+        try:
+            with self.lock, open(self._path(playlist_id), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if snapshot_id is not None and entry.get('snapshot_id') != snapshot_id:
+            return None
+        return entry
+
+    def put(self, playlist_id, snapshot_id, info, tracks):
+        """Playlist bilgisi ve şarkı listesini kaydet"""
+        entry = {
+            'playlist_id': playlist_id,
+            'snapshot_id': snapshot_id,
+            'info': info,
+            'tracks': tracks,
+            'cached_at': int(time.time())
+        }
+
+        try:
+            with self.lock:
+                write_atomic(self._path(playlist_id), json.dumps(entry, ensure_ascii=False))
+        except Exception as e:
+            print(f"⚠️ Playlist önbelleğe yazılamadı: {e}")
+
+    def writer(self, playlist_id, snapshot_id, info):
+        """
+        Şarkı listesini sayfa sayfa yazan kayıt başlat
+
+        Şarkılar bellekte biriktirilmeden geçici dosyaya eklenir; kayıt
+        ancak commit() ile (liste eksiksizse) yerine konur.
+
+        Returns:
+            PlaylistCacheWriter: Yazılamıyorsa None
+        """
+        try:
+            return PlaylistCacheWriter(self, playlist_id, snapshot_id, info)
+        except Exception as e:
+            print(f"⚠️ Playlist önbelleğe yazılamadı: {e}")
+            return None
+
+
+class PlaylistCacheWriter:
+    def __init__(self, cache, playlist_id, snapshot_id, info):
+        """
+        Tek playlist için artımlı önbellek yazıcısı (PlaylistCache.writer ile oluşturulur)
+
+        Args:
+            cache (PlaylistCache): Kaydın yazılacağı önbellek
+            playlist_id (str): Spotify playlist ID'si
+            snapshot_id (str): Listenin snapshot_id değeri
+            info (dict): Playlist bilgisi
+        """
+        self.cache = cache
+        self.path = cache._path(playlist_id)
+        self.count = 0
+        self.file = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=cache.folder, delete=False,
+                                                prefix=os.path.basename(self.path) + '.', suffix='.tmp')
+        header = {
+            'playlist_id': playlist_id,
+            'snapshot_id': snapshot_id,
+            'info': info,
+            'cached_at': int(time.time())
+        }
+        # Başlık alanları yazılır, 'tracks' dizisi açık bırakılır
+        self.file.write(json.dumps(header, ensure_ascii=False)[:-1] + ', "tracks": [')
+
+    def add(self, tracks):
+        """Sayfanın şarkılarını (dict) dosyaya ekle"""
+        if self.file is None:
+            return
+        try:
+            for track in tracks:
+                self.file.write((', ' if self.count else '') + json.dumps(track, ensure_ascii=False))
+                self.count += 1
+        except Exception as e:
+            print(f"⚠️ Playlist önbelleğe yazılamadı: {e}")
+            self.discard()
+
+    def commit(self):
+        """Diziyi kapat ve kaydı yerine koy"""
+        if self.file is None:
+            return
+        try:
+            self.file.write(']}')
+            self.file.close()
+            with self.cache.lock:
+                os.replace(self.file.name, self.path)
+            self.file = None
+        except Exception as e:
+            print(f"⚠️ Playlist önbelleğe yazılamadı: {e}")
+            self.discard()
+
+    def discard(self):
+        """Yarım kalan kaydı sil (eski kayıt korunur)"""
+        if self.file is None:
+            return
+        file, self.file = self.file, None
+        try:
+            file.close()
+            os.remove(file.name)
+        except OSError:
+            pass
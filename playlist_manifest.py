@@ -0,0 +1,229 @@
+import os
+import json
+import time
+import threading
+
+from atomic_file import write_atomic
+
+
+class PlaylistManifest:
+    FILENAME = '.manifest.json'
+
+    def __init__(self, folder, save_every=10):
+        """
+        Playlist klasöründeki indirme kayıtları
+
+        Args:
+            folder (str): Playlist klasörü
+            save_every (int): Kaç yeni kayıtta bir dosyaya yazılacağı
+        """
+        self.folder = folder
+        self.path = os.path.join(folder, self.FILENAME)
+        self.save_every = save_every
+        self.entries = {}
+        self.lock = threading.Lock()
+        # Worker thread'lerinden gelen kayıtlar sırayla yazılır (eski görüntü yenisini ezmez)
+        self.save_lock = threading.Lock()
+        self._unsaved = 0
+        self.load()
+
+    def load(self):
+        """Manifest dosyasını oku"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('tracks', {})
+        except Exception as e:
+            print(f"⚠️ Manifest okunamadı, baştan oluşturulacak: {e}")
+            self.entries = {}
+
+    def save(self):
+        """Manifest dosyasını güvenli şekilde (geçici dosya + rename) yaz"""
+        with self.save_lock:
+            with self.lock:
+                data = {'version': 1, 'tracks': dict(self.entries)}
+                self._unsaved = 0
+
+            try:
+                write_atomic(self.path, json.dumps(data, indent=2, ensure_ascii=False))
+            except Exception as e:
+                print(f"❌ Manifest kaydetme hatası: {e}")
+
+    def is_complete(self, track_id):
+        """Şarkı daha önce indirilmiş ve dosyası yerinde mi?"""
+        with self.lock:
+            entry = self.entries.get(track_id)
+        if not entry:
+            return False
+
+        file_path = os.path.join(self.folder, entry['file'])
+        try:
+            return os.path.getsize(file_path) == entry.get('size')
+        except OSError:
+            return False
+
+    def file_path(self, track_id):
+        """Tamamlanmış şarkının dosya yolu (yoksa None)"""
+        if not track_id or not self.is_complete(track_id):
+            return None
+        with self.lock:
+            return os.path.join(self.folder, self.entries[track_id]['file'])
+
+    def pending(self, tracks):
+        """Yeni veya eksik olan şarkıları döndür"""
+        return [track for track in tracks if not track.id or not self.is_complete(track.id)]
+
+    def record(self, track_id, file_path, video_id=None):
+        """İndirilen şarkıyı kaydet"""
+        if not track_id:
+            return
+
+        entry = {
+            'file': os.path.relpath(file_path, self.folder),
+            'size': os.path.getsize(file_path),
+            'video_id': video_id,
+            'downloaded_at': int(time.time())
+        }
+
+        with self.lock:
+            self.entries[track_id] = entry
+            self._unsaved += 1
+            should_save = self._unsaved >= self.save_every
+
+        if should_save:
+            self.save()
+
+
+class RunJournal:
+    FILENAME = '.journal.json'
+
+    def __init__(self, folder, save_every=10, save_interval=5.0):
+        """
+        Yarıda kalan çalıştırmaların günlüğü
+
+        Aranıp bulunan (resolved) ve indirilmekte olan (downloading) şarkılar
+        tutulur; indirme tamamlanınca kayıt manifest'e devredilip silinir,
+        başarısız olursa sadece silinir. Süreç yarıda kesilirse (iptal,
+        çökme) sonraki çalıştırma buradan devam eder.
+
+        Args:
+            folder (str): Playlist klasörü
+            save_every (int): Kaç değişiklikte bir dosyaya yazılacağı
+            save_interval (float): Bekleyen değişiklik varken en fazla kaç
+                saniyede bir dosyaya yazılacağı
+        """
+        self.folder = folder
+        self.path = os.path.join(folder, self.FILENAME)
+        self.save_every = save_every
+        self.save_interval = save_interval
+        self.entries = {}
+        self.lock = threading.Lock()
+        # Worker thread'lerinden gelen kayıtlar sırayla yazılır (eski görüntü yenisini ezmez)
+        self.save_lock = threading.Lock()
+        self._unsaved = 0
+        self._last_save = time.monotonic()
+        self.load()
+
+    def load(self):
+        """Günlük dosyasını oku"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('tracks', {})
+        except Exception as e:
+            print(f"⚠️ Çalıştırma günlüğü okunamadı, yok sayılıyor: {e}")
+            self.entries = {}
+
+    def save(self):
+        """Günlüğü yaz; bekleyen kayıt kalmadıysa dosyayı sil"""
+        with self.save_lock:
+            with self.lock:
+                data = {'version': 1, 'tracks': dict(self.entries)}
+                self._unsaved = 0
+                self._last_save = time.monotonic()
+
+            try:
+                if not data['tracks']:
+                    if os.path.exists(self.path):
+                        os.remove(self.path)
+                    return
+
+                write_atomic(self.path, json.dumps(data, indent=2, ensure_ascii=False))
+            except Exception as e:
+                print(f"❌ Çalıştırma günlüğü kaydetme hatası: {e}")
+
+    def get(self, track_id):
+        """Şarkının günlük kaydı (yoksa None)"""
+        with self.lock:
+            entry = self.entries.get(track_id)
+            return dict(entry) if entry else None
+
+    def resolved_result(self, track_id):
+        """Önceki çalıştırmada bulunan YouTube sonucu"""
+        entry = self.get(track_id) if track_id else None
+        return entry.get('result') if entry else None
+
+    def in_flight(self, track_id):
+        """Şarkının indirmesi önceki çalıştırmada yarıda mı kaldı?"""
+        entry = self.get(track_id) if track_id else None
+        return bool(entry and entry.get('state') == 'downloading')
+
+    def resolved(self, track_id, youtube_result):
+        """Arama sonucunu kaydet"""
+        if not track_id:
+            return
+
+        with self.lock:
+            self.entries[track_id] = {
+                'state': 'resolved',
+                'result': youtube_result,
+                'updated_at': int(time.time())
+            }
+            should_save = self._changed()
+
+        if should_save:
+            self.save()
+
+    def started(self, track_id, youtube_result, format_id):
+        """
+        Aktarım başlıyor: hangi formatın .part dosyası yazıldığını kaydet
+
+        Sonraki çalıştırmada aynı format seçilerek yarım dosyaya kalınan
+        bayttan devam edilir. Her aktarımda tüm dosya yeniden yazılmaz;
+        kayıt diske yazılmadan süreç çökerse o .part dosyası baştan indirilir.
+        """
+        if not track_id:
+            return
+
+        with self.lock:
+            self.entries[track_id] = {
+                'state': 'downloading',
+                'result': youtube_result,
+                'format_id': format_id,
+                'updated_at': int(time.time())
+            }
+            should_save = self._changed()
+
+        if should_save:
+            self.save()
+
+    def finished(self, track_id):
+        """İndirme tamamlandı, kaydı sil"""
+        self.discard(track_id)
+
+    def discard(self, track_id):
+        """
+        Kaydı sil (indirme tamamlandı veya iptal dışında bir nedenle başarısız)
+
+        Başarısız şarkının kaydı kalırsa sonraki çalıştırmalar aynı sonucu
+        aramadan tekrar dener ve günlük dosyası hiç silinmez.
+        """
+        with self.lock:
+            if self.entries.pop(track_id, None) is not None:
+                self._unsaved += 1
+
+    def _changed(self):
+        """Değişikliği say; dosyaya yazma zamanı geldiyse True (kilit alınmış olmalı)"""
+        self._unsaved += 1
+        return (self._unsaved >= self.save_every
+                or time.monotonic() - self._last_save >= self.save_interval)
@@ -0,0 +1,179 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+# Çalışan profil (yoksa mark() hiçbir şey yapmaz)
+_active = None
+
+# Bellek raporundan çıkarılan iç kaynaklar (filter_traces büyük yığınlarda
+# çok yavaş olduğundan gruplanmış istatistikler süzülür)
+_IGNORED_FILES = (
+    tracemalloc.__file__,
+    __file__,
+    '<frozen importlib._bootstrap>',
+    '<frozen importlib._bootstrap_external>',
+    '<unknown>'
+)
+
+
+class RunProfiler:
+    def __init__(self, top=25, frames=1):
+        """
+        CPU (cProfile) ve bellek (tracemalloc) profili
+
+        Tüm thread'ler profillenir: Python 3.12 öncesinde her yeni thread
+        için ayrı bir cProfile açılır ve sonunda istatistikler birleştirilir.
+        Aşama sınırlarında mark() ile tracemalloc anlık görüntüsü alınır.
+
+        Args:
+            top (int): Raporda gösterilecek en büyük kayıt sayısı
+            frames (int): tracemalloc'un sakladığı çağrı derinliği
+        """
+        self.top = top
+        self.frames = frames
+        self.lock = threading.Lock()
+        self.profiles = []
+        self.snapshots = []
+        self.last_snapshot = None
+        self.output_folder = None
+        self.started = None
+
+    def start(self):
+        """Profili başlat ve etkin profil olarak işaretle"""
+        global _active
+        self.started = time.time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+        main_profile = cProfile.Profile()
+        self.profiles.append(main_profile)
+        if sys.version_info < (3, 12):
+            threading.setprofile(self._profile_thread)
+        main_profile.enable()
+        _active = self
+        self.snapshot('başlangıç')
+
+    def _profile_thread(self, frame, event, arg):
+        """Yeni thread'in ilk çağrısında o thread için cProfile aç"""
+        profile = cProfile.Profile()
+        with self.lock:
+            self.profiles.append(profile)
+        # enable() bu thread'in profil fonksiyonunu değiştirir
+        profile.enable()
+
+    def snapshot(self, label, output_folder=None):
+        """Aşama sınırında bellek görüntüsü al"""
+        if output_folder:
+            self.output_folder = output_folder
+        if not tracemalloc.is_tracing():
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+
+        # Rapor satırları hemen hesaplanır; bellekte sadece son görüntü tutulur
+        lines = [f"== {label} (+{time.time() - self.started:.1f} sn) "
+                 f"şu an {current / 1024 / 1024:.1f} MB, tepe {peak / 1024 / 1024:.1f} MB",
+                 f"   En büyük {self.top} ayırma:"]
+        for stat in _top(snapshot.statistics('lineno'), self.top):
+            lines.append(f"   {stat.size / 1024:10.1f} KB {stat.count:8} blok  {stat.traceback}")
+
+        with self.lock:
+            previous = self.last_snapshot
+            self.last_snapshot = snapshot
+        if previous is not None:
+            lines.append("   Önceki aşamaya göre en büyük artışlar:")
+            for stat in _top(snapshot.compare_to(previous, 'lineno'), max(1, self.top // 2)):
+                if stat.size_diff <= 0:
+                    break
+                lines.append(f"   {stat.size_diff / 1024:+10.1f} KB {stat.count_diff:+8} blok  {stat.traceback}")
+
+        with self.lock:
+            self.snapshots.append('\n'.join(lines))
+
+    def stop(self, output_folder=None):
+        """
+        Profili durdur ve raporları yaz
+
+        Args:
+            output_folder (str): Raporların yazılacağı klasör (varsayılan:
+                son kullanılan indirme klasörü altında 'profiles')
+
+        Returns:
+            tuple: (pstats yolu, bellek raporu yolu)
+        """
+        global _active
+        threading.setprofile(None)
+        self.snapshot('bitiş')
+        for profile in self.profiles:
+            profile.disable()
+        tracemalloc.stop()
+        self.last_snapshot = None
+        _active = None
+
+        folder = os.path.join(output_folder or self.output_folder or 'spotify_downloads', 'profiles')
+        os.makedirs(folder, exist_ok=True)
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started))
+        stats_path = os.path.join(folder, f'profile-{stamp}.pstats')
+        memory_path = os.path.join(folder, f'profile-{stamp}-allocations.txt')
+
+        stats = self._merged_stats()
+        if stats:
+            stats.dump_stats(stats_path)
+        with open(memory_path, 'w', encoding='utf-8') as f:
+            f.write(self.memory_report())
+
+        print(f"🔬 CPU profili: {stats_path}")
+        print(f"🔬 Bellek raporu: {memory_path}")
+        if stats:
+            print(self.cpu_summary(stats, limit=15))
+        return stats_path, memory_path
+
+    def _merged_stats(self):
+        """Tüm thread profillerini tek pstats.Stats'ta birleştir"""
+        merged = None
+        for profile in self.profiles:
+            try:
+                if merged is None:
+                    merged = pstats.Stats(profile)
+                else:
+                    merged.add(profile)
+            except TypeError:
+                # Hiç çağrı kaydetmemiş thread
+                continue
+        return merged
+
+    def cpu_summary(self, stats, limit=None):
+        """Kümülatif süreye göre en pahalı fonksiyonlar"""
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats('cumulative').print_stats(limit or self.top)
+        return stream.getvalue()
+
+    def memory_report(self):
+        """Aşama bazında en büyük bellek ayırmaları ve önceki aşamaya göre fark"""
+        header = f"Bellek profili (tracemalloc, {self.frames} çerçeve)\n\n"
+        return header + '\n\n'.join(self.snapshots) + '\n'
+
+
+def mark(label, output_folder=None):
+    """Profil çalışıyorsa aşama sınırında bellek görüntüsü al"""
+    profiler = _active
+    if profiler is not None:
+        profiler.snapshot(label, output_folder)
+
+
+def _top(stats, limit):
+    """İç kaynakları atlayarak ilk limit kadar istatistik"""
+    result = []
+    for stat in stats:
+        if stat.traceback[0].filename in _IGNORED_FILES:
+            continue
+        result.append(stat)
+        if len(result) >= limit:
+            break
+    return result
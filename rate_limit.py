@@ -0,0 +1,170 @@
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, name, rate, burst=None, base_backoff=1.0, max_backoff=60.0):
+        """
+        Servis başına paylaşılan token bucket hız sınırlayıcı
+
+        Tüm worker'lar aynı kovadan token alır. 429 yanıtı geldiğinde
+        backoff() ile kova tüm worker'lar için birlikte kapatılır; böylece
+        her thread kendi başına tekrar denemez.
+
+        Args:
+            name (str): Servis adı (log ve özet için)
+            rate (float): Saniyedeki istek sayısı (0 veya None: sınırsız)
+            burst (int): Kovada biriktirilebilecek en fazla token
+            base_backoff (float): Retry-After yoksa ilk bekleme (saniye)
+            max_backoff (float): En uzun bekleme (saniye)
+        """
+        self.name = name
+        self.rate = float(rate or 0)
+        self.burst = max(1.0, float(burst or self.rate or 1))
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.lock = threading.Lock()
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.consecutive = 0
+
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    def acquire(self):
+        """Bir token al; gerekirse bekle. Beklenen süreyi döndürür."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if self.rate:
+                    self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if now < self.blocked_until:
+                    delay = self.blocked_until - now
+                elif not self.rate or self.tokens >= 1:
+                    if self.rate:
+                        self.tokens -= 1
+                    self.requests += 1
+                    self.waited += waited
+                    return waited
+                else:
+                    delay = (1 - self.tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+    def backoff(self, retry_after=None):
+        """
+        429 sonrası kovayı herkes için kapat
+
+        Args:
+            retry_after (float): Sunucunun Retry-After değeri (saniye)
+
+        Returns:
+            float: Uygulanan bekleme süresi
+        """
+        with self.lock:
+            self.consecutive += 1
+            self.throttled += 1
+            if retry_after is None:
+                delay = self.base_backoff * 2 ** (self.consecutive - 1)
+            else:
+                delay = retry_after
+            delay = min(self.max_backoff, max(0.0, delay))
+
+            now = time.monotonic()
+            self.blocked_until = max(self.blocked_until, now + delay)
+            self.tokens = 0.0
+            self.updated = now
+            return delay
+
+    def success(self):
+        """Başarılı istek: üst üste 429 sayacını sıfırla"""
+        if self.consecutive:
+            with self.lock:
+                self.consecutive = 0
+
+    def stats(self):
+        """İstek, 429 ve toplam bekleme istatistikleri"""
+        with self.lock:
+            return {
+                'requests': self.requests,
+                'throttled': self.throttled,
+                'waited': self.waited
+            }
+
+
+class RateLimiter:
+    def __init__(self, limits=None):
+        """
+        Servis adına göre token bucket'lar
+
+        Args:
+            limits (dict): {servis: {"rate": float, "burst": int}}
+        """
+        self.limits = limits or {}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def get(self, name):
+        """Servisin kovasını döndür (yoksa ayarlardan oluştur)"""
+        with self.lock:
+            bucket = self.buckets.get(name)
+            if bucket is None:
+                limit = self.limits.get(name) or {}
+                bucket = TokenBucket(
+                    name,
+                    limit.get('rate'),
+                    limit.get('burst'),
+                    base_backoff=limit.get('base_backoff', 1.0),
+                    max_backoff=limit.get('max_backoff', 60.0)
+                )
+                self.buckets[name] = bucket
+            return bucket
+
+    def stats(self):
+        """Tüm servislerin istatistikleri"""
+        with self.lock:
+            buckets = dict(self.buckets)
+        return {name: bucket.stats() for name, bucket in buckets.items()}
+
+
+def parse_retry_after(headers):
+    """Retry-After başlığını saniyeye çevir (yoksa None)"""
+    if not headers:
+        return None
+    value = headers.get('Retry-After') or headers.get('retry-after')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def mount_central_retry(session, retries=3, backoff_factor=0.3):
+    """
+    requests oturumunda 429'u istemci içinde tekrar denemeyi kapat
+
+    Sunucu hataları (5xx) yine tekrar denenir; 429 ve Retry-After ise
+    yükselen hata ile RateLimiter tarafından merkezi olarak işlenir.
+    """
+    import requests
+    import urllib3
+
+    retry = urllib3.Retry(
+        total=retries,
+        connect=None,
+        read=False,
+        status=retries,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        backoff_factor=backoff_factor,
+        status_forcelist=(500, 502, 503, 504),
+        respect_retry_after_header=False
+    )
+    adapter = requests.adapters.HTTPAdapter(max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
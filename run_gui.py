@@ -5,6 +5,7 @@ Spotify Playlist İndirici GUI Başlatıcı
 
 import sys
 import os
+import argparse
 import tkinter as tk
 from tkinter import messagebox
 
@@ -40,11 +41,34 @@ def load_config():
             }
         }
 
+def parse_args():
+    """Komut satırı argümanları"""
+    parser = argparse.ArgumentParser(description="Spotify Playlist İndirici GUI")
+    parser.add_argument('--profile', action='store_true',
+                        help="cProfile ve tracemalloc raporlarını indirme klasöründeki 'profiles' altına yaz")
+    return parser.parse_args()
+
 def main():
     """Ana fonksiyon"""
+    args = parse_args()
     print("🎵 Spotify Playlist İndirici GUI")
     print("=" * 40)
     
+    profiler = None
+    if args.profile:
+        from profiling import RunProfiler
+        profiler = RunProfiler()
+        profiler.start()
+        print("🔬 Profil açık: raporlar pencere kapanınca yazılacak")
+    
+    try:
+        run(profiler)
+    finally:
+        if profiler:
+            profiler.stop()
+
+def run(profiler=None):
+    """Dosyaları kontrol et, config'i yükle ve GUI'yi aç"""
     # Dosya kontrolü
     if not check_dependencies():
         print("\n💡 Lütfen tüm dosyaların aynı klasörde olduğundan emin olun.")
@@ -56,6 +80,8 @@ def main():
         # Config'i yükle
         config = load_config()
         print("✅ Config dosyası yüklendi")
+        if profiler:
+            profiler.output_folder = config.get('settings', {}).get('download_folder', 'spotify_downloads')
         
         # Modern GUI'yi başlat
         from spotify_modern_gui import main as gui_main
@@ -0,0 +1,179 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+
+
+class SearchCache:
+    def __init__(self, db_path, ttl_seconds=30 * 24 * 3600, max_entries=50000):
+        """
+        Arama sonuçları için kalıcı (SQLite) önbellek
+
+        Args:
+            db_path (str): SQLite dosyasının yolu
+            ttl_seconds (int): Bir kaydın geçerli kalacağı süre (saniye)
+            max_entries (int): Tutulacak en fazla kayıt (LRU ile silinir)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self._puts_since_evict = 0
+
+        folder = os.path.dirname(db_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+
+        # Aynı bağlantı tüm worker thread'lerinden kilit ile kullanılır
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_cache (
+                track_id TEXT NOT NULL,
+                query TEXT NOT NULL,
+                video_id TEXT NOT NULL,
+                title TEXT,
+                duration REAL,
+                platform TEXT,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (track_id, query)
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_search_cache_access ON search_cache (last_access)"
+        )
+        self.conn.commit()
+
+        with self.lock:
+            self._expire()
+            self._evict()
+
+    @staticmethod
+    def normalize_query(query):
+        """Sorguyu karşılaştırılabilir hale getir (küçük harf, tek boşluk)"""
+        return re.sub(r'\s+', ' ', (query or '').casefold()).strip()
+
+    def get(self, query, track_id=None):
+        """Önbellekteki sonucu döndür, yoksa veya süresi dolmuşsa None"""
+        key = (track_id or '', self.normalize_query(query))
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT video_id, title, duration, platform, created_at "
+                "FROM search_cache WHERE track_id = ? AND query = ?",
+                key
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            video_id, title, duration, platform, created_at = row
+
+            # Süresi dolan kaydı sil
+            if now - created_at > self.ttl_seconds:
+                self.conn.execute(
+                    "DELETE FROM search_cache WHERE track_id = ? AND query = ?", key
+                )
+                self.conn.commit()
+                self.misses += 1
+                return None
+
+            self.conn.execute(
+                "UPDATE search_cache SET last_access = ? WHERE track_id = ? AND query = ?",
+                (now,) + key
+            )
+            self.conn.commit()
+            self.hits += 1
+
+        return {
+            'id': video_id,
+            'title': title,
+            'duration': duration,
+            'url': f"https://www.youtube.com/watch?v={video_id}",
+            'platform': platform or 'YouTube',
+            'cached': True
+        }
+
+    def put(self, query, result, track_id=None):
+        """Arama sonucunu önbelleğe yaz"""
+        if not result or not result.get('id'):
+            return
+
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_cache "
+                "(track_id, query, video_id, title, duration, platform, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    track_id or '',
+                    self.normalize_query(query),
+                    result['id'],
+                    result.get('title'),
+                    result.get('duration'),
+                    result.get('platform', 'YouTube'),
+                    now,
+                    now
+                )
+            )
+            self.conn.commit()
+
+            # Boyut sınırını her yazmada değil, aralıklı kontrol et
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= 100:
+                self._evict()
+
+    def delete(self, query=None, track_id=None):
+        """
+        Kaydı sil (bulunan video indirilemediyse sonraki denemede yeniden aranır)
+
+        track_id verilirse şarkının tüm sorgulara ait kayıtları silinir.
+        """
+        with self.lock:
+            if track_id:
+                removed = self.conn.execute(
+                    "DELETE FROM search_cache WHERE track_id = ?", (track_id,)
+                ).rowcount
+            else:
+                removed = self.conn.execute(
+                    "DELETE FROM search_cache WHERE track_id = '' AND query = ?",
+                    (self.normalize_query(query),)
+                ).rowcount
+            if removed:
+                self.conn.commit()
+        return removed
+
+    def _expire(self):
+        """Süresi dolan kayıtları sil (kilit alınmış olmalı)"""
+        self.conn.execute(
+            "DELETE FROM search_cache WHERE created_at < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+        self.conn.commit()
+
+    def _evict(self):
+        """En uzun süredir kullanılmayan kayıtları sil (kilit alınmış olmalı)"""
+        self._puts_since_evict = 0
+        self.conn.execute(
+            "DELETE FROM search_cache WHERE rowid IN ("
+            "SELECT rowid FROM search_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self.conn.commit()
+
+    def stats(self):
+        """İsabet/ıska sayılarını döndür"""
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def close(self):
+        """Bağlantıyı kapat"""
+        with self.lock:
+            self._evict()
+            self.conn.close()
@@ -7,7 +7,8 @@ import os
 import sys
 from datetime import datetime
 import json
-from PIL import Image, ImageTk
+import tempfile
+from collections import deque
 
 # Ana modülü import et
 try:
@@ -17,7 +18,7 @@ except ImportError:
     sys.exit(1)
 
 class ModernSpotifyGUI:
-    def __init__(self):
+    def __init__(self, config=None):
         # CustomTkinter ayarları
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("green")
@@ -42,19 +43,30 @@ class ModernSpotifyGUI:
             'error': '#E74C3C'         # Hata kırmızısı
         }
         
-        # Downloader instance
+        # Downloader instance (run_gui.py'nin yüklediği config ile)
+        self.config = config
         self.downloader = None
         self.is_downloading = False
         self.is_paused = False  # Duraklatma durumu
         self.selected_folder = None
         
+        self.download_thread = None
+        
         # Log ayarları
         self.detailed_log = False  # Detaylı log modu
+        self.log_queue = queue.Queue()  # Herhangi bir thread'den gelen log kayıtları
+        self.max_log_lines = 1000  # Log alanında tutulan en fazla satır
+        self.log_lines = deque()  # Log alanındaki kayıtlar (halka tampon)
+        self.log_line_count = 0  # Log alanındaki metin satırı sayısı (çok satırlı kayıtlar dahil)
+        self.log_history_file = None  # Log alanından taşan eski satırlar
         
         # GUI bileşenleri
         self.setup_gui()
         self.load_config()
         
+        # Logları toplu halde yazmaya başla
+        self.root.after(100, self.flush_logs)
+        
     def setup_gui(self):
         """Modern GUI bileşenlerini oluştur"""
         # Ana container
@@ -175,10 +187,19 @@ class ModernSpotifyGUI:
                                 command=self.clear_log, width=80)
         clear_btn.pack(side="left")
         
+        export_btn = ctk.CTkButton(log_controls, text="💾 Kaydet", 
+                                 command=self.export_log, width=80)
+        export_btn.pack(side="left", padx=(10, 0))
+        
         # Log alanı
         self.log_text = ctk.CTkTextbox(right_panel, font=ctk.CTkFont(size=12))
         self.log_text.pack(fill="both", expand=True, padx=20, pady=(0, 20))
         
+        # Her seviye için tek bir renk etiketi
+        for level in ("info", "success", "warning", "error"):
+            color_key = "text" if level == "info" else level
+            self.log_text.tag_config(level, foreground=self.colors[color_key])
+        
     def create_footer(self):
         """Alt bölümü oluştur"""
         footer_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
@@ -220,16 +241,20 @@ class ModernSpotifyGUI:
                 config = embedded_config.get_config()
                 self.downloader = SpotifyPlaylistDownloader(
                     client_id=config["spotify"]["client_id"],
-                    client_secret=config["spotify"]["client_secret"]
+                    client_secret=config["spotify"]["client_secret"],
+                    config=self.config,
+                    connect=False
                 )
                 self.log("✅ Gömülü config dosyası yüklendi", "success", force_detail=True)
             except ImportError:
                 # Gömülü config yoksa varsayılan yöntemi kullan
-                self.downloader = SpotifyPlaylistDownloader()
+                self.downloader = SpotifyPlaylistDownloader(config=self.config, connect=False)
                 self.log("✅ Config dosyası yüklendi", "success", force_detail=True)
             
             if self.downloader.client_id and self.downloader.client_secret:
                 self.log("✅ Spotify API bilgileri bulundu", "success", force_detail=True)
+                # Pencere bağlantıyı beklemeden açılır
+                self.downloader.connect_spotify_async(on_done=self.on_spotify_connected)
             else:
                 self.log("⚠️ Spotify API bilgileri bulunamadı", "warning", force_detail=True)
                 
@@ -241,37 +266,94 @@ class ModernSpotifyGUI:
             self.log(f"❌ Config yükleme hatası: {e}", "error", force_detail=True)
             messagebox.showerror("Hata", f"Config dosyası yüklenemedi:\n{e}")
     
+    def on_spotify_connected(self, connected):
+        """Arka plandaki Spotify bağlantısı bitti (bağlantı thread'inden çağrılır)"""
+        if connected:
+            self.log("✅ Spotify API'ye bağlanıldı", "success", force_detail=True)
+        else:
+            self.log("❌ Spotify API bağlantısı kurulamadı", "error", force_detail=True)
+    
     def log(self, message, level="info", force_detail=False):
-        """Log mesajı ekle"""
+        """Log mesajı ekle (her thread'den çağrılabilir, ekrana toplu yazılır)"""
         # Detaylı log kapalıysa ve force_detail False ise mesajı gösterme
         if not self.detailed_log and not force_detail:
             return
             
         timestamp = datetime.now().strftime("%H:%M:%S")
+        self.log_queue.put((f"[{timestamp}] {message}\n", level))
+    
+    def flush_logs(self):
+        """Bekleyen log kayıtlarını tek seferde log alanına yaz"""
+        batch = []
+        try:
+            while len(batch) < 500:
+                batch.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if batch:
+            # Aynı seviyedeki ardışık satırları tek insert ile ekle
+            chunk, chunk_level = [], None
+            for line, level in batch:
+                if level != chunk_level and chunk:
+                    self.log_text.insert("end", "".join(chunk), chunk_level)
+                    chunk = []
+                chunk_level = level
+                chunk.append(line)
+                self.log_lines.append(line)
+                self.log_line_count += line.count('\n')
+            self.log_text.insert("end", "".join(chunk), chunk_level)
+            
+            # Halka tampon: taşan eski kayıtları dosyaya aktar ve alandan sil
+            # (bir kayıt birden fazla satır olabilir, örn. spotipy hataları)
+            if self.log_line_count > self.max_log_lines:
+                old_lines = []
+                removed = 0
+                while self.log_line_count - removed > self.max_log_lines:
+                    line = self.log_lines.popleft()
+                    old_lines.append(line)
+                    removed += line.count('\n')
+                self.log_line_count -= removed
+                self.save_log_history(old_lines)
+                self.log_text.delete("1.0", f"{removed + 1}.0")
+            
+            # Otomatik kaydır
+            self.log_text.see("end")
         
-        # Renk kodları
-        colors = {
-            "info": self.colors['text'],
-            "success": self.colors['success'],
-            "warning": self.colors['warning'],
-            "error": self.colors['error']
-        }
-        
-        # Tag oluştur
-        tag_name = f"tag_{timestamp.replace(':', '_')}"
-        
-        # Mesajı ekle
-        self.log_text.insert("end", f"[{timestamp}] {message}\n")
-        
-        # Renk uygula
-        start = f"end-{len(message) + len(timestamp) + 3}l"
-        end = "end-1l"
-        self.log_text.tag_add(tag_name, start, end)
-        self.log_text.tag_config(tag_name, foreground=colors.get(level, self.colors['text']))
+        self.root.after(100, self.flush_logs)
+    
+    def save_log_history(self, lines):
+        """Log alanından taşan satırları geçici geçmiş dosyasına ekle"""
+        try:
+            if self.log_history_file is None:
+                self.log_history_file = tempfile.NamedTemporaryFile(
+                    "w+", encoding="utf-8", prefix="spotify_log_", suffix=".txt"
+                )
+            self.log_history_file.writelines(lines)
+            self.log_history_file.flush()
+        except Exception as e:
+            print(f"⚠️ Log geçmişi yazılamadı: {e}")
+    
+    def export_log(self):
+        """Tüm log geçmişini (eski satırlar dahil) dosyaya kaydet"""
+        path = filedialog.asksaveasfilename(
+            title="Logları Kaydet",
+            defaultextension=".txt",
+            initialfile=f"spotify_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            filetypes=[("Metin dosyası", "*.txt")]
+        )
+        if not path:
+            return
         
-        # Otomatik kaydır
-        self.log_text.see("end")
-        self.root.update_idletasks()
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                if self.log_history_file is not None:
+                    self.log_history_file.seek(0)
+                    f.write(self.log_history_file.read())
+                f.writelines(self.log_lines)
+            self.log(f"💾 Loglar kaydedildi: {path}", "success", force_detail=True)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Loglar kaydedilemedi:\n{e}")
     
     def toggle_log_detail(self):
         """Detaylı log modunu aç/kapat"""
@@ -300,12 +382,14 @@ class ModernSpotifyGUI:
             if self.is_paused:
                 # Duraklatılmış durumda - devam et
                 self.is_paused = False
+                self.downloader.resume()
                 self.download_btn.configure(text="⏸️ Duraklat", fg_color=self.colors['warning'])
                 self.status_label.configure(text="İndirme devam ediyor...")
                 self.log("▶️ İndirme devam ediyor", "info", force_detail=True)
             else:
                 # Çalışıyor durumda - duraklat
                 self.is_paused = True
+                self.downloader.pause()
                 self.download_btn.configure(text="▶️ Devam Et", fg_color=self.colors['success'])
                 self.status_label.configure(text="İndirme duraklatıldı")
                 self.log("⏸️ İndirme duraklatıldı", "warning", force_detail=True)
@@ -325,6 +409,10 @@ class ModernSpotifyGUI:
             messagebox.showerror("Hata", "Lütfen bir indirme klasörü seçin!")
             return
         
+        if self.download_thread and self.download_thread.is_alive():
+            messagebox.showwarning("Uyarı", "Önceki indirme durduruluyor, lütfen biraz bekleyin.")
+            return
+        
         # İndirme thread'ini başlat
         self.is_downloading = True
         self.is_paused = False
@@ -336,9 +424,18 @@ class ModernSpotifyGUI:
         self.stats = {"successful": 0, "failed": 0, "total": 0}
         self.update_stats()
         
-        download_thread = threading.Thread(target=self.download_playlist, args=(url,))
-        download_thread.daemon = True
-        download_thread.start()
+        # İndirme klasörünü güncelle
+        self.downloader.download_folder = self.selected_folder
+        
+        # İndirme thread'inden Tk ana döngüsüne olay kanalı
+        events = queue.Queue()
+        
+        self.download_thread = threading.Thread(target=self.download_playlist, args=(url, events))
+        self.download_thread.daemon = True
+        self.download_thread.start()
+        
+        # Olay kanalını dinlemeye başla
+        self.root.after(100, self.process_events, events)
         
         # Durdur butonunu göster
         self.stop_btn.pack(side="left", padx=5, pady=10)
@@ -348,6 +445,7 @@ class ModernSpotifyGUI:
         if self.is_downloading:
             self.is_downloading = False
             self.is_paused = False
+            self.downloader.cancel()
             self.download_btn.configure(text="📥 İndirmeyi Başlat", fg_color=self.colors['primary'])
             self.status_label.configure(text="İndirme durduruldu")
             self.log("⏹️ İndirme durduruldu", "warning", force_detail=True)
@@ -355,90 +453,106 @@ class ModernSpotifyGUI:
             # Durdur butonunu gizle
             self.stop_btn.pack_forget()
     
-    def download_playlist(self, url):
-        """Playlist indirme işlemi"""
+    def download_playlist(self, url, events):
+        """Playlist indirme işlemi (arka plan thread'i)"""
         try:
-            self.log(f"🎵 Playlist indirme başlatılıyor", "info", force_detail=True)
+            events.put(("log", "🎵 Playlist indirme başlatılıyor", "info"))
             
-            # İndirme klasörünü güncelle
-            self.downloader.download_folder = self.selected_folder
+            # CLI ile aynı paralel motor kullanılır (max_workers ayarı geçerli)
+            success = self.downloader.download_playlist(
+                url, progress_callback=lambda event, data: events.put((event, data))
+            )
+            events.put(("done", success))
             
-            # Playlist bilgilerini al
-            playlist_info = self.downloader.get_playlist_info(url)
-            if not playlist_info:
-                self.log("❌ Playlist bilgileri alınamadı", "error", force_detail=True)
-                self.download_complete(False)
-                return
-            
-            self.log(f"📋 {playlist_info['name']} ({playlist_info['tracks_count']} şarkı)", "success", force_detail=True)
-            
-            # Şarkıları al
-            tracks = self.downloader.get_playlist_tracks(url)
-            if not tracks:
-                self.log("❌ Hiç şarkı bulunamadı", "error", force_detail=True)
-                self.download_complete(False)
-                return
-            
-            self.log(f"📥 İndirme başlıyor...", "success", force_detail=True)
-            
-            # İndirme işlemi
-            total_tracks = len(tracks)
-            self.stats["total"] = total_tracks
-            
-            for i, track in enumerate(tracks):
-                if not self.is_downloading:  # İptal kontrolü
-                    break
-                
-                # Duraklatma kontrolü
-                while self.is_paused and self.is_downloading:
-                    self.status_label.configure(text="⏸️ İndirme duraklatıldı - Devam etmek için butona basın")
-                    self.root.update_idletasks()
-                    import time
-                    time.sleep(0.1)  # CPU kullanımını azaltmak için kısa bekleme
-                
-                # Eğer indirme durdurulduysa döngüden çık
-                if not self.is_downloading:
-                    break
-                
-                track_name = track['name']
-                artists = ', '.join(track['artists'])
+        except Exception as e:
+            events.put(("log", f"❌ İndirme hatası: {e}", "error"))
+            events.put(("done", False))
+    
+    def process_events(self, events):
+        """İndirme thread'inden gelen olayları Tk ana döngüsünde işle"""
+        done = None
+        try:
+            while True:
+                event = events.get_nowait()
+                kind = event[0]
                 
-                self.status_label.configure(text=f"İndiriliyor: {track_name} - {artists}")
+                if kind == "log":
+                    self.log(event[1], event[2], force_detail=True)
                 
-                # Detaylı log modunda şarkı detaylarını göster
-                if self.detailed_log:
-                    self.log(f"⬇️ İndiriliyor: {track_name} - {artists}", "info")
+                elif kind == "playlist":
+                    data = event[1]
+                    self.log(f"📋 {data['info']['name']} ({data['total']} şarkı)", "success", force_detail=True)
+                    if data['skipped']:
+                        self.log(f"⏭️ {data['skipped']} şarkı zaten indirilmiş", "info", force_detail=True)
+                    self.log(f"📥 İndirme başlıyor...", "success", force_detail=True)
+                    self.stats["total"] = data['pending']
+                    self.update_stats()
+                    # Sayfa sayfa alınırken toplam 'tracks' olaylarıyla artar
+                    if not data['pending'] and not data.get('streaming'):
+                        self.progress_bar.set(1.0)
                 
-                # İndirme işlemi
-                success = self.downloader.download_track(track, playlist_info['name'])
+                elif kind == "tracks":
+                    data = event[1]
+                    self.stats["total"] = data['pending']
+                    self.update_stats()
+                    if data['loaded'] < data['total']:
+                        if not self.is_paused:
+                            self.status_label.configure(text=f"Şarkılar alınıyor: {data['loaded']}/{data['total']}")
+                    else:
+                        if data['skipped']:
+                            self.log(f"⏭️ {data['skipped']} şarkı zaten indirilmiş", "info", force_detail=True)
+                        if not data['pending']:
+                            self.progress_bar.set(1.0)
+                    completed = self.stats["successful"] + self.stats["failed"]
+                    if data['pending']:
+                        self.progress_bar.set(completed / data['pending'])
                 
-                if success:
-                    self.stats["successful"] += 1
+                elif kind == "track":
+                    data = event[1]
+                    track = data['track']
+                    name = f"{track.name} - {', '.join(track.artists)}"
+                    
+                    self.stats["successful"] = data['successful']
+                    self.stats["failed"] = data['failed']
+                    
+                    # Detaylı log modunda şarkı detaylarını göster
                     if self.detailed_log:
-                        self.log(f"✅ Tamamlandı: {track_name} - {artists}", "success")
-                else:
-                    self.stats["failed"] += 1
-                    if self.detailed_log:
-                        self.log(f"❌ Başarısız: {track_name} - {artists}", "error")
+                        if data['success']:
+                            self.log(f"✅ Tamamlandı: {name}", "success")
+                        else:
+                            self.log(f"❌ Başarısız: {name}", "error")
+                    
+                    # İlerleme güncelle
+                    if data['total']:
+                        self.progress_bar.set(data['completed'] / data['total'])
+                    if not self.is_paused:
+                        self.status_label.configure(text=f"İndirildi: {data['completed']}/{data['total']} - {name}")
+                    self.update_stats()
                 
-                # İlerleme güncelle
-                progress = ((i + 1) / total_tracks)
-                self.progress_bar.set(progress)
-                self.update_stats()
+                elif kind == "finished":
+                    data = event[1]
+                    if data.get('known_failures'):
+                        self.log(f"🚫 {data['known_failures']} şarkı daha önce başarısız oldu, yeniden deneme "
+                                 f"zamanı gelmediği için atlandı", "warning", force_detail=True)
                 
-                # GUI güncelle
-                self.root.update_idletasks()
-            
-            # Özet - her zaman göster
-            self.log("=" * 30, "info", force_detail=True)
-            self.log("🎉 İndirme Tamamlandı!", "success", force_detail=True)
-            self.log(f"✅ Başarılı: {self.stats['successful']} | ❌ Başarısız: {self.stats['failed']}", "success", force_detail=True)
-            
-            self.download_complete(True)
-            
-        except Exception as e:
-            self.log(f"❌ İndirme hatası: {e}", "error", force_detail=True)
-            self.download_complete(False)
+                elif kind == "done":
+                    done = event[1]
+        except queue.Empty:
+            pass
+        
+        if done is not None:
+            if self.is_downloading and done:
+                # Özet - her zaman göster
+                self.log("=" * 30, "info", force_detail=True)
+                self.log("🎉 İndirme Tamamlandı!", "success", force_detail=True)
+                self.log(f"✅ Başarılı: {self.stats['successful']} | ❌ Başarısız: {self.stats['failed']}", "success", force_detail=True)
+                self.download_complete(True)
+            elif self.is_downloading:
+                self.log("❌ Playlist indirilemedi", "error", force_detail=True)
+                self.download_complete(False)
+            return
+        
+        self.root.after(100, self.process_events, events)
     
     def download_complete(self, success):
         """İndirme tamamlandığında çağrılır"""
@@ -476,6 +590,11 @@ class ModernSpotifyGUI:
     def clear_log(self):
         """Log alanını temizle"""
         self.log_text.delete("1.0", "end")
+        self.log_lines.clear()
+        self.log_line_count = 0
+        if self.log_history_file is not None:
+            self.log_history_file.seek(0)
+            self.log_history_file.truncate()
         self.log("🧹 Log temizlendi", "info", force_detail=True)
     
     def test_connection(self):
@@ -559,6 +678,13 @@ class SettingsWindow:
         ctk.CTkLabel(workers_frame, textvariable=self.workers_var, 
                     font=ctk.CTkFont(size=16, weight="bold")).pack(side="right", padx=(10, 0))
         
+        # Otomatik paralellik (slider değeri başlangıç değeri olur)
+        self.auto_workers_var = ctk.BooleanVar(value=self.downloader.auto_workers)
+        ctk.CTkCheckBox(download_frame, 
+                       text=f"🤖 Otomatik ayarla ({self.downloader.auto_workers_min}-"
+                            f"{self.downloader.auto_workers_max} arası, hız ve hatalara göre)",
+                       variable=self.auto_workers_var).pack(anchor="w", padx=20, pady=(0, 10))
+        
         # Mevcut değer gösterimi
         current_value_label = ctk.CTkLabel(download_frame, 
                                          text=f"Mevcut değer: {self.downloader.max_workers}",
@@ -580,10 +706,13 @@ class SettingsWindow:
         try:
             # Paralel indirme sayısını güncelle
             new_workers = self.workers_var.get()
+            auto_workers = self.auto_workers_var.get()
             self.downloader.max_workers = new_workers
+            self.downloader.auto_workers = auto_workers
             
             # Config'i kaydet
             self.downloader.config['settings']['max_workers'] = new_workers
+            self.downloader.config['settings']['auto_workers'] = auto_workers
             self.downloader.save_config(self.downloader.config)
             
             self.log_callback(f"✅ Paralel indirme sayısı {new_workers} olarak güncellendi", "success", force_detail=True)
@@ -607,7 +736,7 @@ class SettingsWindow:
 
 def main(config=None):
     """Ana fonksiyon"""
-    app = ModernSpotifyGUI()
+    app = ModernSpotifyGUI(config)
     app.run()
 
 if __name__ == "__main__":
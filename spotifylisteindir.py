@@ -1,28 +1,50 @@
-import spotipy
-from spotipy.oauth2 import SpotifyClientCredentials
-import yt_dlp
 import os
 import re
 import time
 import subprocess
 import sys
 import json
+import argparse
+import contextlib
+import copy
+import shutil
+import functools
+import itertools
+import signal
 from urllib.parse import quote
-import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import threading
+import queue
+from search_cache import SearchCache
+from failure_cache import FailureCache, NOT_FOUND, DOWNLOAD_FAILED, REASON_LABELS
+from playlist_manifest import PlaylistManifest, RunJournal
+from playlist_cache import PlaylistCache
+from audio_store import AudioStore
+import track_matcher
+from track import Track
+from concurrency import AdaptiveConcurrency
+from rate_limit import RateLimiter, parse_retry_after, mount_central_retry
+from metrics import Metrics
+import profiling
+
+# spotipy, yt_dlp ve asyncio ağır modüllerdir: --help ve GUI penceresi
+# beklemesin diye ilk kullanıldıkları yerde import edilirler.
 
 class SpotifyPlaylistDownloader:
-    def __init__(self, client_id=None, client_secret=None):
+    def __init__(self, client_id=None, client_secret=None, config=None, connect=True):
         """
         Spotify Playlist Downloader sınıfı
         
         Args:
             client_id (str): Spotify API Client ID
             client_secret (str): Spotify API Client Secret
+            config (dict): Önceden yüklenmiş config (verilirse config.json tekrar okunmaz)
+            connect (bool): False ise Spotify bağlantısı sonradan connect_spotify
+                veya connect_spotify_async ile kurulur
         """
         # Config dosyasını yükle
-        self.config = self.load_config()
+        self.config = self.load_config(config)
         
         # Config'den bilgileri al veya parametreleri kullan
         self.client_id = client_id or self.config.get('spotify', {}).get('client_id', '')
@@ -31,18 +53,73 @@ class SpotifyPlaylistDownloader:
         self.sp = None
         self.download_folder = self.config.get('settings', {}).get('download_folder', 'spotify_downloads')
         self.max_workers = self.config.get('settings', {}).get('max_workers', 3)
+        self.page_workers = self.config.get('settings', {}).get('page_workers', 8)
+        self.search_workers = self.config.get('settings', {}).get('search_workers', 4)
+        self.auto_workers = self.config.get('settings', {}).get('auto_workers', False)
+        self.auto_workers_min = self.config.get('settings', {}).get('auto_workers_min', 1)
+        self.auto_workers_max = self.config.get('settings', {}).get('auto_workers_max', 10)
+        self.concurrency = None  # Otomatik modda çalışan AIMD denetleyicisi
+        
+        # Servis başına paylaşılan hız sınırı (Spotify API, YouTube arama)
+        self.rate_limiter = RateLimiter(self.config.get('settings', {}).get('rate_limits'))
+        self.rate_limit_retries = self.config.get('settings', {}).get('rate_limit_retries', 5)
+        self.offline = self.config.get('settings', {}).get('offline', False)
+        self.match_debug = self.config.get('settings', {}).get('match_debug', False)
+        self.match_min_score = self.config.get('settings', {}).get('match_min_score', track_matcher.MIN_SCORE)
         self.lock = threading.Lock()
         
+        # Aşama süreleri ve sayaçlar (JSON / Prometheus olarak dışa aktarılır)
+        self.metrics = Metrics()
+        self.metrics_file = self.config.get('settings', {}).get('metrics_file', '')
+        self.metrics_prometheus_file = self.config.get('settings', {}).get('metrics_prometheus_file', '')
+        self.metrics_port = self.config.get('settings', {}).get('metrics_port', 0)
+        if self.metrics_port:
+            self.start_metrics_server(self.metrics_port)
+        
+        # Arama önbelleği
+        self.search_cache = self.open_search_cache()
+        
+        # Bulunamayan / indirilemeyen şarkılar (üstel aralıklarla yeniden denenir)
+        self.failure_cache = self.open_failure_cache()
+        
+        # Playlist meta veri önbelleği (snapshot_id tabanlı)
+        self.playlist_cache = self.open_playlist_cache()
+        
+        # İçerik adresli ortak ses deposu (isteğe bağlı)
+        self.use_audio_store = self.config.get('settings', {}).get('audio_store', False)
+        self._audio_store = None
+        self.playlist_infos = {}
+        
+        # Thread başına uzun ömürlü YoutubeDL nesneleri
+        self.ydl_local = threading.local()
+        self.ydl_generation = 0
+        self.ydl_instances = []
+        
+        # İndirmeyi durdurma/duraklatma (devam eden aktarımlara da ulaşır)
+        self.cancel_event = threading.Event()
+        self.resume_event = threading.Event()
+        self.resume_event.set()
+        
+        # Çalışan indirmenin ilerleme bildirimi (aşama olayları için)
+        self.progress_notify = None
+        self.track_local = threading.local()
+        
         # Klasör oluştur
         if not os.path.exists(self.download_folder):
             os.makedirs(self.download_folder)
         
         # Spotify API bağlantısı
-        if self.client_id and self.client_secret:
+        self.connect_thread = None
+        if connect and self.client_id and self.client_secret:
             self.connect_spotify()
     
-    def load_config(self):
-        """Config dosyasını yükle"""
+    def load_config(self, config=None):
+        """
+        Config dosyasını yükle ve eksik ayarları varsayılanlarla doldur
+        
+        Args:
+            config (dict): Önceden yüklenmiş config (verilirse dosya okunmaz)
+        """
         config_file = "config.json"
         default_config = {
             "spotify": {
@@ -51,27 +128,54 @@ class SpotifyPlaylistDownloader:
             },
             "settings": {
                 "download_folder": "spotify_downloads",
-                "max_workers": 3
+                "max_workers": 3,
+                "page_workers": 8,
+                "search_workers": 4,
+                "auto_workers": False,
+                "auto_workers_min": 1,
+                "auto_workers_max": 10,
+                "rate_limits": {
+                    "spotify": {"rate": 20, "burst": 50},
+                    "youtube_search": {"rate": 5, "burst": 5}
+                },
+                "rate_limit_retries": 5,
+                "cache_folder": ".cache",
+                "search_cache": True,
+                "search_cache_ttl_days": 30,
+                "search_cache_max_entries": 50000,
+                "failure_cache": True,
+                "failure_recheck_hours": 24,
+                "failure_recheck_max_days": 90,
+                "playlist_cache": True,
+                "audio_store": False,
+                "audio_store_folder": "",
+                "offline": False,
+                "match_debug": False,
+                "match_min_score": track_matcher.MIN_SCORE,
+                "metrics_file": "",
+                "metrics_prometheus_file": "",
+                "metrics_port": 0
             }
         }
         
         try:
-            if os.path.exists(config_file):
+            if config is None:
+                if not os.path.exists(config_file):
+                    # Config dosyası yoksa oluştur
+                    self.save_config(default_config)
+                    return default_config
                 with open(config_file, 'r', encoding='utf-8') as f:
                     config = json.load(f)
-                    # Eksik ayarları varsayılan değerlerle doldur
-                    for key, value in default_config.items():
-                        if key not in config:
-                            config[key] = value
-                        elif isinstance(value, dict):
-                            for sub_key, sub_value in value.items():
-                                if sub_key not in config[key]:
-                                    config[key][sub_key] = sub_value
-                    return config
-            else:
-                # Config dosyası yoksa oluştur
-                self.save_config(default_config)
-                return default_config
+            
+            # Eksik ayarları varsayılan değerlerle doldur
+            for key, value in default_config.items():
+                if key not in config:
+                    config[key] = value
+                elif isinstance(value, dict):
+                    for sub_key, sub_value in value.items():
+                        if sub_key not in config[key]:
+                            config[key][sub_key] = sub_value
+            return config
         except Exception as e:
             print(f"⚠️ Config yükleme hatası: {e}")
             return default_config
@@ -97,6 +201,127 @@ class SpotifyPlaylistDownloader:
         except Exception as e:
             print(f"❌ Config kaydetme hatası: {e}")
     
+    def open_search_cache(self):
+        """Kalıcı arama önbelleğini aç (kapalıysa None)"""
+        settings = self.config.get('settings', {})
+        if not settings.get('search_cache', True):
+            return None
+        
+        try:
+            db_path = os.path.join(settings.get('cache_folder', '.cache'), 'search_cache.sqlite3')
+            return SearchCache(
+                db_path,
+                ttl_seconds=settings.get('search_cache_ttl_days', 30) * 24 * 3600,
+                max_entries=settings.get('search_cache_max_entries', 50000)
+            )
+        except Exception as e:
+            print(f"⚠️ Arama önbelleği açılamadı: {e}")
+            return None
+    
+    def open_failure_cache(self):
+        """Başarısız şarkı önbelleğini aç (kapalıysa None)"""
+        settings = self.config.get('settings', {})
+        if not settings.get('failure_cache', True):
+            return None
+        
+        try:
+            db_path = os.path.join(settings.get('cache_folder', '.cache'), 'failures.sqlite3')
+            return FailureCache(
+                db_path,
+                base_seconds=settings.get('failure_recheck_hours', 24) * 3600,
+                max_seconds=settings.get('failure_recheck_max_days', 90) * 24 * 3600
+            )
+        except Exception as e:
+            print(f"⚠️ Başarısız şarkı önbelleği açılamadı: {e}")
+            return None
+    
+    def list_failures(self):
+        """Başarısız şarkı kayıtlarını ve yeniden deneme zamanlarını yazdır"""
+        if not self.failure_cache:
+            print("ℹ️ Başarısız şarkı önbelleği kapalı")
+            return []
+        
+        entries = self.failure_cache.entries()
+        if not entries:
+            print("✅ Kayıtlı başarısız şarkı yok")
+            return entries
+        
+        now = time.time()
+        print(f"🚫 {len(entries)} başarısız şarkı:")
+        for entry in entries:
+            if entry['next_check'] <= now:
+                when = "sonraki çalıştırmada"
+            else:
+                when = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['next_check']))
+            reason = REASON_LABELS.get(entry['reason'], entry['reason'])
+            print(f"   {entry['track_id']}  {entry['name'] or '-'}")
+            print(f"      {reason}, {entry['attempts']} deneme, yeniden deneme: {when}"
+                  + (f" ({entry['detail']})" if entry['detail'] else ""))
+        return entries
+    
+    def clear_failures(self, track_ids=None):
+        """Başarısız şarkı kayıtlarını sil (verilmezse hepsi)"""
+        if not self.failure_cache:
+            print("ℹ️ Başarısız şarkı önbelleği kapalı")
+            return 0
+        
+        removed = self.failure_cache.clear(track_ids)
+        print(f"🗑️ {removed} başarısız şarkı kaydı silindi, sonraki çalıştırmada yeniden denenecek")
+        return removed
+    
+    def open_playlist_cache(self):
+        """Playlist meta veri önbelleğini aç (kapalıysa None)"""
+        settings = self.config.get('settings', {})
+        if not settings.get('playlist_cache', True):
+            return None
+        
+        try:
+            return PlaylistCache(os.path.join(settings.get('cache_folder', '.cache'), 'playlists'))
+        except Exception as e:
+            print(f"⚠️ Playlist önbelleği açılamadı: {e}")
+            return None
+    
+    def get_audio_store(self):
+        """
+        Ortak ses deposunu döndür (kapalıysa None)
+        
+        Klasör ayarlanmamışsa indirme klasörü altındaki .store kullanılır;
+        hardlink için depo ile playlist klasörleri aynı diskte olmalıdır.
+        """
+        if not self.use_audio_store:
+            return None
+        
+        root = (self.config.get('settings', {}).get('audio_store_folder')
+                or os.path.join(self.download_folder, '.store'))
+        if self._audio_store is None or self._audio_store.root != root:
+            try:
+                self._audio_store = AudioStore(root)
+            except Exception as e:
+                print(f"⚠️ Ses deposu açılamadı: {e}")
+                return None
+        return self._audio_store
+    
+    def collect_store_garbage(self, dry_run=False):
+        """Hiçbir playlist'ten bağlanmayan blob'ları sil"""
+        store = self.get_audio_store()
+        if not store:
+            print("ℹ️ Ses deposu kapalı (ayarlarda \"audio_store\": true yapın)")
+            return None
+        
+        result = store.collect_garbage(self.download_folder, dry_run=dry_run)
+        action = "silinecek" if dry_run else "silindi"
+        print(f"🗑️ {result['blobs']} blob'dan {result['removed']} tanesi {action} "
+              f"({result['freed_bytes'] / 1024 / 1024:.1f} MB)")
+        return result
+    
+    def start_metrics_server(self, port):
+        """Ölçümleri http://127.0.0.1:<port>/metrics adresinde sun"""
+        try:
+            self.metrics.serve(port)
+            print(f"📈 Ölçümler: http://127.0.0.1:{port}/metrics (JSON: /metrics.json)")
+        except OSError as e:
+            print(f"⚠️ Ölçüm sunucusu başlatılamadı: {e}")
+    
     def update_spotify_credentials(self, client_id, client_secret):
         """Spotify kimlik bilgilerini güncelle"""
         self.client_id = client_id
@@ -118,16 +343,82 @@ class SpotifyPlaylistDownloader:
     def connect_spotify(self):
         """Spotify API'ye bağlan"""
         try:
+            import spotipy
+            from spotipy.oauth2 import SpotifyClientCredentials
+            
             client_credentials_manager = SpotifyClientCredentials(
                 client_id=self.client_id,
                 client_secret=self.client_secret
             )
             self.sp = spotipy.Spotify(client_credentials_manager=client_credentials_manager)
+            # 429'lar her thread'de ayrı ayrı değil, hız sınırlayıcıda ele alınır
+            mount_central_retry(self.sp._session, self.sp.retries, self.sp.backoff_factor)
             print("✅ Spotify API'ye başarıyla bağlandı!")
         except Exception as e:
             print(f"❌ Spotify API bağlantı hatası: {e}")
             self.sp = None
     
+    def connect_spotify_async(self, on_done=None):
+        """
+        Spotify'a arka planda bağlan (spotipy importu dahil)
+        
+        Args:
+            on_done (callable): Bağlantı denemesi bitince True/False ile çağrılır
+        """
+        def connect():
+            self.connect_spotify()
+            if on_done:
+                on_done(self.sp is not None)
+        
+        self.connect_thread = threading.Thread(target=connect, name="spotify-connect", daemon=True)
+        self.connect_thread.start()
+    
+    def ensure_spotify(self):
+        """Arka planda bağlanılıyorsa bitmesini bekle ve istemciyi döndür"""
+        thread = self.connect_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        return self.sp
+    
+    def _spotify_call(self, func, *args, **kwargs):
+        """Spotify API çağrısını ortak hız sınırı ve Retry-After ile yap"""
+        import spotipy
+        
+        bucket = self.rate_limiter.get('spotify')
+        for attempt in range(self.rate_limit_retries + 1):
+            bucket.acquire()
+            try:
+                with self.metrics.timer('spotify'):
+                    result = func(*args, **kwargs)
+            except spotipy.SpotifyException as e:
+                if e.http_status != 429 or attempt == self.rate_limit_retries:
+                    raise
+                self.metrics.inc('spotify_throttled')
+                delay = bucket.backoff(parse_retry_after(e.headers))
+                print(f"⏳ Spotify hız sınırı (429), {delay:.1f} sn bekleniyor...")
+                continue
+            bucket.success()
+            return result
+    
+    def _youtube_search(self, ydl, search_query):
+        """ytsearch isteğini ortak hız sınırı ve geri çekilme ile yap"""
+        bucket = self.rate_limiter.get('youtube_search')
+        for attempt in range(self.rate_limit_retries + 1):
+            bucket.acquire()
+            try:
+                result = ydl.extract_info(search_query, download=False)
+            except Exception as e:
+                message = str(e).lower()
+                throttled = 'http error 429' in message or 'too many requests' in message
+                if not throttled or attempt == self.rate_limit_retries:
+                    raise
+                self.metrics.inc('search_throttled')
+                delay = bucket.backoff()
+                print(f"⏳ YouTube arama hız sınırı (429), {delay:.1f} sn bekleniyor...")
+                continue
+            bucket.success()
+            return result
+    
     def extract_playlist_id(self, playlist_url):
         """Spotify playlist URL'sinden playlist ID'sini çıkar"""
         patterns = [
@@ -145,69 +436,213 @@ class SpotifyPlaylistDownloader:
     
     def get_playlist_info(self, playlist_url):
         """Playlist bilgilerini al"""
-        if not self.sp:
-            print("❌ Spotify API bağlantısı yok!")
-            return None
-        
         playlist_id = self.extract_playlist_id(playlist_url)
         if not playlist_id:
             print("❌ Geçersiz playlist URL'si!")
             return None
         
+        # Çevrimdışı modda sadece önbellek kullanılır
+        if self.offline:
+            cached = self.playlist_cache.get(playlist_id) if self.playlist_cache else None
+            if not cached:
+                print("❌ Çevrimdışı mod: Playlist önbellekte bulunamadı!")
+                return None
+            self.playlist_infos[playlist_id] = cached['info']
+            return cached['info']
+        
+        if not self.ensure_spotify():
+            print("❌ Spotify API bağlantısı yok!")
+            return None
+        
         try:
-            playlist = self.sp.playlist(playlist_id)
-            return {
+            # Şarkılar olmadan, sadece gerekli alanları iste (hafif istek)
+            playlist = self._spotify_call(
+                self.sp.playlist,
+                playlist_id,
+                fields='name,description,snapshot_id,owner(display_name),tracks(total)'
+            )
+            playlist_info = {
                 'id': playlist_id,
                 'name': playlist['name'],
                 'description': playlist.get('description', ''),
                 'tracks_count': playlist['tracks']['total'],
-                'owner': playlist['owner']['display_name']
+                'owner': playlist['owner']['display_name'],
+                'snapshot_id': playlist.get('snapshot_id')
             }
+            self.playlist_infos[playlist_id] = playlist_info
+            return playlist_info
         except Exception as e:
             print(f"❌ Playlist bilgileri alınamadı: {e}")
             return None
     
     def get_playlist_tracks(self, playlist_url):
         """Playlist'teki tüm şarkıları al"""
-        if not self.sp:
-            print("❌ Spotify API bağlantısı yok!")
-            return []
+        return list(self.iter_playlist_tracks(playlist_url))
+    
+    def iter_playlist_tracks(self, playlist_url, on_page=None):
+        """
+        Playlist şarkılarını sayfalar geldikçe üret
         
-        playlist_id = self.extract_playlist_id(playlist_url)
-        if not playlist_id:
-            print("❌ Geçersiz playlist URL'si!")
-            return []
+        Sayfalar page_workers kadar paralel çekilir ama playlist sırasıyla
+        üretilir; bellekte en fazla birkaç sayfa bekler. Önbellek açıksa her
+        sayfa geçici dosyaya eklenir ve liste sonuna kadar okunursa kayıt
+        yerine konur; şarkılar bellekte biriktirilmez.
+        
+        Args:
+            playlist_url (str): Spotify playlist URL'si
+            on_page (callable): Her sayfanın şarkıları tüketildikten sonra
+                (loaded, total) ile çağrılır
+        """
+        source = self._track_source(playlist_url)
+        if source is None:
+            return
+        playlist_id, playlist_info, cached = source
+        if cached is not None:
+            yield from cached
+            if on_page:
+                on_page(len(cached), len(cached))
+            return
         
-        tracks = []
-        offset = 0
+        # Önbellek kaydı sayfa sayfa yazılır, sadece eksiksiz liste yerine konur
+        snapshot_id = playlist_info.get('snapshot_id') if playlist_info else None
+        cache_writer = None
+        if self.playlist_cache and snapshot_id:
+            cache_writer = self.playlist_cache.writer(playlist_id, snapshot_id, playlist_info)
         limit = 100
         
         try:
-            while True:
-                results = self.sp.playlist_tracks(playlist_id, offset=offset, limit=limit)
-                
-                for item in results['items']:
-                    track = item['track']
-                    if track:  # None olmayan track'ler
-                        track_info = {
-                            'name': track['name'],
-                            'artists': [artist['name'] for artist in track['artists']],
-                            'album': track['album']['name'],
-                            'duration_ms': track['duration_ms'],
-                            'external_urls': track['external_urls'],
-                            'id': track['id']
-                        }
-                        tracks.append(track_info)
-                
-                if len(results['items']) < limit:
-                    break
-                
-                offset += limit
-                
+            for offset, page in self._iter_track_pages(playlist_id, limit):
+                page_tracks = self._parse_track_items(page['items'])
+                if cache_writer:
+                    cache_writer.add([track.to_dict() for track in page_tracks])
+                yield from page_tracks
+                if on_page:
+                    on_page(offset + len(page['items']), page.get('total') or 0)
+            if cache_writer:
+                cache_writer.commit()
         except Exception as e:
             print(f"❌ Şarkılar alınamadı: {e}")
+            return
+        finally:
+            # Erken bırakılan veya hatayla biten liste önbelleğe yazılmaz
+            if cache_writer:
+                cache_writer.discard()
+    
+    def _iter_track_pages(self, playlist_id, limit):
+        """
+        Şarkı sayfalarını (offset, sayfa) olarak playlist sırasıyla üret
         
-        return tracks
+        İlk sayfa toplam şarkı sayısını verir; kalan sayfalar sınırlı bir
+        pencere içinde paralel çekilir.
+        """
+        first = self._fetch_track_page(playlist_id, 0, limit)
+        yield 0, first
+        
+        offsets = iter(range(limit, first.get('total') or 0, limit))
+        workers = max(1, self.page_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetch = lambda offset: (offset, executor.submit(self._fetch_track_page, playlist_id, offset, limit))
+            in_flight = deque(fetch(offset) for offset in itertools.islice(offsets, workers * 2))
+            try:
+                while in_flight:
+                    offset, future = in_flight.popleft()
+                    page = future.result()
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        in_flight.append(fetch(next_offset))
+                    yield offset, page
+            finally:
+                # Tüketici erken bırakırsa bekleyen sayfalar çekilmez
+                for _, future in in_flight:
+                    future.cancel()
+    
+    def _track_source(self, playlist_url):
+        """
+        Şarkıların nereden alınacağını belirle
+        
+        Returns:
+            tuple: (playlist_id, playlist_info, önbellekteki şarkılar veya None);
+                şarkılar alınamayacaksa None
+        """
+        playlist_id = self.extract_playlist_id(playlist_url)
+        if not playlist_id:
+            print("❌ Geçersiz playlist URL'si!")
+            return None
+        
+        # Snapshot bilinmiyorsa önce hafif playlist isteği yap
+        playlist_info = self.playlist_infos.pop(playlist_id, None) or self.get_playlist_info(playlist_url)
+        self.playlist_infos.pop(playlist_id, None)
+        snapshot_id = playlist_info.get('snapshot_id') if playlist_info else None
+        
+        # Playlist değişmediyse önbellekteki listeyi kullan
+        if self.playlist_cache and snapshot_id:
+            cached = self.playlist_cache.get(playlist_id, snapshot_id)
+            if cached:
+                print(f"💾 Playlist değişmemiş, şarkılar önbellekten alındı ({len(cached['tracks'])} şarkı)")
+                return playlist_id, playlist_info, [Track.from_dict(track) for track in cached['tracks']]
+        
+        if self.offline:
+            print("❌ Çevrimdışı mod: Şarkılar önbellekte bulunamadı!")
+            return None
+        
+        if not self.ensure_spotify():
+            print("❌ Spotify API bağlantısı yok!")
+            return None
+        
+        return playlist_id, playlist_info, None
+    
+    def _fetch_track_page(self, playlist_id, offset, limit):
+        """Tek bir şarkı sayfasını çek"""
+        return self._spotify_call(self.sp.playlist_tracks, playlist_id, offset=offset, limit=limit)
+    
+    def _cache_tracks(self, playlist_id, playlist_info, tracks):
+        """Sadece eksiksiz listeyi önbelleğe yaz"""
+        snapshot_id = playlist_info.get('snapshot_id') if playlist_info else None
+        if self.playlist_cache and snapshot_id:
+            self.playlist_cache.put(playlist_id, snapshot_id, playlist_info, [track.to_dict() for track in tracks])
+    
+    def _parse_track_items(self, items):
+        """Spotify sayfasındaki öğeleri şarkı bilgilerine dönüştür"""
+        # None olan öğeler (silinmiş/yerel şarkılar) atlanır
+        return [Track.from_spotify(item['track']) for item in items if item['track']]
+    
+    def _get_ydl(self, name, ydl_opts):
+        """
+        Bu thread'e ait, tekrar kullanılan YoutubeDL nesnesini döndür
+        
+        Extractor'lar ve HTTP bağlantıları şarkılar arasında yeniden kullanılır.
+        Her ayar seti (name) için thread başına bir nesne oluşturulur.
+        """
+        pool = getattr(self.ydl_local, 'pool', None)
+        if pool is None or getattr(self.ydl_local, 'generation', None) != self.ydl_generation:
+            pool = self.ydl_local.pool = {}
+            self.ydl_local.generation = self.ydl_generation
+        
+        ydl = pool.get(name)
+        if ydl is None:
+            import yt_dlp
+            ydl = yt_dlp.YoutubeDL(ydl_opts)
+            pool[name] = ydl
+            with self.lock:
+                self.ydl_instances.append(ydl)
+        return ydl
+    
+    def _set_outtmpl(self, ydl, outtmpl):
+        """Tekrar kullanılan YoutubeDL nesnesinin çıktı yolunu değiştir"""
+        ydl.params['outtmpl']['default'] = outtmpl
+    
+    def close_ydl_pool(self):
+        """Havuzdaki tüm YoutubeDL nesnelerini kapat"""
+        with self.lock:
+            instances = self.ydl_instances
+            self.ydl_instances = []
+            self.ydl_generation += 1
+        
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception:
+                pass
     
     def search_youtube(self, query):
         """YouTube'da şarkı ara (geliştirilmiş)"""
@@ -221,27 +656,36 @@ class SpotifyPlaylistDownloader:
                 'max_downloads': 3  # İlk 3 sonucu kontrol et
             }
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                results = ydl.extract_info(f"ytsearch3:{query}", download=False)
-                
-                if results and 'entries' in results and results['entries']:
-                    # En iyi sonucu seç (süre ve başlık uyumuna göre)
-                    best_match = self._find_best_match(query, results['entries'])
-                    if best_match:
-                        return {
-                            'id': best_match.get('id'),
-                            'title': best_match.get('title'),
-                            'duration': best_match.get('duration'),
-                            'url': f"https://www.youtube.com/watch?v={best_match.get('id')}"
-                        }
+            ydl = self._get_ydl('search_youtube', ydl_opts)
+            results = self._youtube_search(ydl, f"ytsearch3:{query}")
+            
+            if results and 'entries' in results and results['entries']:
+                # En iyi sonucu seç (süre ve başlık uyumuna göre)
+                best_match = self._find_best_match(query, results['entries'])
+                if best_match:
+                    return {
+                        'id': best_match.get('id'),
+                        'title': best_match.get('title'),
+                        'duration': best_match.get('duration'),
+                        'url': f"https://www.youtube.com/watch?v={best_match.get('id')}"
+                    }
         
         except Exception as e:
             print(f"❌ YouTube arama hatası: {e}")
         
         return None
     
-    def search_multiple_platforms(self, query):
+    def search_multiple_platforms(self, query, track_info=None):
         """Birden fazla platformda ara (geliştirilmiş)"""
+        track_id = track_info.id if track_info else None
+        
+        # Önbellekte varsa yt-dlp'ye hiç gitme
+        if self.search_cache:
+            cached = self.search_cache.get(query, track_id)
+            if cached:
+                print(f"💾 Önbellekten bulundu: {cached['title']}")
+                return cached
+        
         # Sadece YouTube'da ara (daha güvenilir)
         platforms = [
             ('YouTube', f"ytsearch5:{query}"),  # 5 sonuç kontrol et
@@ -250,103 +694,141 @@ class SpotifyPlaylistDownloader:
         for platform_name, search_query in platforms:
             try:
                 print(f"🔍 {platform_name}'da aranıyor...")
-                result = self._search_platform(search_query, platform_name)
+                result = self._search_platform(search_query, platform_name, track_info)
                 if result:
+                    if self.search_cache:
+                        self.search_cache.put(query, result, track_id)
                     return result
             except Exception as e:
                 print(f"❌ {platform_name} arama hatası: {str(e)[:100]}")
+                self.track_local.search_error = e
                 continue
         
         return None
     
-    def _search_platform(self, search_query, platform_name):
+    def _search_platform(self, search_query, platform_name, track_info=None):
         """Belirli bir platformda ara (geliştirilmiş)"""
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
             'extract_flat': True,
             'max_downloads': 5,
-            'ignoreerrors': True,
+            'ignoreerrors': False,  # 429 hız sınırlayıcıya ulaşmalı
             'nooverwrites': False,
             'retries': 3,
             'fragment_retries': 3,
             'skip_unavailable_fragments': True,
-            'extractor_retries': 3
+            'extractor_retries': 1  # Tekrar denemeler _youtube_search'te
         }
         
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                results = ydl.extract_info(search_query, download=False)
+            ydl = self._get_ydl('search', ydl_opts)
+            results = self._youtube_search(ydl, search_query)
+            
+            if results and 'entries' in results and results['entries']:
+                # Eşleştirmede albüm yerine şarkı adı + sanatçılar kullanılır
+                if track_info:
+                    match_query = f"{track_info.name} {' '.join(track_info.artists)}"
+                    duration_ms = track_info.duration_ms
+                else:
+                    match_query = search_query.split(':', 1)[1]
+                    duration_ms = None
                 
-                if results and 'entries' in results and results['entries']:
-                    # En iyi sonucu seç
-                    best_match = self._find_best_match(search_query.split(':', 1)[1], results['entries'])
-                    if best_match:
-                        return {
-                            'id': best_match.get('id'),
-                            'title': best_match.get('title'),
-                            'duration': best_match.get('duration'),
-                            'url': f"https://www.youtube.com/watch?v={best_match.get('id')}",
-                            'platform': platform_name
-                        }
+                # En iyi sonucu seç
+                best_match = self._find_best_match(match_query, results['entries'], duration_ms)
+                if best_match:
+                    return {
+                        'id': best_match.get('id'),
+                        'title': best_match.get('title'),
+                        'duration': best_match.get('duration'),
+                        'url': f"https://www.youtube.com/watch?v={best_match.get('id')}",
+                        'platform': platform_name
+                    }
         except Exception as e:
             print(f"❌ Platform arama hatası: {str(e)[:100]}")
+            self.track_local.search_error = e
+            if self.concurrency:
+                self.concurrency.record_error(e)
         
         return None
     
-    def _find_best_match(self, query, entries):
-        """En iyi eşleşmeyi bul"""
-        query_lower = query.lower()
+    def _find_best_match(self, query, entries, duration_ms=None):
+        """
+        En iyi eşleşmeyi bul (başlık benzerliği, süre farkı ve sürüm cezaları ile puanlama)
         
-        for entry in entries:
-            title = entry.get('title', '').lower()
-            
-            # Tam eşleşme kontrolü
-            if all(word in title for word in query_lower.split()):
-                return entry
-            
-            # Kısmi eşleşme kontrolü
-            if any(word in title for word in query_lower.split()):
-                return entry
-        
-        # Hiç eşleşme bulunamazsa ilk sonucu döndür
-        return entries[0] if entries else None
-    
-    def download_audio(self, video_url, output_path):
-        """YouTube'dan ses dosyası indir (geliştirilmiş hata yakalama)"""
-        # Farklı format seçenekleri dene
-        format_options = [
-            'bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio',
-            'bestaudio/best',
-            'worstaudio/worst',
-            'best[height<=720]/best'
-        ]
+        En iyi aday da match_min_score altındaysa None döner: yanlış sürümü
+        indirmek yerine şarkı bulunamadı sayılır.
+        """
+        scores = track_matcher.score_candidates(query, entries, duration_ms)
+        if not scores:
+            return None
+        
+        if self.match_debug:
+            print(f"🎯 Eşleşme puanları: {query}")
+            for item in scores:
+                entry = item['entry']
+                print(f"   {item['score']:+.3f} | metin {item['text_score']:.2f} | "
+                      f"süre farkı {item['duration_delta']} sn | {entry.get('title')}"
+                      + (f" | ceza: {', '.join(item['unwanted'])}" if item['unwanted'] else ""))
+        
+        best = scores[0]
+        if best['score'] < self.match_min_score:
+            print(f"⚠️ Uygun eşleşme yok: en iyi aday {best['score']:.2f} puan "
+                  f"(eşik {self.match_min_score:.2f}) - {best['entry'].get('title')}")
+            return None
+        return best['entry']
+    
+    def download_audio(self, video_url, output_path, resume_format=None, on_start=None):
+        """
+        YouTube'dan ses dosyası indir (tek sorgu ile format seçimi)
+        
+        Args:
+            video_url (str): Video adresi
+            output_path (str): Uzantısız hedef dosya yolu
+            resume_format (str): Yarım kalan .part dosyasının format kimliği
+            on_start (callable): Her format denemesinden önce format kimliği ile çağrılır
+        """
+        if self.cancel_event.is_set():
+            return False
         
-        for i, format_option in enumerate(format_options):
+        # Format listesini bir kez çek
+        info = self._probe_video(video_url)
+        if self.cancel_event.is_set():
+            return False
+        if not info:
+            # Son çare: Basit indirme yöntemi
+            print("🔄 Son çare yöntemi deneniyor...")
+            return self._simple_download(video_url, output_path)
+        
+        # En iyi ses formatlarını yerelde sırala
+        part_path = output_path + '.mp3.part'
+        part_format = resume_format if os.path.exists(part_path) else None
+        candidates = self._prefer_format(self._rank_audio_formats(info), part_format)
+        if not candidates:
+            print("🔄 Uygun format yok, son çare yöntemi deneniyor...")
+            return self._simple_download(video_url, output_path)
+        reextracted = False
+        i = 0
+        
+        while i < len(candidates):
+            fmt = candidates[i]
+            format_id = fmt.get('format_id')
             try:
-                print(f"🔄 Format {i+1} deneniyor: {format_option}")
-                
-                ydl_opts = {
-                    'format': format_option,
-                    'outtmpl': output_path + '.mp3',
-                    'writethumbnail': False,
-                    'embed_metadata': True,
-                    'add_metadata': True,
-                    'quiet': False,
-                    'no_warnings': False,
-                    'postprocessors': [],
-                    'prefer_ffmpeg': False,
-                    'keepvideo': False,
-                    'ignoreerrors': True,
-                    'nooverwrites': False,
-                    'retries': 3,
-                    'fragment_retries': 3,
-                    'skip_unavailable_fragments': True,
-                    'extractor_retries': 3
-                }
+                # Tüm formatlar aynı .part dosyasına yazar: başka formata ait
+                # yarım dosyanın üzerine eklenmemeli
+                if os.path.exists(part_path):
+                    if part_format and part_format == format_id:
+                        print(f"⏯️ Yarım kalan indirme sürdürülüyor ({os.path.getsize(part_path) // 1024} KB)")
+                    else:
+                        os.remove(part_path)
+                part_format = format_id
+                if on_start:
+                    on_start(format_id)
                 
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    ydl.download([video_url])
+                print(f"🔄 Format {i+1} deneniyor: {self._describe_format(fmt)}")
+                self.metrics.inc('format_attempts')
+                with self.metrics.timer('download', self._current_track_id()):
+                    self._download_format(info, fmt, output_path)
                 
                 # Dosyanın indirilip indirilmediğini kontrol et
                 if os.path.exists(output_path + '.mp3'):
@@ -356,14 +838,177 @@ class SpotifyPlaylistDownloader:
                     print(f"⚠️ Dosya oluşturulamadı, sonraki format deneniyor...")
                     
             except Exception as e:
+                # Durdurulduysa diğer formatları deneme
+                if self.cancel_event.is_set():
+                    print(f"⏹️ İndirme iptal edildi: {output_path}")
+                    return False
+                
                 print(f"❌ Format {i+1} hatası: {str(e)[:100]}")
-                continue
+                self.metrics.inc('format_errors')
+                if self.concurrency:
+                    self.concurrency.record_error(e)
+                
+                # Akış adresi geçersizse (süresi dolmuş vb.) bilgiyi bir kez yenile
+                if not reextracted and self._is_stream_error(e):
+                    print("🔄 Akış adresi geçersiz, video bilgisi yenileniyor...")
+                    reextracted = True
+                    self.metrics.inc('reprobes')
+                    info = self._probe_video(video_url)
+                    if not info:
+                        break
+                    candidates = self._prefer_format(self._rank_audio_formats(info), part_format)
+                    continue
+            
+            i += 1
         
         print(f"❌ Tüm formatlar başarısız oldu: {video_url}")
+        return False
+    
+    def _probe_video(self, video_url):
+        """Video bilgisini ve format listesini tek seferde çek"""
+        ydl_opts = {
+            'format': 'bestaudio/best',
+            'quiet': True,
+            'no_warnings': True,
+            'retries': 3,
+            'extractor_retries': 3
+        }
+        
+        try:
+            ydl = self._get_ydl('probe', ydl_opts)
+            with self.metrics.timer('probe', self._current_track_id()):
+                return ydl.extract_info(video_url, download=False)
+        except Exception as e:
+            print(f"❌ Video bilgisi alınamadı: {str(e)[:100]}")
+            return None
+    
+    def _rank_audio_formats(self, info):
+        """
+        Denenecek formatları seç
+        
+        Her kapsayıcıdan (m4a, webm...) en yüksek bit hızlı sadece-ses formatı
+        alınır ve bit hızına göre sıralanır (eşitlikte m4a önce); sonuna
+        yedek olarak bir sesli birleşik format (720p ve altı önce) eklenir.
+        Ses içermeyen formatlar (sadece görüntü, storyboard) hiç denenmez:
+        sessiz dosya başarılı indirme sayılırdı.
+        """
+        formats = info.get('formats') or [info]
+        ext_rank = {'m4a': 0, 'webm': 1}
+        
+        def bitrate(fmt):
+            return fmt.get('abr') or fmt.get('tbr') or 0
         
-        # Son çare: Basit indirme yöntemi
-        print("🔄 Son çare yöntemi deneniyor...")
-        return self._simple_download(video_url, output_path)
+        best_audio = {}
+        combined = []
+        for fmt in formats:
+            if fmt.get('acodec') == 'none' or not fmt.get('url'):
+                continue
+            if fmt.get('vcodec') == 'none':
+                ext = fmt.get('ext')
+                if ext not in best_audio or bitrate(fmt) > bitrate(best_audio[ext]):
+                    best_audio[ext] = fmt
+            else:
+                combined.append(fmt)
+        
+        ranked = sorted(best_audio.values(), key=lambda fmt: (-bitrate(fmt), ext_rank.get(fmt.get('ext'), 2)))
+        if combined:
+            ranked.append(min(combined, key=lambda fmt: ((fmt.get('height') or 0) > 720, -bitrate(fmt))))
+        return ranked
+    
+    def _prefer_format(self, candidates, format_id):
+        """Yarım kalan indirmenin formatını listenin başına al"""
+        if not format_id:
+            return candidates
+        preferred = [fmt for fmt in candidates if fmt.get('format_id') == format_id]
+        return preferred + [fmt for fmt in candidates if fmt.get('format_id') != format_id]
+    
+    def _describe_format(self, fmt):
+        """Log için kısa format açıklaması"""
+        bitrate = fmt.get('abr') or fmt.get('tbr')
+        text = f"{fmt.get('format_id')} ({fmt.get('ext')}"
+        if bitrate:
+            text += f", {bitrate:.0f} kbps"
+        return text + ")"
+    
+    def _download_format(self, info, fmt, output_path):
+        """Önceden çekilen bilgi ile seçilen formatı doğrudan indir"""
+        ydl_opts = {
+            'outtmpl': output_path + '.mp3',
+            'writethumbnail': False,
+            'embed_metadata': True,
+            'add_metadata': True,
+            'quiet': False,
+            'no_warnings': False,
+            'postprocessors': [],
+            'prefer_ffmpeg': False,
+            'keepvideo': False,
+            'ignoreerrors': False,  # Hatalar format sırasını yönetmek için yükselmeli
+            'continuedl': True,  # Yarım kalan .part dosyasına kaldığı bayttan devam et
+            'nopart': False,
+            'retries': 3,
+            'fragment_retries': 3,
+            'skip_unavailable_fragments': True,
+            'extractor_retries': 3,
+            'socket_timeout': 20,  # Durdurma en geç bu süre içinde etkili olur
+            'progress_hooks': [self._progress_hook]
+        }
+        
+        ydl = self._get_ydl('download', ydl_opts)
+        self._set_outtmpl(ydl, output_path + '.mp3')
+        ydl.format_selector = ydl.build_format_selector(fmt.get('format_id') or 'best')
+        ydl.process_ie_result(copy.deepcopy(info), download=True)
+    
+    def _progress_hook(self, d):
+        """
+        yt-dlp ilerleme kancası: her veri parçasında çağrılır
+        
+        Duraklatıldığında aktarım burada bekletilir, durdurulduğunda
+        DownloadCancelled ile kesilir (.part dosyası silinmez).
+        """
+        if self.concurrency:
+            self.concurrency.record_progress(d)
+        if d.get('status') == 'finished':
+            self.metrics.inc('downloaded_bytes', d.get('downloaded_bytes') or d.get('total_bytes') or 0)
+        if self.progress_notify:
+            self._emit_bytes(d)
+        if not self.resume_event.is_set():
+            self.resume_event.wait()
+        if self.cancel_event.is_set():
+            import yt_dlp
+            raise yt_dlp.utils.DownloadCancelled('İndirme kullanıcı tarafından durduruldu')
+    
+    def _emit_bytes(self, d):
+        """İndirilen bayt olayını şarkı başına en fazla 2 kez/sn bildir"""
+        track = getattr(self.track_local, 'track', None)
+        if track is None:
+            return
+        now = time.monotonic()
+        finished = d.get('status') == 'finished'
+        if not finished and now - getattr(self.track_local, 'last_bytes', 0) < 0.5:
+            return
+        self.track_local.last_bytes = now
+        self._emit('bytes', track=track, downloaded=d.get('downloaded_bytes'),
+                   total=d.get('total_bytes') or d.get('total_bytes_estimate'),
+                   speed=d.get('speed'), finished=finished)
+    
+    def _current_track_id(self):
+        """Bu thread'de indirilen şarkının ID'si (ölçümler için)"""
+        track = getattr(self.track_local, 'track', None)
+        return track.id if track else None
+    
+    def _emit(self, event, **data):
+        """Çalışan indirmenin ilerleme bildirimine aşama olayı gönder"""
+        notify = self.progress_notify
+        if notify:
+            notify(event, **data)
+    
+    def _is_stream_error(self, error):
+        """Hata akış adresinin kendisinden mi kaynaklanıyor?"""
+        message = str(error).lower()
+        return any(code in message for code in (
+            'http error 403', 'http error 404', 'http error 410',
+            'unable to download video data', 'unable to download'
+        ))
     
     def _simple_download(self, video_url, output_path):
         """Basit indirme yöntemi (son çare)"""
@@ -374,15 +1019,19 @@ class SpotifyPlaylistDownloader:
                 'quiet': False,
                 'no_warnings': False,
                 'ignoreerrors': True,
-                'nooverwrites': False,
+                'continuedl': True,
+                'nopart': False,
                 'retries': 5,
                 'fragment_retries': 5,
                 'skip_unavailable_fragments': True,
-                'extractor_retries': 5
+                'extractor_retries': 5,
+                'socket_timeout': 20,
+                'progress_hooks': [self._progress_hook]
             }
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_url])
+            ydl = self._get_ydl('download:simple', ydl_opts)
+            self._set_outtmpl(ydl, output_path + '.%(ext)s')
+            ydl.download([video_url])
             
             # Dosya var mı kontrol et
             for ext in ['mp4', 'webm', 'm4a', 'mp3']:
@@ -405,23 +1054,50 @@ class SpotifyPlaylistDownloader:
             filename = filename[:200]
         return filename.strip()
     
-    def download_track(self, track_info, playlist_name):
-        """Tek bir şarkıyı indir"""
-        track_name = track_info['name']
-        artists = ', '.join(track_info['artists'])
-        album = track_info['album']
+    def _find_downloaded_file(self, output_path):
+        """İndirilen dosyanın gerçek yolunu bul"""
+        for ext in ['mp3', 'mp4', 'webm', 'm4a']:
+            if os.path.exists(output_path + '.' + ext):
+                return output_path + '.' + ext
+        return None
+
+    def download_track(self, track_info, playlist_name, manifest=None):
+        """Tek bir şarkıyı indir (track_info: Track veya eski dict biçimi)"""
+        if isinstance(track_info, dict):
+            track_info = Track.from_dict(track_info)
+        
+        youtube_result = self.resolve_track(track_info)
+        if not youtube_result:
+            return False
+        
+        return self.fetch_track(track_info, youtube_result, playlist_name, manifest)
+    
+    def resolve_track(self, track_info):
+        """Şarkıyı YouTube'da ara (arama aşaması)"""
+        if self.cancel_event.is_set():
+            return None
+        self.track_local.search_error = None
+        
+        track_name = track_info.name
+        artists = ', '.join(track_info.artists)
+        album = track_info.album
         
         # Arama sorgusu oluştur
         search_query = f"{track_name} {artists} {album}"
-        print(f"🔍 Aranıyor: {search_query}")
         
         # Birden fazla platformda ara
         print(f"🔍 Aranıyor: {search_query}")
-        youtube_result = self.search_multiple_platforms(search_query)
+        youtube_result = self.search_multiple_platforms(search_query, track_info)
         
         if not youtube_result:
             print(f"❌ Bulunamadı: {track_name} - {artists}")
-            return False
+        
+        return youtube_result
+    
+    def fetch_track(self, track_info, youtube_result, playlist_name, manifest=None, journal=None):
+        """Bulunan şarkıyı indir (indirme aşaması)"""
+        track_name = track_info.name
+        artists = ', '.join(track_info.artists)
         
         # Dosya adı oluştur
         safe_filename = self.sanitize_filename(f"{track_name} - {artists}")
@@ -433,87 +1109,1130 @@ class SpotifyPlaylistDownloader:
         platform = youtube_result.get('platform', 'YouTube')
         print(f"⬇️ İndiriliyor: {track_name} - {artists} ({platform})")
         
-        # İndir
-        success = self.download_audio(youtube_result['url'], output_path)
+        # İndir (yarım kalan aktarım varsa aynı formatla devam edilir)
+        track_id = track_info.id
+        resume_format = None
+        on_start = None
+        if journal is not None and track_id:
+            entry = journal.get(track_id) or {}
+            resume_format = entry.get('format_id')
+            on_start = lambda format_id: journal.started(track_id, youtube_result, format_id)
+        
+        # Aynı video ortak depoda varsa indirmeden bağla
+        store = self.get_audio_store()
+        blob = store.find(youtube_result.get('id')) if store else None
+        if blob:
+            with self.metrics.timer('disk', track_id):
+                store.link(blob, output_path + os.path.splitext(blob)[1])
+            self.metrics.inc('store_links')
+            print(f"🗄️ Depodan bağlandı: {track_name} - {artists}")
+            success = True
+        else:
+            success = self.download_audio(youtube_result['url'], output_path,
+                                          resume_format=resume_format, on_start=on_start)
         
         if success:
             print(f"✅ Tamamlandı: {track_name} - {artists}")
-        else:
+
+            with self.metrics.timer('disk', track_id):
+                # Depoya taşı, yerine bağlantı koy
+                file_path = self._find_downloaded_file(output_path)
+                if store and file_path and not blob:
+                    try:
+                        store.add(file_path, youtube_result.get('id'))
+                    except OSError as e:
+                        print(f"⚠️ Depoya eklenemedi: {e}")
+                
+                # Manifest'e kaydet (sonraki çalıştırmada atlanır)
+                if manifest is not None and file_path:
+                    manifest.record(track_id, file_path, youtube_result.get('id'))
+                if journal is not None:
+                    journal.finished(track_id)
+                if self.failure_cache:
+                    self.failure_cache.remove(track_id)
+        elif not self.cancel_event.is_set():
             print(f"❌ Başarısız: {track_name} - {artists}")
+            # Aynı video tekrar denenmesin: yeniden deneme zamanı gelince şarkı
+            # baştan aranır (günlük kaydı _download_stage'de silinir)
+            if self.search_cache:
+                self.search_cache.delete(track_id=track_id)
+            if self.failure_cache:
+                self._record_failure(track_info, DOWNLOAD_FAILED, youtube_result.get('url'))
+        
+        return success
+    
+    def _record_failure(self, track, reason, detail=None):
+        """Başarısız şarkıyı kaydet, sonraki deneme zamanını yazdır"""
+        try:
+            entry = self.failure_cache.record(track.id, reason, f"{track.name} - {', '.join(track.artists)}",
+                                              detail)
+        except Exception as e:
+            print(f"⚠️ Başarısız şarkı kaydedilemedi: {e}")
+            return
+        if entry:
+            hours = (entry['next_check'] - entry['last_failed']) / 3600
+            print(f"🚫 {track.name}: {entry['attempts']}. başarısızlık, {hours:.0f} saat sonra yeniden denenecek")
+    
+    def _is_known_failure(self, track):
+        """Şarkı daha önce başarısız olduysa ve yeniden deneme zamanı gelmediyse True"""
+        if not self.failure_cache:
+            return False
+        try:
+            entry = self.failure_cache.should_skip(track.id)
+        except Exception as e:
+            print(f"⚠️ Başarısız şarkı önbelleği okunamadı: {e}")
+            return False
+        if entry:
+            self.metrics.inc('known_failures_skipped')
+        return entry is not None
+    
+    def run_pipeline(self, tracks, playlist_name, manifest=None, search_workers=None, download_workers=None,
+                     journal=None, route=None):
+        """
+        Şarkıları iki aşamalı (arama -> indirme) hat üzerinden işle
+        
+        Arama ve indirme için ayrı worker havuzları kullanılır, aşamalar
+        sınırlı kuyruklarla bağlanır. Biten her şarkı için (track, success)
+        döndürülür; sonuçlar tamamlanma sırasıyla gelir. journal verilirse
+        önceki çalıştırmada bulunan sonuçlar yeniden aranmaz. route verilirse
+        her şarkı için (playlist_name, manifest, journal) ondan alınır
+        (birden fazla playlist tek kuyrukta işlenirken).
+        
+        self.concurrency ayarlıysa üst sınır kadar indirme worker'ı açılır,
+        aynı anda kaçının çalışacağına denetleyici karar verir.
+        """
+        search_workers = max(1, search_workers or self.search_workers)
+        download_workers = max(1, download_workers or self.max_workers)
+        controller = self.concurrency
+        if controller:
+            download_workers = controller.ceiling
+        
+        # Sınırlı kuyruklar: bellekte sadece işlenmekte olan şarkılar tutulur
+        search_queue = queue.Queue(maxsize=search_workers * 2)
+        download_queue = queue.Queue(maxsize=download_workers * 2)
+        result_queue = queue.Queue()
+        
+        remaining_searchers = [search_workers]
+        searchers_lock = threading.Lock()
+        
+        # Aşamalar hata verse de bitiş işaretleri (None) her zaman gönderilir;
+        # yoksa sonraki aşama ve sonuç döngüsü sonsuza kadar bekler
+        def producer():
+            try:
+                for track in tracks:
+                    # Duraklatılmışsa devam edilene kadar bekle
+                    self.resume_event.wait()
+                    if self.cancel_event.is_set():
+                        break
+                    search_queue.put(track)
+            except Exception as e:
+                print(f"❌ Şarkı listesi okunamadı: {e}")
+            finally:
+                for _ in range(search_workers):
+                    search_queue.put(None)
+        
+        def search_worker():
+            try:
+                while True:
+                    track = search_queue.get()
+                    if track is None:
+                        break
+                    self.resume_event.wait()
+                    if self.cancel_event.is_set():
+                        continue
+                    try:
+                        track_journal = route(track)[2] if route else journal
+                        youtube_result = self._search_stage(track, track_journal)
+                    except Exception as e:
+                        print(f"❌ Arama hatası: {track.name} - {e}")
+                        youtube_result = None
+                    
+                    if youtube_result:
+                        download_queue.put((track, youtube_result))
+                    elif not self.cancel_event.is_set():
+                        result_queue.put((track, False))
+            finally:
+                # Son biten arama worker'ı indirme worker'larını sonlandırır
+                with searchers_lock:
+                    remaining_searchers[0] -= 1
+                    last = remaining_searchers[0] == 0
+                if last:
+                    for _ in range(download_workers):
+                        download_queue.put(None)
+        
+        def download_worker():
+            try:
+                while True:
+                    item = download_queue.get()
+                    if item is None:
+                        break
+                    self.resume_event.wait()
+                    if self.cancel_event.is_set():
+                        continue
+                    track, youtube_result = item
+                    try:
+                        target = route(track) if route else (playlist_name, manifest, journal)
+                        success = self._download_stage(track, youtube_result, *target)
+                    except Exception as e:
+                        print(f"❌ Hata: {track.name} - {e}")
+                        success = False
+                    
+                    # İptal edilen aktarımlar başarısız sayılmaz
+                    if success is None:
+                        continue
+                    result_queue.put((track, success))
+            finally:
+                result_queue.put(None)
+        
+        threads = [threading.Thread(target=producer, name="pipeline-producer", daemon=True)]
+        threads += [threading.Thread(target=search_worker, name=f"search-{i}", daemon=True)
+                    for i in range(search_workers)]
+        threads += [threading.Thread(target=download_worker, name=f"download-{i}", daemon=True)
+                    for i in range(download_workers)]
+        for thread in threads:
+            thread.start()
+        
+        # Tüm indirme worker'ları bitene kadar sonuçları ilet
+        finished_downloaders = 0
+        while finished_downloaders < download_workers:
+            try:
+                result = result_queue.get()
+            except KeyboardInterrupt:
+                # İlk Ctrl+C: devam eden aktarımları kes ve düzgün kapan
+                if self.cancel_event.is_set():
+                    raise
+                print("\n⏹️ Durduruluyor... (hemen çıkmak için tekrar Ctrl+C)")
+                self.cancel()
+                continue
+            if result is None:
+                finished_downloaders += 1
+                continue
+            yield result
+    
+    def _search_stage(self, track, journal=None):
+        """Arama aşaması: önce çalıştırma günlüğüne, sonra YouTube'a bak"""
+        started = time.perf_counter()
+        youtube_result = journal.resolved_result(track.id) if journal is not None else None
+        if youtube_result:
+            print(f"📒 Günlükten: {track.name} -> {youtube_result.get('title', '')}")
+        else:
+            try:
+                youtube_result = self.resolve_track(track)
+                # Sadece arama hatasız bittiyse "bulunamadı" kaydedilir
+                if (not youtube_result and self.failure_cache and not self.cancel_event.is_set()
+                        and getattr(self.track_local, 'search_error', None) is None):
+                    self._record_failure(track, NOT_FOUND)
+            except Exception as e:
+                print(f"❌ Arama hatası: {track.name} - {e}")
+                youtube_result = None
+            if youtube_result and journal is not None:
+                journal.resolved(track.id, youtube_result)
+        
+        seconds = time.perf_counter() - started
+        self.metrics.observe('search', seconds, track.id)
+        if youtube_result:
+            self._emit('resolved', track=track, result=youtube_result, seconds=seconds)
+        return youtube_result
+    
+    def _download_stage(self, track, youtube_result, playlist_name, manifest=None, journal=None):
+        """
+        İndirme aşaması
+        
+        Returns:
+            bool: İndirme sonucu; iptal edildiyse None (başarısız sayılmaz)
+        """
+        # Otomatik modda denetleyici izin verene kadar bekle
+        controller = self.concurrency
+        if controller:
+            controller.acquire()
+        success = False
+        try:
+            if not self.cancel_event.is_set():
+                self.track_local.track = track
+                self._emit('started', track=track, result=youtube_result)
+                with self.metrics.timer('fetch', track.id):
+                    success = self.fetch_track(track, youtube_result, playlist_name, manifest, journal)
+        except Exception as e:
+            print(f"❌ Hata: {track.name} - {e}")
+        finally:
+            self.track_local.track = None
+            if controller:
+                if not self.cancel_event.is_set():
+                    controller.record_result(success)
+                controller.release()
         
+        if not success and self.cancel_event.is_set():
+            return None
+        # Sadece iptal/çökmede sürdürülür: başarısız şarkının eski sonucu tekrar kullanılmaz
+        if not success and journal is not None:
+            journal.discard(track.id)
         return success
     
-    def download_playlist(self, playlist_url, max_workers=None):
+    def cancel(self):
+        """İndirmeyi durdur: yeni şarkı başlatılmaz, devam eden aktarımlar kesilir"""
+        self.cancel_event.set()
+        self.resume_event.set()
+        if self.concurrency:
+            self.concurrency.wake()
+    
+    def pause(self):
+        """İndirmeyi duraklat: devam eden aktarımlar da bekletilir"""
+        self.resume_event.clear()
+    
+    def resume(self):
+        """Duraklatılan indirmeye devam et"""
+        self.resume_event.set()
+    
+    def is_paused(self):
+        """İndirme duraklatılmış mı?"""
+        return not self.resume_event.is_set()
+    
+    def install_signal_handlers(self):
+        """Komut satırında SIGUSR1 ile duraklat/devam et (yalnızca POSIX)"""
+        if not hasattr(signal, 'SIGUSR1'):
+            return
+        
+        def toggle_pause(signum, frame):
+            if self.is_paused():
+                self.resume()
+                print("\n▶️ Devam ediliyor...")
+            else:
+                self.pause()
+                print("\n⏸️ Duraklatıldı (devam için tekrar SIGUSR1 gönderin)")
+        
+        signal.signal(signal.SIGUSR1, toggle_pause)
+    
+    def download_playlist(self, playlist_url, max_workers=None, progress_callback=None):
+        """
+        Tüm playlist'i indir
+        
+        Args:
+            playlist_url (str): Spotify playlist URL'si
+            max_workers (int): Paralel indirme sayısı
+            progress_callback (callable): (event, data) ile çağrılır; event
+                'playlist', 'tracks' (her Spotify sayfasından sonra güncel
+                sayılar), 'resolved', 'started', 'bytes', 'track', 'finished'
+                veya 'playlist_error' (playlist alınamadı) olur. 'resolved', 'started' ve 'bytes' arama/indirme
+                worker thread'lerinden, diğerleri indirmeyi yürüten thread'den
+                çağrılır.
+        """
         if max_workers is None:
             max_workers = self.max_workers
-        """Tüm playlist'i indir"""
+        notify = self._make_notifier(progress_callback)
+        self.progress_notify = notify
+        
+        self.cancel_event.clear()
+        self.resume_event.set()
+        self.metrics.reset()
+        
         print("🎵 Spotify Playlist İndirici Başlatılıyor...")
         print("=" * 50)
         
         # Playlist bilgilerini al
         playlist_info = self.get_playlist_info(playlist_url)
         if not playlist_info:
+            notify('playlist_error', url=playlist_url, reason='unavailable')
+            return False
+        self._print_playlist_info(playlist_info)
+        
+        # Şarkılar sayfa geldikçe işlenir: ilk indirme ilk sayfayla başlar
+        run = None
+        
+        def on_page(loaded, total):
+            # İlk şarkı gelmeden biten sayfalar (örn. tamamı silinmiş şarkılar) için run henüz yok
+            if run is not None:
+                notify('tracks', loaded=loaded, total=total, pending=run['total'], skipped=run['skipped'])
+        
+        tracks = self.iter_playlist_tracks(playlist_url, on_page=on_page)
+        first = next(tracks, None)
+        if first is None:
+            print("❌ Hiç şarkı bulunamadı!")
+            notify('playlist_error', url=playlist_url, reason='empty')
             return False
         
+        run = self._start_run(playlist_info, itertools.chain([first], tracks), max_workers, notify,
+                              streaming=True)
+        
+        # Arama ve indirme aşamaları ayrı havuzlarda paralel çalışır
+        for track, success in self.run_pipeline(run['pending'], run['folder_name'], run['manifest'],
+                                                download_workers=max_workers, journal=run['journal']):
+            self._record_result(run, track, success, notify)
+        
+        self._finish_run(run, notify)
+        return True
+    
+    def download_playlists(self, playlist_urls, max_workers=None, progress_callback=None):
+        """
+        Birden fazla playlist'i tek bir ortak kuyrukla indir
+        
+        Aynı Spotify şarkısı birden fazla playlist'te olsa da yalnızca bir
+        kez aranır ve indirilir; diğer playlist klasörlerine dosyanın hardlink'i
+        (desteklenmiyorsa kopyası) konur.
+        
+        Args:
+            playlist_urls (list): Spotify playlist URL'leri
+            max_workers (int): Paralel indirme sayısı
+            progress_callback (callable): (event, data) ile çağrılır; event
+                'playlist_error' (alınamayan her playlist için), 'batch',
+                'track' veya 'finished' olur
+        """
+        if max_workers is None:
+            max_workers = self.max_workers
+        notify = self._make_notifier(progress_callback)
+        self.progress_notify = notify
+        
+        self.cancel_event.clear()
+        self.resume_event.set()
+        self.metrics.reset()
+        
+        print(f"📚 Toplu indirme: {len(playlist_urls)} playlist")
+        print("=" * 50)
+        
+        # Tüm playlist'leri hazırla
+        runs = []
+        playlist_errors = []
+        for playlist_url in playlist_urls:
+            if self.cancel_event.is_set():
+                break
+            playlist_info = self.get_playlist_info(playlist_url)
+            if not playlist_info:
+                print(f"⚠️ Atlanıyor: {playlist_url}")
+                playlist_errors.append(playlist_url)
+                notify('playlist_error', url=playlist_url, reason='unavailable')
+                continue
+            self._print_playlist_info(playlist_info)
+            
+            tracks = self.get_playlist_tracks(playlist_url)
+            if not tracks:
+                print(f"❌ Hiç şarkı bulunamadı, atlanıyor: {playlist_info['name']}")
+                playlist_errors.append(playlist_url)
+                notify('playlist_error', url=playlist_url, reason='empty')
+                continue
+            runs.append(self._open_playlist(playlist_info, tracks))
+        
+        if not runs:
+            print("❌ İndirilecek playlist yok!")
+            return False
+        self._profile_mark('şarkı listeleri alındı')
+        
+        # Ortak kuyruk: her şarkı bir kez, ilk playlist'ine indirilir
+        owners = {}
+        queued = []
+        seen = set()
+        for run in runs:
+            for track in run['pending']:
+                key = track.id or id(track)
+                # Aynı playlist'te iki kez geçen şarkı o playlist'e bir kez sayılır
+                if (key, id(run)) in seen:
+                    continue
+                seen.add((key, id(run)))
+                if key in owners:
+                    owners[key].append(run)
+                    continue
+                
+                # Başka bir playlist'te zaten indirilmişse sadece bağla
+                existing = self._find_downloaded_track(track.id, runs)
+                if existing:
+                    self._share_track_file(existing, track, run)
+                    continue
+                
+                owners[key] = [run]
+                queued.append(track)
+        
+        duplicates = sum(len(targets) - 1 for targets in owners.values())
+        linked_before = sum(run['linked'] for run in runs)
+        print(f"🔗 {len(queued)} benzersiz şarkı indirilecek, {duplicates} tekrar bir kez indirilecek, "
+              f"{linked_before} şarkı başka playlist'ten bağlandı")
+        print("=" * 50)
+        notify('batch', playlists=[run['name'] for run in runs], total=len(queued),
+               duplicates=duplicates, linked=linked_before)
+        
+        batch = {
+            'total': len(queued),
+            'successful': 0,
+            'failed': 0,
+            'cache_before': self.search_cache.stats() if self.search_cache else None,
+            'limits_before': self.rate_limiter.stats()
+        }
+        self._start_concurrency(max_workers)
+        
+        def route(track):
+            run = owners[track.id or id(track)][0]
+            return run['folder_name'], run['manifest'], run['journal']
+        
+        for track, success in self.run_pipeline(queued, None, download_workers=max_workers, route=route):
+            targets = owners[track.id or id(track)]
+            targets[0]['successful' if success else 'failed'] += 1
+            if not success:
+                for run in targets[1:]:
+                    run['failed'] += 1
+            
+            # Diğer playlist'lere bağla
+            if success and len(targets) > 1:
+                source = targets[0]['manifest'].file_path(track.id)
+                if source:
+                    for run in targets[1:]:
+                        if run is not targets[0]:
+                            self._share_track_file(source, track, run)
+            
+            self._record_result(batch, track, success, notify)
+        
+        self._profile_mark('indirmeler bitti')
+        with self.metrics.timer('disk'):
+            for run in runs:
+                run['manifest'].save()
+                run['journal'].save()
+        self.close_ydl_pool()
+        controller = self.concurrency
+        self.concurrency = None
+        self.progress_notify = None
+        
+        # Özet
+        print("=" * 50)
+        if self.cancel_event.is_set():
+            print("⏹️ Toplu indirme durduruldu!")
+        else:
+            print("🎉 Toplu İndirme Tamamlandı!")
+        for run in runs:
+            print(f"📁 {run['name']}: ✅ {run['successful']} ❌ {run['failed']} "
+                  f"🔗 {run['linked']} ⏭️ {run['skipped']} 🚫 {run['known_failures']}")
+        print(f"✅ Başarılı: {batch['successful']}")
+        print(f"❌ Başarısız: {batch['failed']}")
+        print(f"♻️ Tekrar eden şarkılar: {duplicates} (bir kez indirildi)")
+        if playlist_errors:
+            print(f"⚠️ Alınamayan playlist: {len(playlist_errors)}")
+        self._print_run_stats(batch, controller)
+        
+        notify('finished', successful=batch['successful'], failed=batch['failed'],
+               skipped=sum(run['skipped'] for run in runs),
+               known_failures=sum(run['known_failures'] for run in runs), folder=self.download_folder,
+               cancelled=self.cancel_event.is_set(), playlist_errors=len(playlist_errors))
+        return True
+    
+    def _find_downloaded_track(self, track_id, runs):
+        """Şarkı playlist'lerden birinde tamamlanmışsa dosya yolunu döndür"""
+        if not track_id:
+            return None
+        for run in runs:
+            path = run['manifest'].file_path(track_id)
+            if path:
+                return path
+        return None
+    
+    def _share_track_file(self, source_path, track, run):
+        """İndirilmiş dosyayı başka bir playlist klasörüne bağla veya kopyala"""
+        target_path = os.path.join(run['path'], os.path.basename(source_path))
+        try:
+            if not os.path.exists(target_path):
+                self._link_or_copy(source_path, target_path)
+            run['manifest'].record(track.id, target_path)
+            run['linked'] += 1
+            print(f"🔗 Bağlandı: {track.name} -> {run['name']}")
+        except OSError as e:
+            print(f"❌ Bağlantı hatası: {track.name} - {e}")
+    
+    def _link_or_copy(self, source_path, target_path):
+        """Hardlink oluştur; dosya sistemi desteklemiyorsa kopyala"""
+        store = self.get_audio_store()
+        if store:
+            store.link(os.path.realpath(source_path), target_path)
+            return
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            shutil.copy2(source_path, target_path)
+    
+    async def download_playlist_async(self, playlist_url, max_workers=None, search_workers=None,
+                                      progress_callback=None):
+        """
+        download_playlist'in asyncio sürümü
+        
+        Spotify sayfaları, aramalar ve indirmeler tek bir olay döngüsünde
+        görev (task) olarak çalışır; her aşamanın eşzamanlılığı ayrı bir
+        semaphore ile sınırlanır. Bloklayan yt-dlp/spotipy çağrıları küçük
+        bir thread havuzunda yürütülür. Görev iptal edilirse devam eden
+        aktarımlar da durdurulur.
+        
+        Args:
+            playlist_url (str): Spotify playlist URL'si
+            max_workers (int): Aynı anda yapılacak indirme sayısı
+            search_workers (int): Aynı anda yapılacak arama sayısı
+            progress_callback (callable): download_playlist ile aynı olaylar;
+                worker thread'lerinde oluşan olaylar dahil tüm çağrılar olay
+                döngüsünün thread'inden yapılır
+        """
+        import asyncio
+        
+        if max_workers is None:
+            max_workers = self.max_workers
+        search_workers = max(1, search_workers or self.search_workers)
+        notify = self._make_notifier(progress_callback)
+        loop = asyncio.get_running_loop()
+        self.progress_notify = self._loop_notifier(loop, notify)
+        
+        self.cancel_event.clear()
+        self.resume_event.set()
+        self.metrics.reset()
+        
+        # Bloklayan çağrılar için küçük thread havuzu (aşama sınırlarının toplamı kadar)
+        io_workers = search_workers + (self.auto_workers_max if self.auto_workers else max(1, max_workers))
+        executor = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="async-io")
+        
+        def blocking(func, *args):
+            return loop.run_in_executor(executor, functools.partial(func, *args))
+        
+        run = None
+        tasks = set()
+        try:
+            print("🎵 Spotify Playlist İndirici Başlatılıyor...")
+            print("=" * 50)
+            
+            playlist_info = await blocking(self.get_playlist_info, playlist_url)
+            if not playlist_info:
+                notify('playlist_error', url=playlist_url, reason='unavailable')
+                return False
+            self._print_playlist_info(playlist_info)
+            
+            tracks = await self._get_playlist_tracks_async(playlist_url, blocking, io_workers)
+            if not tracks:
+                print("❌ Hiç şarkı bulunamadı!")
+                notify('playlist_error', url=playlist_url, reason='empty')
+                return False
+            
+            run = self._start_run(playlist_info, tracks, max_workers, notify)
+            download_limit = self.concurrency.ceiling if self.concurrency else max(1, max_workers)
+            search_semaphore = asyncio.Semaphore(search_workers)
+            download_semaphore = asyncio.Semaphore(download_limit)
+            # Bellekte aynı anda tutulan görev sayısı sınırlı
+            window = asyncio.Semaphore((search_workers + download_limit) * 2)
+            
+            async def process(track):
+                try:
+                    async with search_semaphore:
+                        await self._wait_if_paused_async()
+                        if self.cancel_event.is_set():
+                            return
+                        youtube_result = await blocking(self._search_stage, track, run['journal'])
+                    
+                    if not youtube_result:
+                        if not self.cancel_event.is_set():
+                            self._record_result(run, track, False, notify)
+                        return
+                    
+                    async with download_semaphore:
+                        await self._wait_if_paused_async()
+                        if self.cancel_event.is_set():
+                            return
+                        success = await blocking(self._download_stage, track, youtube_result,
+                                                 run['folder_name'], run['manifest'], run['journal'])
+                    if success is not None:
+                        self._record_result(run, track, success, notify)
+                finally:
+                    window.release()
+            
+            for track in run['pending']:
+                await window.acquire()
+                if self.cancel_event.is_set():
+                    window.release()
+                    break
+                task = asyncio.create_task(process(track))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            
+            await asyncio.gather(*list(tasks))
+        except asyncio.CancelledError:
+            # Görev iptali: thread'lerdeki aktarımları da durdur
+            self.cancel()
+            for task in list(tasks):
+                task.cancel()
+            await asyncio.gather(*list(tasks), return_exceptions=True)
+            raise
+        finally:
+            # Thread'ler iptal sinyaliyle hızla biter; olay döngüsünü bloklamadan bekle
+            await loop.run_in_executor(None, functools.partial(executor.shutdown, wait=True))
+            if run is not None:
+                self._finish_run(run, notify)
+        
+        return True
+    
+    async def _get_playlist_tracks_async(self, playlist_url, blocking, max_pages):
+        """Şarkı sayfalarını ayrı görevler olarak çek (playlist sırası korunur)"""
+        import asyncio
+        
+        source = await blocking(self._track_source, playlist_url)
+        if source is None:
+            return []
+        playlist_id, playlist_info, cached = source
+        if cached is not None:
+            return cached
+        
+        limit = 100
+        try:
+            results = await blocking(self._fetch_track_page, playlist_id, 0, limit)
+            tracks = self._parse_track_items(results['items'])
+            
+            semaphore = asyncio.Semaphore(max(1, min(self.page_workers, max_pages)))
+            
+            async def fetch(offset):
+                async with semaphore:
+                    return await blocking(self._fetch_track_page, playlist_id, offset, limit)
+            
+            offsets = range(limit, results.get('total') or 0, limit)
+            for page in await asyncio.gather(*(fetch(offset) for offset in offsets)):
+                tracks.extend(self._parse_track_items(page['items']))
+        except Exception as e:
+            print(f"❌ Şarkılar alınamadı: {e}")
+            return []
+        
+        self._cache_tracks(playlist_id, playlist_info, tracks)
+        return tracks
+    
+    async def _wait_if_paused_async(self):
+        """Duraklatılmışsa olay döngüsünü bloklamadan bekle"""
+        import asyncio
+        
+        while not self.resume_event.is_set():
+            await asyncio.sleep(0.2)
+    
+    def _make_notifier(self, progress_callback):
+        """İlerleme bildirimi fonksiyonu (geri çağırma hataları indirmeyi durdurmaz)"""
+        def notify(event, **data):
+            if progress_callback:
+                try:
+                    progress_callback(event, data)
+                except Exception as e:
+                    print(f"⚠️ İlerleme bildirimi hatası: {e}")
+        return notify
+    
+    def _loop_notifier(self, loop, notify):
+        """Worker thread'lerinde oluşan olayları olay döngüsünün thread'ine aktar"""
+        loop_thread = threading.get_ident()
+        
+        def threadsafe_notify(event, **data):
+            if threading.get_ident() == loop_thread:
+                notify(event, **data)
+            else:
+                try:
+                    loop.call_soon_threadsafe(functools.partial(notify, event, **data))
+                except RuntimeError:
+                    pass  # Olay döngüsü kapandı
+        return threadsafe_notify
+    
+    def _profile_mark(self, label):
+        """--profile ile çalışılıyorsa aşama sınırında bellek görüntüsü al"""
+        profiling.mark(label, self.download_folder)
+    
+    def _print_playlist_info(self, playlist_info):
+        """Playlist başlık bilgilerini yazdır"""
         print(f"📋 Playlist: {playlist_info['name']}")
         print(f"👤 Sahip: {playlist_info['owner']}")
         print(f"🎵 Şarkı Sayısı: {playlist_info['tracks_count']}")
         print(f"📝 Açıklama: {playlist_info['description']}")
         print("=" * 50)
+    
+    def _start_run(self, playlist_info, tracks, max_workers, notify, streaming=False):
+        """
+        Tek playlist indirmesini başlat
         
-        # Şarkıları al
-        tracks = self.get_playlist_tracks(playlist_url)
-        if not tracks:
-            print("❌ Hiç şarkı bulunamadı!")
-            return False
-        
-        print(f"📥 {len(tracks)} şarkı bulundu, indirme başlıyor...")
-        print("=" * 50)
+        Args:
+            streaming (bool): tracks sayfa geldikçe üretilen bir iterator;
+                sayılar şarkılar geldikçe güncellenir
         
+        Returns:
+            dict: İndirme boyunca kullanılan durum (sayaçlar dahil)
+        """
+        run = self._open_playlist(playlist_info, tracks, streaming)
+        self._profile_mark('ilk sayfa alındı' if streaming else 'şarkı listesi alındı')
+        notify('playlist', info=playlist_info, folder=run['path'],
+               total=playlist_info['tracks_count'] if streaming else len(tracks),
+               pending=run['total'], skipped=run['skipped'], streaming=streaming)
+        self._start_concurrency(max_workers)
+        run['cache_before'] = self.search_cache.stats() if self.search_cache else None
+        run['limits_before'] = self.rate_limiter.stats()
+        return run
+    
+    def _open_playlist(self, playlist_info, tracks, streaming=False):
+        """Klasör, manifest ve günlüğü hazırla, indirilecek şarkıları belirle"""
         # Playlist klasörü oluştur
         playlist_folder = self.sanitize_filename(playlist_info['name'])
         playlist_path = os.path.join(self.download_folder, playlist_folder)
         os.makedirs(playlist_path, exist_ok=True)
         
-        # İndirme istatistikleri
-        total_tracks = len(tracks)
-        successful_downloads = 0
-        failed_downloads = 0
-        
-        # Threading ile paralel indirme
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Future'ları oluştur
-            future_to_track = {
-                executor.submit(self.download_track, track, playlist_folder): track 
-                for track in tracks
-            }
+        # Manifest ile karşılaştır, sadece yeni/eksik şarkıları indir
+        manifest = PlaylistManifest(playlist_path)
+        journal = RunJournal(playlist_path)
+        
+        if streaming:
+            # Sayılar şarkılar geldikçe artar; yarım kalan aktarımlar sırası
+            # geldiğinde günlükteki formatla sürdürülür
+            run = {'skipped': 0, 'total': 0, 'known_failures': 0}
+            run['pending'] = self._stream_pending(run, manifest, tracks)
+            print("📥 Şarkılar sayfa sayfa alınıyor, indirme ilk sayfayla başlıyor...")
+        else:
+            pending_tracks = manifest.pending(tracks)
+            skipped_tracks = len(tracks) - len(pending_tracks)
             
-            # Sonuçları topla
-            for future in as_completed(future_to_track):
-                track = future_to_track[future]
-                try:
-                    success = future.result()
-                    if success:
-                        successful_downloads += 1
-                    else:
-                        failed_downloads += 1
-                except Exception as e:
-                    print(f"❌ Hata: {track['name']} - {e}")
-                    failed_downloads += 1
-                
-                # İlerleme göster
-                completed = successful_downloads + failed_downloads
-                progress = (completed / total_tracks) * 100
-                print(f"📊 İlerleme: {completed}/{total_tracks} ({progress:.1f}%)")
+            # Daha önce bulunamayan/indirilemeyen şarkılar deneme zamanına kadar atlanır
+            missing_count = len(pending_tracks)
+            pending_tracks = [track for track in pending_tracks if not self._is_known_failure(track)]
+            known_failures = missing_count - len(pending_tracks)
+            
+            # Önceki çalıştırmada yarıda kalan aktarımlar önce sürdürülür
+            interrupted = sum(1 for track in pending_tracks if journal.in_flight(track.id))
+            if interrupted:
+                pending_tracks.sort(key=lambda track: not journal.in_flight(track.id))
+            
+            print(f"📥 {len(tracks)} şarkı bulundu, {len(pending_tracks)} şarkı indirilecek...")
+            if skipped_tracks:
+                print(f"⏭️ {skipped_tracks} şarkı zaten indirilmiş, atlanıyor")
+            if known_failures:
+                print(f"🚫 {known_failures} şarkı daha önce başarısız oldu, yeniden deneme zamanı gelmedi "
+                      f"(--clear-failures ile sıfırlanır)")
+            if interrupted:
+                print(f"⏯️ {interrupted} yarım kalan indirme sürdürülecek")
+            run = {'pending': pending_tracks, 'skipped': skipped_tracks, 'total': len(pending_tracks),
+                   'known_failures': known_failures}
+        print("=" * 50)
+        
+        run.update({
+            'name': playlist_info['name'],
+            'folder_name': playlist_folder,
+            'path': playlist_path,
+            'manifest': manifest,
+            'journal': journal,
+            'successful': 0,
+            'failed': 0,
+            'linked': 0
+        })
+        return run
+    
+    def _stream_pending(self, run, manifest, tracks):
+        """İndirilmiş şarkıları atlayarak kalanları üret, sayıları güncelle"""
+        for track in tracks:
+            if track.id and manifest.is_complete(track.id):
+                run['skipped'] += 1
+                continue
+            if self._is_known_failure(track):
+                run['known_failures'] += 1
+                continue
+            run['total'] += 1
+            yield track
+    
+    def _start_concurrency(self, max_workers):
+        """Otomatik modda paralellik çalışırken ayarlanır"""
+        if self.auto_workers:
+            self.concurrency = AdaptiveConcurrency(
+                floor=self.auto_workers_min,
+                ceiling=self.auto_workers_max,
+                initial=max_workers,
+                stop_event=self.cancel_event
+            )
+            print(f"🤖 Otomatik paralellik: {self.concurrency.limit} worker "
+                  f"({self.concurrency.floor}-{self.concurrency.ceiling} arası)")
+    
+    def _record_result(self, run, track, success, notify):
+        """Biten şarkıyı say ve ilerlemeyi bildir"""
+        if success:
+            run['successful'] += 1
+        else:
+            run['failed'] += 1
+        self.metrics.inc('tracks_succeeded' if success else 'tracks_failed')
+        
+        # İlerleme göster
+        completed = run['successful'] + run['failed']
+        progress = (completed / run['total']) * 100
+        print(f"📊 İlerleme: {completed}/{run['total']} ({progress:.1f}%)")
+        notify('track', track=track, success=success, completed=completed, total=run['total'],
+               successful=run['successful'], failed=run['failed'])
+    
+    def _finish_run(self, run, notify):
+        """Kayıtları diske yaz, kaynakları kapat ve özeti yazdır"""
+        self._profile_mark('indirmeler bitti')
+        if hasattr(run['pending'], 'close'):
+            # Durdurulduysa kalan Spotify sayfaları çekilmez
+            run['pending'].close()
+        with self.metrics.timer('disk'):
+            run['manifest'].save()
+            run['journal'].save()
+        self.close_ydl_pool()
+        controller = self.concurrency
+        self.concurrency = None
+        self.progress_notify = None
         
         # Özet
         print("=" * 50)
-        print("🎉 İndirme Tamamlandı!")
-        print(f"✅ Başarılı: {successful_downloads}")
-        print(f"❌ Başarısız: {failed_downloads}")
-        print(f"📁 Klasör: {playlist_path}")
+        if self.cancel_event.is_set():
+            print("⏹️ İndirme durduruldu!")
+        else:
+            print("🎉 İndirme Tamamlandı!")
+        print(f"✅ Başarılı: {run['successful']}")
+        print(f"❌ Başarısız: {run['failed']}")
+        print(f"⏭️ Atlanan: {run['skipped']}")
+        if run['known_failures']:
+            print(f"🚫 Daha önce başarısız (atlandı): {run['known_failures']}")
+        print(f"📁 Klasör: {run['path']}")
+        self._print_run_stats(run, controller)
         
-        return True
+        notify('finished', successful=run['successful'], failed=run['failed'],
+               skipped=run['skipped'], known_failures=run['known_failures'], folder=run['path'],
+               cancelled=self.cancel_event.is_set())
+    
+    def _print_run_stats(self, run, controller=None):
+        """Önbellek, hız sınırı ve paralellik istatistiklerini yazdır"""
+        if self.search_cache:
+            cache_before = run['cache_before']
+            cache_after = self.search_cache.stats()
+            hits = cache_after['hits'] - cache_before['hits']
+            misses = cache_after['misses'] - cache_before['misses']
+            print(f"💾 Arama önbelleği: {hits} isabet / {misses} ıska")
+        
+        for name, stats in self.rate_limiter.stats().items():
+            before = run['limits_before'].get(name, {'waited': 0.0, 'throttled': 0})
+            waited = stats['waited'] - before['waited']
+            throttled = stats['throttled'] - before['throttled']
+            if waited >= 0.1 or throttled:
+                print(f"⏳ Hız sınırı ({name}): {waited:.1f} sn toplam bekleme, {throttled} adet 429")
+        
+        if controller:
+            print(f"🤖 Otomatik paralellik: son değer {controller.limit}, "
+                  f"{len(controller.decisions)} değişiklik")
+        
+        self.metrics.print_breakdown()
+        self._export_metrics()
+    
+    def _export_metrics(self):
+        """Ölçümleri ayarlardaki dosyalara yaz (JSON ve/veya Prometheus)"""
+        for path, write in ((self.metrics_file, self.metrics.write_json),
+                            (self.metrics_prometheus_file, self.metrics.write_prometheus)):
+            if not path:
+                continue
+            try:
+                write(path)
+                print(f"📈 Ölçümler yazıldı: {path}")
+            except OSError as e:
+                print(f"⚠️ Ölçümler yazılamadı: {e}")
+
+# Etkileşimsiz mod çıkış kodları
+EXIT_OK = 0
+EXIT_TRACK_FAILURES = 1      # Bazı şarkılar indirilemedi
+EXIT_USAGE = 2               # Hatalı argüman (argparse ile aynı)
+EXIT_PLAYLIST_ERROR = 3      # Playlist alınamadı / indirilecek şarkı yok (toplu indirmede en az biri)
+EXIT_CANCELLED = 130         # Ctrl+C ile durduruldu
+
+class JsonProgressWriter:
+    """İlerleme olaylarını JSON-lines olarak yazan progress_callback"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.search_seconds = {}
+        self.download_started = {}
+        self.summary = None
+    
+    def __call__(self, event, data):
+        track = data.get('track')
+        key = (track.id or track.name) if track else None
+        record = {'event': event}
+        
+        if event == 'playlist':
+            record.update(name=data['info']['name'], folder=data['folder'], total=data['total'],
+                          pending=data['pending'], skipped=data['skipped'],
+                          streaming=data.get('streaming', False))
+        elif event == 'tracks':
+            record.update(loaded=data['loaded'], total=data['total'], pending=data['pending'],
+                          skipped=data['skipped'])
+        elif event == 'playlist_error':
+            record.update(url=data['url'], reason=data['reason'])
+        elif event == 'batch':
+            record.update(playlists=data['playlists'], total=data['total'],
+                          duplicates=data['duplicates'], linked=data['linked'])
+        elif event == 'resolved':
+            self.search_seconds[key] = data['seconds']
+            record.update(self._track_fields(track), video_id=data['result'].get('id'),
+                          title=data['result'].get('title'), seconds=round(data['seconds'], 3))
+        elif event == 'started':
+            self.download_started[key] = time.perf_counter()
+            record.update(self._track_fields(track), video_id=data['result'].get('id'))
+        elif event == 'bytes':
+            record.update(track_id=track.id, downloaded=data['downloaded'],
+                          total=data['total'], speed=data['speed'])
+        elif event == 'track':
+            # Şarkı sonucu: indirme ve toplam süre ile
+            started = self.download_started.pop(key, None)
+            search = self.search_seconds.pop(key, None)
+            download = time.perf_counter() - started if started is not None else None
+            record['event'] = 'finished' if data['success'] else 'failed'
+            record.update(self._track_fields(track),
+                          search_seconds=None if search is None else round(search, 3),
+                          download_seconds=None if download is None else round(download, 3),
+                          completed=data['completed'], total=data['total'])
+        elif event == 'finished':
+            # Çalıştırma özeti (şarkı 'finished' olayından ayırmak için)
+            self.summary = data
+            record.update(event='summary', successful=data['successful'], failed=data['failed'],
+                          skipped=data['skipped'], known_failures=data.get('known_failures', 0),
+                          playlist_errors=data.get('playlist_errors', 0), cancelled=data['cancelled'],
+                          elapsed=round(time.time() - self.started, 3))
+        else:
+            return
+        
+        record['time'] = round(time.time(), 3)
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with self.lock:
+            self.stream.write(line + '\n')
+            self.stream.flush()
+    
+    def _track_fields(self, track):
+        return {'track_id': track.id, 'name': track.name, 'artists': list(track.artists)}
+
+def build_arg_parser():
+    """Etkileşimsiz mod argümanları"""
+    parser = argparse.ArgumentParser(
+        description="Spotify playlist indirici. Argümansız çalıştırılırsa etkileşimli menü açılır.",
+        epilog="Çıkış kodları: 0 başarılı, 1 bazı şarkılar başarısız, 2 hatalı kullanım, "
+               "3 playlist(lerden biri) alınamadı, 130 durduruldu"
+    )
+    parser.add_argument('urls', nargs='*', metavar='URL', help="Spotify playlist URL'leri")
+    parser.add_argument('-f', '--file', help="Her satırda bir playlist URL'si bulunan dosya")
+    parser.add_argument('-o', '--output', help="İndirme klasörü")
+    parser.add_argument('-w', '--workers', help="Paralel indirme sayısı veya 'auto'")
+    parser.add_argument('--search-workers', type=int, help="Paralel arama sayısı")
+    parser.add_argument('--cache-folder', help="Önbellek klasörü")
+    parser.add_argument('--no-search-cache', action='store_true', help="Arama önbelleğini kullanma")
+    parser.add_argument('--no-playlist-cache', action='store_true', help="Playlist önbelleğini kullanma")
+    parser.add_argument('--no-failure-cache', action='store_true',
+                        help="Daha önce başarısız olan şarkıları atlamadan hepsini dene")
+    parser.add_argument('--offline', action='store_true', help="Sadece önbellekteki playlist'leri kullan")
+    parser.add_argument('--audio-store', action='store_true', help="Ortak ses deposunu kullan")
+    parser.add_argument('--json', action='store_true',
+                        help="stdout'a JSON-lines ilerleme olayları yaz (loglar stderr'e gider)")
+    parser.add_argument('--metrics-json', metavar='DOSYA', help="Aşama ölçümlerini JSON olarak yaz")
+    parser.add_argument('--metrics-prom', metavar='DOSYA', help="Aşama ölçümlerini Prometheus metni olarak yaz")
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help="Ölçümleri http://127.0.0.1:PORT/metrics adresinde sun")
+    parser.add_argument('--gc', action='store_true', help="Ses deposundaki bağlantısız blob'ları sil ve çık")
+    parser.add_argument('--failures', action='store_true',
+                        help="Bulunamayan/indirilemeyen şarkıları ve yeniden deneme zamanlarını listele")
+    parser.add_argument('--clear-failures', action='store_true',
+                        help="Başarısız şarkı kayıtlarını sil (hepsi sonraki çalıştırmada yeniden denenir)")
+    parser.add_argument('--profile', action='store_true',
+                        help="cProfile ve tracemalloc raporlarını indirme klasöründeki 'profiles' altına yaz")
+    parser.add_argument('--test', action='store_true', help="YouTube indirme testi")
+    return parser
+
+def apply_cli_options(downloader, args):
+    """Argümanları downloader'a uygula (config.json değiştirilmez)"""
+    settings = downloader.config.setdefault('settings', {})
+    
+    if args.output:
+        downloader.download_folder = args.output
+        os.makedirs(args.output, exist_ok=True)
+    if args.workers:
+        if args.workers == 'auto':
+            downloader.auto_workers = True
+        else:
+            downloader.max_workers = int(args.workers)
+            downloader.auto_workers = False
+    if args.search_workers:
+        downloader.search_workers = args.search_workers
+    if args.offline:
+        downloader.offline = True
+    if args.audio_store:
+        downloader.use_audio_store = True
+    if args.metrics_json:
+        downloader.metrics_file = args.metrics_json
+    if args.metrics_prom:
+        downloader.metrics_prometheus_file = args.metrics_prom
+    if args.metrics_port:
+        downloader.start_metrics_server(args.metrics_port)
+    
+    # Önbellekler yeni ayarlarla yeniden açılır
+    if args.cache_folder or args.no_search_cache or args.no_playlist_cache or args.no_failure_cache:
+        if args.cache_folder:
+            settings['cache_folder'] = args.cache_folder
+        if args.no_search_cache:
+            settings['search_cache'] = False
+        if args.no_playlist_cache:
+            settings['playlist_cache'] = False
+        if args.no_failure_cache:
+            settings['failure_cache'] = False
+        if downloader.search_cache:
+            downloader.search_cache.close()
+        downloader.search_cache = downloader.open_search_cache()
+        if downloader.failure_cache:
+            downloader.failure_cache.close()
+        downloader.failure_cache = downloader.open_failure_cache()
+        downloader.playlist_cache = downloader.open_playlist_cache()
+
+def run_headless(args):
+    """
+    Argümanlarla etkileşimsiz çalıştır
+    
+    Returns:
+        int: Çıkış kodu
+    """
+    if args.workers and args.workers != 'auto' and not args.workers.isdigit():
+        print("❌ --workers bir sayı veya 'auto' olmalı", file=sys.stderr)
+        return EXIT_USAGE
+    
+    playlist_urls = list(args.urls)
+    if args.file:
+        if not os.path.isfile(args.file):
+            print(f"❌ URL dosyası bulunamadı: {args.file}", file=sys.stderr)
+            return EXIT_USAGE
+        playlist_urls += read_playlist_urls(args.file)
+    
+    maintenance = args.gc or args.failures or args.clear_failures
+    if not playlist_urls and not maintenance:
+        print("❌ En az bir playlist URL'si veya --file gerekli", file=sys.stderr)
+        return EXIT_USAGE
+    
+    # JSON modunda stdout sadece olaylara ayrılır
+    events_stream = sys.stdout
+    log_stream = sys.stderr if args.json else sys.stdout
+    
+    with contextlib.redirect_stdout(log_stream):
+        downloader = SpotifyPlaylistDownloader()
+        apply_cli_options(downloader, args)
+        downloader.install_signal_handlers()
+        
+        if args.gc:
+            downloader.collect_store_garbage()
+        if args.failures:
+            downloader.list_failures()
+        if args.clear_failures:
+            downloader.clear_failures()
+        if maintenance and not playlist_urls:
+            return EXIT_OK
+        
+        writer = JsonProgressWriter(events_stream)
+        
+        def progress(event, data):
+            if args.json:
+                writer(event, data)
+            elif event == 'finished':
+                writer.summary = data
+        
+        try:
+            if len(playlist_urls) == 1:
+                started = downloader.download_playlist(playlist_urls[0], progress_callback=progress)
+            else:
+                started = downloader.download_playlists(playlist_urls, progress_callback=progress)
+        except KeyboardInterrupt:
+            downloader.cancel()
+            return EXIT_CANCELLED
+    
+    summary = writer.summary
+    if not started or summary is None:
+        return EXIT_PLAYLIST_ERROR
+    if summary['cancelled']:
+        return EXIT_CANCELLED
+    if summary.get('playlist_errors'):
+        return EXIT_PLAYLIST_ERROR
+    if summary['failed']:
+        return EXIT_TRACK_FAILURES
+    return EXIT_OK
 
 def main():
     """Ana fonksiyon"""
@@ -522,6 +2241,7 @@ def main():
     
     # Downloader oluştur
     downloader = SpotifyPlaylistDownloader()
+    downloader.install_signal_handlers()
     
     # Spotify API bilgileri kontrol et
     if not downloader.client_id or not downloader.client_secret:
@@ -549,10 +2269,13 @@ def main():
         print("\n" + "=" * 50)
         print("📋 Menü:")
         print("1. Playlist İndir")
-        print("2. Ayarları Düzenle")
-        print("3. Çıkış")
+        print("2. Toplu Playlist İndir")
+        print("3. Ayarları Düzenle")
+        print("4. Ses Deposunu Temizle")
+        print("5. Başarısız Şarkılar")
+        print("6. Çıkış")
         
-        choice = input("\nSeçiminiz (1-3): ").strip()
+        choice = input("\nSeçiminiz (1-6): ").strip()
         
         if choice == '1':
             # Playlist indirme
@@ -566,16 +2289,56 @@ def main():
             downloader.download_playlist(playlist_url)
             
         elif choice == '2':
+            # Birden fazla playlist (URL listesi veya dosya)
+            source = input("Playlist URL'leri (boşlukla ayrılmış) veya URL dosyası: ").strip()
+            playlist_urls = read_playlist_urls(source)
+            
+            if not playlist_urls:
+                print("❌ En az bir URL gerekli!")
+                continue
+            
+            downloader.download_playlists(playlist_urls)
+            
+        elif choice == '3':
             # Ayarları düzenle
             edit_settings(downloader)
             
-        elif choice == '3':
+        elif choice == '4':
+            # Bağlantısı kalmamış blob'ları sil
+            if downloader.collect_store_garbage(dry_run=True):
+                if input("Silinsin mi? (y/n): ").strip().lower() == 'y':
+                    downloader.collect_store_garbage()
+            
+        elif choice == '5':
+            # Bulunamayan/indirilemeyen şarkıları listele ve sıfırla
+            if downloader.list_failures():
+                answer = input("Silinecek şarkı ID'leri (boşlukla ayrılmış, hepsi için 'all', "
+                               "vazgeçmek için boş): ").strip()
+                if answer.lower() == 'all':
+                    downloader.clear_failures()
+                elif answer:
+                    downloader.clear_failures(answer.split())
+            
+        elif choice == '6':
             print("👋 Görüşürüz!")
             break
         
         else:
             print("❌ Geçersiz seçim!")
 
+def read_playlist_urls(source):
+    """
+    Playlist URL listesini oku
+    
+    source bir dosya yoluysa her satır bir URL'dir (boş satırlar ve # ile
+    başlayanlar atlanır); değilse boşluk veya virgülle ayrılmış URL'ler.
+    """
+    if source and os.path.isfile(source):
+        with open(source, 'r', encoding='utf-8') as f:
+            lines = [line.strip() for line in f]
+        return [line for line in lines if line and not line.startswith('#')]
+    return [url for url in re.split(r'[\s,]+', source or '') if url]
+
 def edit_settings(downloader):
     """Ayarları düzenle"""
     print("\n⚙️ Ayarlar")
@@ -614,10 +2377,21 @@ def edit_settings(downloader):
         elif choice == '3':
             # Paralel indirme sayısını değiştir
             try:
-                new_workers = int(input("Yeni paralel indirme sayısı (1-10): ").strip())
+                answer = input("Yeni paralel indirme sayısı (1-10, otomatik için 'auto'): ").strip().lower()
+                if answer == 'auto':
+                    downloader.auto_workers = True
+                    downloader.config['settings']['auto_workers'] = True
+                    downloader.save_config(downloader.config)
+                    print(f"✅ Otomatik paralellik açıldı "
+                          f"({downloader.auto_workers_min}-{downloader.auto_workers_max} arası)")
+                    continue
+                
+                new_workers = int(answer)
                 if 1 <= new_workers <= 10:
                     downloader.max_workers = new_workers
+                    downloader.auto_workers = False
                     downloader.config['settings']['max_workers'] = new_workers
+                    downloader.config['settings']['auto_workers'] = False
                     downloader.save_config(downloader.config)
                     print(f"✅ Paralel indirme sayısı güncellendi: {new_workers}")
                 else:
@@ -657,11 +2431,28 @@ def test_youtube_download():
         if os.path.exists(f"{test_output}.{ext}"):
             os.remove(f"{test_output}.{ext}")
             print(f"🧹 Test dosyası silindi: {test_output}.{ext}")
+    
+    return success
 
 if __name__ == "__main__":
-    import sys
+    args = build_arg_parser().parse_args()
+    profiler = None
+    if args.profile:
+        profiler = profiling.RunProfiler()
+        profiler.start()
     
-    if len(sys.argv) > 1 and sys.argv[1] == "--test":
-        test_youtube_download()
-    else:
-        main()
+    try:
+        if args.test:
+            exit_code = EXIT_OK if test_youtube_download() else EXIT_TRACK_FAILURES
+        elif not [arg for arg in sys.argv[1:] if arg != '--profile']:
+            # Argüman yoksa etkileşimli menü
+            main()
+            exit_code = EXIT_OK
+        else:
+            exit_code = run_headless(args)
+    finally:
+        if profiler:
+            # JSON modunda stdout sadece olaylara ayrılır
+            with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+                profiler.stop()
+    sys.exit(exit_code)
@@ -0,0 +1,63 @@
+import sys
+
+
+class Track:
+    """
+    Spotify şarkısı
+
+    Şarkı başına dict yerine __slots__ kullanan küçük bir kayıt. Sanatçı ve
+    albüm adları intern edilir: büyük playlist'lerde aynı sanatçı/albüm
+    adı bellekte tek kopya tutulur. Spotify'ın external_urls sözlüğü yerine
+    sadece şarkı adresi saklanır.
+    """
+
+    __slots__ = ('id', 'name', 'artists', 'album', 'duration_ms', 'url')
+
+    def __init__(self, id, name, artists=(), album='', duration_ms=None, url=None):
+        self.id = id
+        self.name = name
+        self.artists = tuple(sys.intern(artist) for artist in artists)
+        self.album = sys.intern(album) if album else album
+        self.duration_ms = duration_ms
+        self.url = url
+
+    @classmethod
+    def from_spotify(cls, track):
+        """Spotify API'sindeki şarkı kaydından oluştur"""
+        return cls(
+            track['id'],
+            track['name'],
+            [artist['name'] for artist in track['artists']],
+            track['album']['name'],
+            track.get('duration_ms'),
+            (track.get('external_urls') or {}).get('spotify')
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict çıktısından (veya eski dict biçiminden) oluştur"""
+        url = data.get('url')
+        if url is None:
+            url = (data.get('external_urls') or {}).get('spotify')
+        return cls(
+            data.get('id'),
+            data.get('name', ''),
+            data.get('artists') or (),
+            data.get('album') or '',
+            data.get('duration_ms'),
+            url
+        )
+
+    def to_dict(self):
+        """Önbellek ve JSON çıktısı için dict"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'artists': list(self.artists),
+            'album': self.album,
+            'duration_ms': self.duration_ms,
+            'url': self.url
+        }
+
+    def __repr__(self):
+        return f"Track({self.id!r}, {self.name!r}, {', '.join(self.artists)!r})"
@@ -0,0 +1,100 @@
+import re
+import unicodedata
+
+# Başlıkta olup sorguda olmayan bu kelimeler yanlış sürüm işaretidir
+VERSION_WORDS = {
+    'live', 'canli', 'konser', 'concert', 'cover', 'remix', 'karaoke',
+    'instrumental', 'enstrumantal', 'acoustic', 'akustik', 'slowed', 'reverb',
+    'sped', 'nightcore', '8d', 'loop', 'hour', 'hours', 'saat', 'reaction',
+    'tutorial', 'mashup', 'edit', 'version', 'versiyon'
+}
+
+# Bu puanın altındaki en iyi aday da reddedilir (şarkı bulunamadı sayılır).
+# Süresi tutmayan canlı kayıtlar ve saatlik döngüler ~0.3 ve altında kalır.
+MIN_SCORE = 0.5
+
+# Eşleşmeyi etkilemeyen dolgu kelimeler
+NOISE_WORDS = {
+    'official', 'video', 'audio', 'music', 'lyrics', 'lyric', 'hd', 'hq',
+    'klip', 'sozleri', 'feat', 'ft', 'the', 'a', 've', 'and', 'mv', 'topic'
+}
+
+
+def normalize_text(text):
+    """Türkçe harfleri de kapsayan büyük/küçük harf ve aksan normalizasyonu"""
+    text = (text or '').replace('İ', 'i').replace('I', 'ı').casefold()
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return text.replace('ı', 'i')
+
+
+def tokenize(text):
+    """Normalize edilmiş kelime kümesi"""
+    return set(re.findall(r'\w+', normalize_text(text)))
+
+
+def score_candidates(query, entries, duration_ms=None):
+    """
+    Tüm adayları tek seferde puanla
+
+    Args:
+        query (str): Şarkı adı ve sanatçılar
+        entries (list): yt-dlp arama sonuçları
+        duration_ms (int): Spotify'daki şarkı süresi
+
+    Returns:
+        list: En yüksek puandan başlayarak sıralı puan kayıtları
+    """
+    query_tokens = tokenize(query)
+    content_tokens = (query_tokens - NOISE_WORDS) or query_tokens
+    target_seconds = duration_ms / 1000 if duration_ms else None
+
+    scores = []
+    for index, entry in enumerate(entries):
+        if not entry:
+            continue
+
+        title_tokens = tokenize(entry.get('title'))
+        channel_tokens = tokenize(entry.get('channel') or entry.get('uploader'))
+        title_content = (title_tokens - NOISE_WORDS) or title_tokens
+
+        # Kelime kümesi benzerliği (sanatçı kanal adında da olabilir)
+        matched = content_tokens & (title_tokens | channel_tokens)
+        recall = len(matched) / len(content_tokens) if content_tokens else 0.0
+        precision = len(content_tokens & title_content) / len(title_content) if title_content else 0.0
+        text_score = 0.75 * recall + 0.25 * precision
+
+        # Süre farkı (10 sn'ye kadar tam puan, 60 sn'de sıfır)
+        duration = entry.get('duration')
+        if target_seconds and duration:
+            delta = abs(duration - target_seconds)
+            duration_score = max(0.0, 1.0 - max(0.0, delta - 10) / 50)
+            score = 0.6 * text_score + 0.4 * duration_score
+        else:
+            delta = None
+            duration_score = None
+            score = text_score
+
+        # Canlı/cover/remix gibi istenmeyen sürümler
+        unwanted = sorted((title_tokens - query_tokens) & VERSION_WORDS)
+        penalty = min(0.6, 0.3 * len(unwanted))
+        score -= penalty
+
+        # YouTube Music'in otomatik "Topic" kanalları genelde stüdyo kaydıdır
+        if 'topic' in channel_tokens:
+            score += 0.05
+
+        scores.append({
+            'index': index,
+            'entry': entry,
+            'score': round(score, 4),
+            'text_score': round(text_score, 4),
+            'duration_score': None if duration_score is None else round(duration_score, 4),
+            'duration_delta': None if delta is None else round(delta, 1),
+            'unwanted': unwanted
+        })
+
+    # Eşit puanda arama sırası korunur
+    scores.sort(key=lambda item: (-item['score'], item['index']))
+    return scores
+